@@ -0,0 +1,86 @@
+import asyncio
+from typing import List
+from fastapi import APIRouter, UploadFile, File, Form, Header
+from app.endpoints.route_validator import RouteValidator
+from app.endpoints.errors import APIException
+from app.jobs.store import job_store
+from app.jobs.worker import get_broker
+from app.services.upload import ResumeUpload
+
+router = APIRouter()
+
+@router.post("/jobs")
+async def submit_jobs(
+    resumes: List[UploadFile] = File(...),
+    callback_url: str | None = Form(default=None),
+    dedupe: bool = Form(default=False),
+    cache_control: str | None = Header(default=None),
+):
+    """
+    Queues one or many resumes for background parsing and returns a job ID per accepted file.
+    Invalid files are reported individually without failing the rest of the batch. With `dedupe`,
+    near duplicates within the batch wait for the first of their group, so they are extracted
+    from its cached and near-duplicate results instead of from scratch.
+    """
+    callback_url = await asyncio.to_thread(RouteValidator.validate_callback_url, callback_url)
+    use_cache = RouteValidator.cache_allowed(cache_control)
+    broker = get_broker()
+    jobs: list[dict] = []
+    uploads: dict[int, ResumeUpload] = {}
+    for resume in resumes:
+        try:
+            upload = await asyncio.to_thread(RouteValidator.validate_parse_resume, resume)
+        except APIException as e:
+            jobs.append({"filename": resume.filename, "job_id": None, "error": e.detail})
+            continue
+        uploads[len(jobs)] = upload
+        jobs.append({"filename": resume.filename})
+
+    try:
+        waits_for = await _batch_duplicates(uploads, use_cache) if dedupe else {}
+        job_ids: dict[int, str] = {}
+        for position, upload in uploads.items():
+            first = job_ids.get(waits_for.get(position))
+            job_ids[position] = await asyncio.to_thread(job_store.create, jobs[position]["filename"], upload, callback_url, use_cache, first)
+            jobs[position].update({"job_id": job_ids[position], "status": "queued"}, **({"waits_for": first} if first else {}))
+    finally:
+        for upload in uploads.values():
+            upload.close()
+    # Published once every held job exists, so none misses the release of the job it waits for.
+    for position, job_id in job_ids.items():
+        if position not in waits_for:
+            await asyncio.to_thread(broker.publish, job_id)
+    return {"jobs": jobs}
+
+async def _batch_duplicates(uploads: dict[int, ResumeUpload], use_cache: bool) -> dict[int, int]:
+    """
+    Maps each upload that is a near duplicate of an earlier one in the batch to that upload.
+    Chunking here is cached by file hash, so the consumers do not repeat it.
+    """
+    from app.llm.resume_parser import ResumeParser
+    from app.services.near_duplicates import index
+
+    parsers = await asyncio.gather(*(ResumeParser.create(upload, use_cache) for upload in uploads.values()), return_exceptions=True)
+    documents = {
+        str(position): list(parser.serialized_chunks.values())
+        for position, parser in zip(uploads, parsers)
+        if not isinstance(parser, BaseException)
+    }
+    groups = await asyncio.to_thread(index.dedupe, documents)
+    return {int(name): int(group[0]) for group in groups for name in group[1:]}
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Returns the status of a job, with its result once completed or its error once failed.
+    """
+    job = await asyncio.to_thread(job_store.get, job_id)
+    if job is None:
+        raise APIException(404)
+    return {
+        "job_id": job["job_id"],
+        "filename": job["filename"],
+        "status": job["status"],
+        "result": job["result"],
+        "error": job["error"],
+    }
\ No newline at end of file
@@ -1,26 +1,67 @@
 from dataclasses import dataclass
 from fastapi import UploadFile, File
-from typing import Set
+from typing import Iterator, Set
 from pypdf import PdfReader
-from docx import Document
-from app.endpoints.errors import APIException
-import io
+from app.configs.appconf import env
+from app.endpoints.errors import APIException, DOC_UNSUPPORTED
+from app.services.doc_converter import doc_converter
+from app.services.docx_reader import DocxReader
+from app.jobs.callbacks import check_callback_url
+from app.services.upload import ResumeUpload, UploadTooLarge
+from app.utils.metrics import metrics
+
+# Header of the OLE2 compound files that legacy .doc documents are stored in
+OLE2_MAGIC = bytes.fromhex("D0CF11E0A1B11AE1")
+
 
 class RouteValidator:
     allowed_extensions: Set[str] = {"pdf", "doc", "docx"}
 
     @staticmethod
-    def validate_parse_resume(resume: UploadFile = File(...)) -> UploadFile:
+    def validate_parse_resume(resume: UploadFile = File(...)) -> ResumeUpload:
         try:
-            ext = RouteValidator._extract_extension(resume)
-            RouteValidator._validate_file_type(ext)
-            RouteValidator._validate_file_content(resume, ext)
-            return resume
+            with metrics.span("validation"):
+                ext = RouteValidator._extract_extension(resume)
+                RouteValidator._validate_file_type(ext)
+                if ext == "doc" and not doc_converter.available:
+                    raise APIException(415, DOC_UNSUPPORTED)
+                upload = RouteValidator._read_file(resume, ext)
+                RouteValidator._validate_file_content(upload)
+                return upload
         except AttributeError:
             raise APIException(500)
 
+    @staticmethod
+    def resume_upload(resume: UploadFile = File(...)) -> Iterator[ResumeUpload]:
+        """
+        Dependency that validates the upload and guarantees its buffer is released after the request.
+        """
+        upload = RouteValidator.validate_parse_resume(resume)
+        try:
+            yield upload
+        finally:
+            upload.close()
+
+    @staticmethod
+    def validate_callback_url(callback_url: str | None) -> str | None:
+        if not callback_url:
+            return None
+        try:
+            check_callback_url(callback_url)
+        except ValueError as e:
+            raise APIException(422, f"Invalid Callback URL - {e}")
+        return callback_url
+
+    @staticmethod
+    def cache_allowed(cache_control: str | None) -> bool:
+        """
+        Clients opt out of cached results with `Cache-Control: no-cache` or `no-store`.
+        """
+        directives = (cache_control or "").lower()
+        return "no-cache" not in directives and "no-store" not in directives
+
     # --- Internal helpers ---
-    
+
     @staticmethod
     def _extract_extension(resume: UploadFile) -> str | None:
         filename = resume.filename.lower()
@@ -32,15 +73,26 @@ class RouteValidator:
             raise APIException(415)
 
     @staticmethod
-    def _validate_file_content(resume: UploadFile, ext: str) -> None:
+    def _read_file(resume: UploadFile, ext: str) -> ResumeUpload:
+        if resume.size is not None and resume.size > env.MAX_UPLOAD_BYTES:
+            raise APIException(413)
         try:
-            file_bytes = resume.file.read()
-            resume.file.seek(0)
+            return ResumeUpload.from_stream(resume.filename, ext, resume.file, env.MAX_UPLOAD_BYTES)
+        except UploadTooLarge:
+            raise APIException(413)
 
-            match ext:
+    @staticmethod
+    def _validate_file_content(upload: ResumeUpload) -> None:
+        try:
+            match upload.ext:
                 case "pdf":
-                    PdfReader(io.BytesIO(file_bytes))
-                case "doc" | "docx":
-                    Document(io.BytesIO(file_bytes))
+                    upload.document = PdfReader(upload.stream())
+                case "docx":
+                    upload.document = DocxReader.open(upload.stream())
+                case "doc":
+                    # Converted later by the pooled converter; only check it is an OLE2 Word file.
+                    if upload.stream().read(len(OLE2_MAGIC)) != OLE2_MAGIC:
+                        raise ValueError("Not an OLE2 document")
         except Exception:
+            upload.close()
             raise APIException(422)
\ No newline at end of file
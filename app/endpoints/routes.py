@@ -1,17 +1,49 @@
-import os
-import tempfile
-from fastapi import APIRouter, UploadFile, Depends
+import json
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
 from app.endpoints.route_validator import RouteValidator
+from app.endpoints.errors import APIException
 from app.llm.resume_parser import ResumeParser
+from app.services.upload import ResumeUpload
 
 router = APIRouter()
 
 @router.post("/parse_resume")
-async def parse_resume(resume: UploadFile = Depends(RouteValidator.validate_parse_resume)):
-    file_path = os.path.join(tempfile.gettempdir(), resume.filename)
+async def parse_resume(
+    resume: ResumeUpload = Depends(RouteValidator.resume_upload),
+    cache_control: str | None = Header(default=None),
+):
+    resume_parser = await ResumeParser.create(resume, use_cache=RouteValidator.cache_allowed(cache_control))
+    result = await resume_parser.run()
+    return result
 
-    with open(file_path, "wb") as f:
-        f.write(resume.file.read())
-    
-    result = await ResumeParser(file_path).run()
-    return result
\ No newline at end of file
+@router.post("/parse_resume/stream")
+async def parse_resume_stream(
+    resume: ResumeUpload = Depends(RouteValidator.resume_upload),
+    cache_control: str | None = Header(default=None),
+    accept: str | None = Header(default=None),
+):
+    """
+    Streams each section as soon as it is extracted, followed by the merged result.
+    Sends Server-Sent Events when the client accepts `text/event-stream`, NDJSON otherwise.
+    """
+    resume_parser = await ResumeParser.create(resume, use_cache=RouteValidator.cache_allowed(cache_control))
+    use_sse = "text/event-stream" in (accept or "")
+    return StreamingResponse(
+        _encode_events(resume_parser.stream(), use_sse),
+        media_type="text/event-stream" if use_sse else "application/x-ndjson",
+    )
+
+async def _encode_events(events: AsyncIterator[dict], use_sse: bool) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            yield _encode_event(event, use_sse)
+    except APIException as e:
+        yield _encode_event({"event": "error", "data": e.detail}, use_sse)
+
+def _encode_event(event: dict, use_sse: bool) -> str:
+    if use_sse:
+        payload = {key: value for key, value in event.items() if key != "event"}
+        return f"event: {event['event']}\ndata: {json.dumps(payload)}\n\n"
+    return json.dumps(event) + "\n"
\ No newline at end of file
@@ -0,0 +1,184 @@
+import os
+import time
+import queue
+import sqlite3
+from threading import Lock
+from dataclasses import dataclass
+from typing import Any
+from app.configs.appconf import env
+
+
+@dataclass
+class Delivery:
+    job_id: str
+    tag: Any = None
+
+
+class Broker:
+    """
+    Minimal queue interface used by the job endpoints and consumers. `consume` blocks for at
+    most `timeout` seconds and returns None when nothing is queued. While a job runs, its
+    consumer calls `extend` every `renew_interval` seconds so the delivery stays leased.
+    """
+
+    renew_interval: float = 60.0
+
+    def publish(self, job_id: str) -> None:
+        raise NotImplementedError
+
+    def consume(self, timeout: float = 1.0) -> Delivery | None:
+        raise NotImplementedError
+
+    def extend(self, delivery: Delivery) -> None:
+        pass
+
+    def ack(self, delivery: Delivery) -> None:
+        pass
+
+    def nack(self, delivery: Delivery) -> None:
+        self.publish(delivery.job_id)
+
+
+class InMemoryBroker(Broker):
+    """
+    In-process queue. Only usable when the consumers run inside the API process.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[str] = queue.Queue()
+
+    def publish(self, job_id: str) -> None:
+        self._queue.put(job_id)
+
+    def consume(self, timeout: float = 1.0) -> Delivery | None:
+        try:
+            return Delivery(self._queue.get(timeout=timeout))
+        except queue.Empty:
+            return None
+
+
+class SQLiteBroker(Broker):
+    """
+    File-backed queue shared by every process on the host; no external broker needed.
+    Deliveries that are neither acked nor extended within `visibility_timeout` seconds are
+    handed out again, so a consumer that died mid-job does not lose it.
+    """
+
+    def __init__(self, path: str, visibility_timeout: float = 900, poll_interval: float = 0.5):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.renew_interval = visibility_timeout / 3
+        self.poll_interval = poll_interval
+        self._lock = Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS queue (id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, leased_until REAL NOT NULL DEFAULT 0)"
+        )
+
+    def publish(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT INTO queue (job_id) VALUES (?)", (job_id,))
+
+    def consume(self, timeout: float = 1.0) -> Delivery | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            delivery = self._lease()
+            if delivery is not None or time.monotonic() >= deadline:
+                return delivery
+            time.sleep(self.poll_interval)
+
+    def extend(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE queue SET leased_until = ? WHERE id = ?", (time.time() + self.visibility_timeout, delivery.tag))
+
+    def ack(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM queue WHERE id = ?", (delivery.tag,))
+
+    def nack(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE queue SET leased_until = 0 WHERE id = ?", (delivery.tag,))
+
+    def _lease(self) -> Delivery | None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, job_id FROM queue WHERE leased_until < ? ORDER BY id LIMIT 1", (now,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE queue SET leased_until = ? WHERE id = ?", (now + self.visibility_timeout, row[0])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return Delivery(row[1], row[0]) if row else None
+
+
+class RabbitMQBroker(Broker):
+    """
+    RabbitMQ-backed queue for multi-host deployments. Requires the optional `pika` package
+    (`requirements-rabbitmq.txt`). Unacked deliveries stay with the channel, so `extend` only
+    services the connection's heartbeats while a job runs.
+    """
+
+    def __init__(self, url: str, queue_name: str):
+        try:
+            import pika
+        except ImportError:
+            raise RuntimeError("QUEUE_BROKER=rabbitmq needs pika: pip install -r requirements-rabbitmq.txt")
+
+        self._pika = pika
+        self.queue_name = queue_name
+        self._lock = Lock()
+        self._connection = pika.BlockingConnection(pika.URLParameters(url))
+        self._channel = self._connection.channel()
+        self._channel.queue_declare(queue=queue_name, durable=True)
+
+    def publish(self, job_id: str) -> None:
+        with self._lock:
+            self._channel.basic_publish(
+                exchange="",
+                routing_key=self.queue_name,
+                body=job_id.encode("utf-8"),
+                properties=self._pika.BasicProperties(delivery_mode=2),
+            )
+
+    def consume(self, timeout: float = 1.0) -> Delivery | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                method, _, body = self._channel.basic_get(queue=self.queue_name)
+            if method is not None:
+                return Delivery(body.decode("utf-8"), method.delivery_tag)
+            if time.monotonic() >= deadline:
+                return None
+            with self._lock:
+                self._connection.sleep(0.5)
+
+    def extend(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._connection.process_data_events(time_limit=0)
+
+    def ack(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._channel.basic_ack(delivery_tag=delivery.tag)
+
+    def nack(self, delivery: Delivery) -> None:
+        with self._lock:
+            self._channel.basic_nack(delivery_tag=delivery.tag, requeue=True)
+
+
+def create_broker() -> Broker:
+    match env.QUEUE_BROKER:
+        case "memory":
+            return InMemoryBroker()
+        case "rabbitmq":
+            return RabbitMQBroker(env.RABBITMQ_URL, env.RABBITMQ_QUEUE)
+        case _:
+            return SQLiteBroker(os.path.join(env.JOB_DIR, "queue.sqlite3"), env.JOB_VISIBILITY_TIMEOUT)
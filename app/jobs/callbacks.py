@@ -0,0 +1,52 @@
+import json
+import socket
+import ipaddress
+import urllib.request
+from urllib.parse import urlsplit
+from app.configs.appconf import env
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # A redirect could point the POST at an address the URL check never saw.
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_opener = urllib.request.build_opener(_NoRedirect)
+
+
+def check_callback_url(url: str) -> None:
+    """
+    Raises ValueError unless `url` is http(s) and its host is on `JOB_CALLBACK_ALLOWED_HOSTS`
+    or, without an allow-list, resolves only to public addresses. Stops callers from making the
+    server POST to loopback, private or link-local (cloud metadata) addresses.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("callback_url must be an http(s) URL")
+    host = parts.hostname.lower()
+    allowed = {entry.strip().lower() for entry in env.JOB_CALLBACK_ALLOWED_HOSTS.split(",") if entry.strip()}
+    if allowed:
+        if host not in allowed:
+            raise ValueError("callback_url host is not allowed")
+        return
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parts.port or None, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError):
+        raise ValueError("callback_url host does not resolve")
+    for address in addresses:
+        if not ipaddress.ip_address(address.split("%", 1)[0]).is_global:
+            raise ValueError("callback_url must not point to a private, loopback or link-local address")
+
+
+def send_callback(url: str, payload: dict) -> None:
+    # Checked again at send time: the host may resolve differently than when the job was submitted.
+    check_callback_url(url)
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with _opener.open(request, timeout=env.JOB_CALLBACK_TIMEOUT):
+        pass
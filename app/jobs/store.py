@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+from threading import Lock
+from app.configs.appconf import env
+from app.services.upload import ResumeUpload
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class JobStore:
+    """
+    SQLite-backed job records and results, shared by the API and the consumer processes.
+    A job that `waits_for` another is held back from the broker until that job finishes.
+    """
+
+    COLUMNS = ("job_id", "status", "filename", "file_path", "callback_url", "use_cache", "result", "error", "waits_for", "created_at", "updated_at")
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.files_dir = os.path.join(directory, "files")
+        self._lock = Lock()
+        os.makedirs(self.files_dir, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(directory, "jobs.sqlite3"), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                callback_url TEXT,
+                use_cache INTEGER NOT NULL DEFAULT 1,
+                result TEXT,
+                error TEXT,
+                waits_for TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        if "waits_for" not in {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN waits_for TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_waits_for ON jobs (waits_for)")
+        self._conn.commit()
+
+    def create(self, filename: str, upload: ResumeUpload, callback_url: str | None, use_cache: bool, waits_for: str | None = None) -> str:
+        job_id = uuid.uuid4().hex
+        ext = os.path.splitext(filename)[-1].lower()
+        file_path = os.path.join(self.files_dir, f"{job_id}{ext}")
+        upload.save(file_path)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, filename, file_path, callback_url, use_cache, waits_for, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, filename, file_path, callback_url, int(use_cache), waits_for, now, now),
+            )
+            self._conn.commit()
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(self.COLUMNS, row))
+        job["use_cache"] = bool(job["use_cache"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["error"] = json.loads(job["error"]) if job["error"] else None
+        return job
+
+    def update(self, job_id: str, status: str, result: dict | None = None, error: dict | None = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    json.dumps(error) if error is not None else None,
+                    time.time(),
+                    job_id,
+                ),
+            )
+            self._conn.commit()
+
+    def release(self, job_id: str) -> list[str]:
+        """
+        Clears `waits_for` on the jobs held back by `job_id` and returns their IDs for publishing.
+        """
+        with self._lock:
+            waiting = [row[0] for row in self._conn.execute("SELECT job_id FROM jobs WHERE waits_for = ? ORDER BY created_at", (job_id,))]
+            self._conn.execute("UPDATE jobs SET waits_for = NULL WHERE waits_for = ?", (job_id,))
+            self._conn.commit()
+        return waiting
+
+    def remove_file(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job and os.path.exists(job["file_path"]):
+            os.remove(job["file_path"])
+
+
+job_store = JobStore(env.JOB_DIR)
@@ -0,0 +1,124 @@
+import asyncio
+from functools import lru_cache
+from typing import Callable
+from fastapi import HTTPException
+from app.jobs.broker import Broker, Delivery, create_broker
+from app.jobs.callbacks import send_callback
+from app.jobs.store import JobStore, job_store, RUNNING, COMPLETED, FAILED
+from app.endpoints.errors import APIException
+from app.services.upload import ResumeUpload
+from app.utils.logs import log
+
+
+@lru_cache(maxsize=1)
+def get_broker() -> Broker:
+    return create_broker()
+
+
+class JobWorker:
+    """
+    Pulls job IDs from the broker, runs `ResumeParser` on the spooled file, stores the result
+    and fires the optional webhook callback.
+    """
+
+    def __init__(self, broker: Broker, store: JobStore):
+        self.broker = broker
+        self.store = store
+        self._stopped = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run_forever(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                delivery = await asyncio.to_thread(self.broker.consume, 1.0)
+            except Exception as e:
+                log.error(f"Could not consume from the broker: {str(e)}")
+                await asyncio.sleep(1.0)
+                continue
+            if delivery is None:
+                continue
+            renewal = asyncio.create_task(self._keep_leased(delivery))
+            try:
+                await self.process(delivery.job_id)
+            except asyncio.CancelledError:
+                await asyncio.to_thread(self.broker.nack, delivery)
+                raise
+            except Exception as e:
+                # The job store failed before the outcome was recorded; another attempt picks the job up.
+                log.error(f"Job {delivery.job_id} could not be processed, requeueing: {str(e)}")
+                await self._settle(self.broker.nack, delivery)
+            else:
+                await self._settle(self.broker.ack, delivery)
+            finally:
+                renewal.cancel()
+
+    @staticmethod
+    async def _settle(settle: Callable[[Delivery], None], delivery: Delivery) -> None:
+        try:
+            await asyncio.to_thread(settle, delivery)
+        except Exception as e:
+            log.error(f"Could not {settle.__name__} job {delivery.job_id}: {str(e)}")
+
+    async def _keep_leased(self, delivery: Delivery) -> None:
+        # A job can outlive the broker's visibility timeout; renew it until the job is acked.
+        while True:
+            await asyncio.sleep(self.broker.renew_interval)
+            try:
+                await asyncio.to_thread(self.broker.extend, delivery)
+            except Exception as e:
+                log.warning(f"Could not extend the lease of job {delivery.job_id}: {str(e)}")
+
+    async def process(self, job_id: str) -> None:
+        """
+        Parses one job and records its outcome. Job store errors propagate, so the delivery is
+        requeued and the spooled file kept until an outcome is stored.
+        """
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            log.warning(f"Dropping unknown job {job_id}")
+            return
+
+        if job["status"] in (COMPLETED, FAILED):
+            # Redelivered after the outcome was stored; only the follow-up steps are left.
+            outcome = ("result", job["result"]) if job["status"] == COMPLETED else ("error", job["error"])
+            payload = {"job_id": job_id, "status": job["status"], outcome[0]: outcome[1]}
+        else:
+            payload = await self._parse(job)
+
+        # Near duplicates held back by this job now find its result in the caches.
+        for waiting in await asyncio.to_thread(self.store.release, job_id):
+            await asyncio.to_thread(self.broker.publish, waiting)
+
+        if job["callback_url"]:
+            await asyncio.to_thread(self._send_callback, job["callback_url"], payload)
+
+    async def _parse(self, job: dict) -> dict:
+        from app.llm.resume_parser import ResumeParser
+
+        job_id = job["job_id"]
+        await asyncio.to_thread(self.store.update, job_id, RUNNING)
+        try:
+            with ResumeUpload.from_path(job["file_path"], job["filename"]) as upload:
+                resume_parser = await ResumeParser.create(upload, use_cache=job["use_cache"])
+            result = await resume_parser.run()
+            status, payload = COMPLETED, {"job_id": job_id, "status": COMPLETED, "result": result}
+        except Exception as e:
+            error = e.detail if isinstance(e, HTTPException) else APIException(500).detail
+            log.error(f"Job {job_id} failed: {str(e)}")
+            status, payload = FAILED, {"job_id": job_id, "status": FAILED, "error": error}
+        await asyncio.to_thread(self.store.update, job_id, status, payload.get("result"), payload.get("error"))
+        await asyncio.to_thread(self.store.remove_file, job_id)
+        return payload
+
+    @staticmethod
+    def _send_callback(url: str, payload: dict) -> None:
+        try:
+            send_callback(url, payload)
+        except Exception as e:
+            log.error(f"Callback to {url} failed for job {payload['job_id']}: {str(e)}")
+
+
+def create_worker() -> JobWorker:
+    return JobWorker(get_broker(), job_store)
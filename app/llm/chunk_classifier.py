@@ -1,68 +1,80 @@
-import boto3
+import asyncio
+import time
 from app.configs.appconf import env
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_aws import ChatBedrock
+from app.llm.clients import bedrock
+from app.llm.limiter import limiter, is_throttle_error
 from langchain_core.output_parsers import PydanticOutputParser
 from app.llm.tools.classifier_tool import ClassifierInputSchema
+from app.llm.prompts import cached_prompt
+from app.llm.postprocessing.json_repair import parse_json
 from app.utils.logs import log
+from app.utils.metrics import metrics
 from app.endpoints.errors import APIException
 
-class ChunkClassifier:
-    def __init__(self, chunk_list: list[str]):
-        self.serialized_chunks = chunk_list
-        self.llm = self._create_llm(env.MODEL_SONNET)
-        self.parser = PydanticOutputParser(pydantic_object=ClassifierInputSchema)
+# Bump whenever the classification prompt changes so cached results are not reused.
+PROMPT_VERSION = "2"
 
-    def _create_llm(self, MODEL_ID: str):
-        return ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name="us-east-1"),
-            model_id=MODEL_ID,
-            model_kwargs={"temperature": 0.2, "max_tokens": 3000}
-        )
-    
-    def _build_prompt(self) -> ChatPromptTemplate:
-        prompt = ChatPromptTemplate.from_template(
-            """
-            You are an expert in parsing resume text into structured data.
+CLASSIFIER_PARSER = PydanticOutputParser(pydantic_object=ClassifierInputSchema)
+
+CLASSIFIER_INSTRUCTIONS = """
+You are an expert in parsing resume text into structured data.
 
-            You are given:
-            1. Multiple JSON schemas — each defines fields for a specific category (e.g., jobs, education, personal info).
-            2. A list of text chunks from a resume, labeled by Chunk ID (0, 1, 2, ...).
+You are given:
+1. Multiple JSON schemas — each defines fields for a specific category (e.g., jobs, education, personal info).
+2. A list of text chunks from a resume, labeled by Chunk ID (0, 1, 2, ...).
 
-            Your task:
-            For each schema, identify the **chunk numbers** (Chunk IDs) that contain **any relevant information** about the schema’s fields.
+Your task:
+For each schema, identify the **chunk numbers** (Chunk IDs) that contain **any relevant information** about the schema’s fields.
 
-            ### Output format
-            Return ONLY this JSON object with chunk numbers as integers:
-            {format_instructions}
+### Output format
+Return ONLY this JSON object with chunk numbers as integers:
+{format_instructions}
 
-            DO NOT return explanations or unrelated text.
+DO NOT return explanations or unrelated text.
 
-            <context>
-            {context}
-            </context>
+### Important instructions:
+- Be inclusive: include a chunk if **any part of it** (not just majority) relates to any field in a schema.
+- Some fields may be scattered — consider even short mentions or partial matches.
+- If a chunk overlaps across multiple schemas (e.g., job and project), assign it to all relevant schemas.
+- You are allowed to select the same chunk ID for multiple schemas.
+- Do not infer — only rely on explicitly stated or clearly implied text.
+- If a chunk has no relevance, skip it.
 
-            ### Important instructions:
-            - Be inclusive: include a chunk if **any part of it** (not just majority) relates to any field in a schema.
-            - Some fields may be scattered — consider even short mentions or partial matches.
-            - If a chunk overlaps across multiple schemas (e.g., job and project), assign it to all relevant schemas.
-            - You are allowed to select the same chunk ID for multiple schemas.
-            - Do not infer — only rely on explicitly stated or clearly implied text.
-            - If a chunk has no relevance, skip it.
+Your goal is to ensure **no chunk with useful data is missed**, while avoiding false positives.
+"""
 
-            Your goal is to ensure **no chunk with useful data is missed**, while avoiding false positives.
-            """
-        ).partial(format_instructions=self.parser.get_format_instructions())
-        return prompt
+# Built once: the instructions and schema form the cached prefix, the chunks follow in the human turn.
+CLASSIFIER_PROMPT = cached_prompt(
+    CLASSIFIER_INSTRUCTIONS.replace("{format_instructions}", CLASSIFIER_PARSER.get_format_instructions()),
+    "<context>\n{context}\n</context>",
+)
+
+class ChunkClassifier:
+    def __init__(self, chunk_list: list[str]):
+        self.serialized_chunks = chunk_list
+        self.llm = self._create_llm(env.MODEL_SONNET)
+
+    def _create_llm(self, MODEL_ID: str):
+        return bedrock.llm(MODEL_ID)
 
     def classify(self) -> dict:
+        # For callers outside an event loop; goes through the same limiter and metrics as `aclassify`.
+        return asyncio.run(self.aclassify())
+
+    async def aclassify(self) -> dict:
         try:
-            prompt = self._build_prompt()
-            formatted_prompt = prompt.format(context=self.serialized_chunks)
-            response = self.llm.invoke(formatted_prompt)
-            parsed_output = self.parser.parse(response.content)
-            print(f"Results: {parsed_output.model_dump()}")
-            return parsed_output.model_dump()
+            formatted_prompt = CLASSIFIER_PROMPT.format_messages(context=self.serialized_chunks)
+            started = time.perf_counter()
+            response = await limiter.run(self.llm.model_id, lambda: bedrock.ainvoke(self.llm, formatted_prompt))
+            metrics.record_llm_call(self.llm.model_id, "classification", time.perf_counter() - started, response)
+            return self._parse_response(response.content)
         except Exception as e:
             log.error(f"Error while classifying chunks: {str(e)}")
-            raise APIException(500)
\ No newline at end of file
+            raise APIException(503 if is_throttle_error(e) else 500)
+
+    def _parse_response(self, content: str) -> dict:
+        parsed = parse_json(content)
+        metrics.events_total.inc(event="json_parse", value=parsed.outcome)
+        parsed_output = ClassifierInputSchema.model_validate(parsed.value)
+        log.info(f"Classification results: {parsed_output.model_dump()}")
+        return parsed_output.model_dump()
\ No newline at end of file
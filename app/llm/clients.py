@@ -0,0 +1,91 @@
+import asyncio
+import contextvars
+from functools import partial
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from app.configs.appconf import env
+
+if TYPE_CHECKING:
+    from langchain_aws import ChatBedrock
+
+# One attempt per call: the host-wide limiter owns throttle retries, so its AIMD back-off sees
+# every ThrottlingException, and section retries and hedging cover other transient errors.
+# botocore retries underneath would multiply the attempts of each logical call.
+CLIENT_RETRIES = {"total_max_attempts": 1, "mode": "standard"}
+
+
+class BedrockRegistry:
+    """
+    Process-wide Bedrock runtime client and ChatBedrock wrappers. The client is thread-safe and
+    its connection pool is shared by the classifier and every extraction call.
+
+    ChatBedrock has no native async; its `ainvoke` borrows the loop's default executor, which is
+    sized from the CPU count and shared with every `to_thread`. Model calls run on their own pool
+    of `BEDROCK_POOL_SIZE` threads instead, one per client connection.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._llms: dict[tuple, "ChatBedrock"] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=env.BEDROCK_POOL_SIZE, thread_name_prefix="bedrock")
+            return self._executor
+
+    def start(self) -> None:
+        self.executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    async def ainvoke(self, llm, messages: list):
+        """
+        Runs the blocking `llm.invoke` on the model-call pool, keeping the caller's context.
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(context.run, llm.invoke, messages))
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                import boto3
+                from botocore.config import Config
+
+                self._client = boto3.session.Session().client(
+                    "bedrock-runtime",
+                    region_name=env.BEDROCK_REGION,
+                    config=Config(
+                        max_pool_connections=env.BEDROCK_POOL_SIZE,
+                        tcp_keepalive=True,
+                        retries=CLIENT_RETRIES,
+                    ),
+                )
+            return self._client
+
+    def llm(self, model_id: str, temperature: float = 0.2, max_tokens: int = 3000) -> "ChatBedrock":
+        key = (model_id, temperature, max_tokens)
+        llm = self._llms.get(key)
+        if llm is None:
+            from langchain_aws import ChatBedrock
+
+            client = self.client
+            with self._lock:
+                llm = self._llms.setdefault(key, ChatBedrock(
+                    client=client,
+                    model_id=model_id,
+                    model_kwargs={"temperature": temperature, "max_tokens": max_tokens}
+                ))
+        return llm
+
+
+bedrock = BedrockRegistry()
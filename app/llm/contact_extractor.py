@@ -0,0 +1,135 @@
+import re
+from dateutil import parser as date_parser
+from app.llm.postprocessing.pp import is_junk
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+LINKEDIN_PATTERN = re.compile(r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%\-]+/?", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"(?<![\w+])(?:\+(\d{1,3})[\s.\-]*)?(\(?\d{2,5}\)?(?:[\s.\-]*\d{2,5}){1,4})(?![\w])")
+YEAR_RANGE_PATTERN = re.compile(r"^(?:19|20)\d{2}\D+(?:19|20)\d{2}$")
+DOB_LABEL_PATTERN = re.compile(r"(?:date\s+of\s+birth|d\.?\s?o\.?\s?b\.?|birth\s*date)\s*[:\-–]?\s*", re.IGNORECASE)
+DATE_PATTERN = re.compile(
+    r"\d{4}-\d{1,2}-\d{1,2}"
+    r"|\d{1,2}[/.\-]\d{1,2}[/.\-]\d{2,4}"
+    r"|\d{1,2}(?:st|nd|rd|th)?[\s\-]+[A-Za-z]{3,9}[\s,\-]+\d{4}"
+    r"|[A-Za-z]{3,9}\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}"
+)
+GENDER_PATTERN = re.compile(r"\b(?:gender|sex)\s*[:\-–]?\s*(male|female|transgender|non-binary|other)\b", re.IGNORECASE)
+MARITAL_PATTERN = re.compile(r"\bmarital\s+status\s*[:\-–]?\s*(single|unmarried|married|divorced|widowed|separated)\b", re.IGNORECASE)
+NAME_TOKEN_PATTERN = re.compile(r"^[A-Z][A-Za-z'\-]*\.?$")
+NAME_STOPWORDS = {
+    "RESUME", "CURRICULUM", "VITAE", "CV", "PROFILE", "BIODATA", "BIO-DATA", "NAME", "MR", "MR.", "MS", "MS.", "MRS",
+    "MRS.", "DR", "DR.", "CONTACT", "EMAIL", "E-MAIL", "PHONE", "MOBILE", "ADDRESS", "SUMMARY", "OBJECTIVE",
+}
+ROLE_WORDS = {
+    "SOFTWARE", "DATA", "SENIOR", "JUNIOR", "LEAD", "PRINCIPAL", "ENGINEER", "DEVELOPER", "MANAGER", "ANALYST",
+    "CONSULTANT", "DESIGNER", "ARCHITECT", "INTERN", "SCIENTIST", "SPECIALIST", "ADMINISTRATOR", "EXECUTIVE",
+    "OFFICER", "ASSOCIATE", "DIRECTOR", "TESTER", "ACCOUNTANT", "PROFESSIONAL",
+}
+
+# Exact pattern matches win over the model's answer; the other fields are heuristic guesses
+# that only fill what the model left empty.
+PATTERN_FIELDS = frozenset({"primaryEmail", "linkedinUrl", "phoneNumber", "countryCode"})
+
+
+class ContactExtractor:
+    """
+    Rule-based pre-extractor for contact and personal fields. Only fields it can resolve with
+    confidence are returned; everything else is left to the LLM. The name is only taken from
+    a first line that holds nothing but the name.
+    """
+
+    def __init__(self, chunk_list: dict[int, str], first_line: str = ""):
+        self.serialized_chunks = chunk_list
+        self.text = " ".join(chunk_list.values())
+        self.first_line = first_line
+
+    def extract(self) -> dict[str, str]:
+        fields: dict[str, str] = {}
+        fields.update(self._email())
+        fields.update(self._linkedin())
+        fields.update(self._phone())
+        fields.update(self._name())
+        fields.update(self._dob())
+        fields.update(self._labelled("gender", GENDER_PATTERN))
+        fields.update(self._labelled("marriageStatus", MARITAL_PATTERN))
+        return fields
+
+    @staticmethod
+    def merge(resolved: dict[str, str], result: dict) -> dict:
+        """
+        Combines rule values with the model's answer for the same fields.
+        """
+        merged = dict(result)
+        for field, value in resolved.items():
+            current = merged.get(field)
+            if field in PATTERN_FIELDS or not isinstance(current, str) or is_junk(current) or not current.strip():
+                merged[field] = value
+        return merged
+
+    # --- Internal helpers ---
+
+    def _email(self) -> dict[str, str]:
+        match = EMAIL_PATTERN.search(self.text)
+        return {"primaryEmail": match.group(0).strip(".")} if match else {}
+
+    def _linkedin(self) -> dict[str, str]:
+        match = LINKEDIN_PATTERN.search(self.text)
+        if not match:
+            return {}
+        url = match.group(0)
+        return {"linkedinUrl": url if url.lower().startswith("http") else f"https://{url}"}
+
+    def _phone(self) -> dict[str, str]:
+        for match in PHONE_PATTERN.finditer(self.text):
+            country_code, number = match.group(1), match.group(2)
+            digits = re.sub(r"\D", "", number)
+            if YEAR_RANGE_PATTERN.match(number.strip()) or not 7 <= len(digits) <= 12:
+                continue
+            if not country_code and len(digits) < 10:
+                # Short unprefixed digit runs are more likely IDs or dates than phone numbers.
+                continue
+            fields = {"phoneNumber": digits}
+            if country_code:
+                fields["countryCode"] = f"+{country_code}"
+            return fields
+        return {}
+
+    def _name(self) -> dict[str, str]:
+        tokens = []
+        for token in self.first_line.replace("|", " ").replace(",", " ").split():
+            if token.upper() in NAME_STOPWORDS or token.endswith(":"):
+                # Labels may precede the name ("Resume", "Name:"), nothing may follow it.
+                if tokens:
+                    return {}
+                continue
+            if not NAME_TOKEN_PATTERN.match(token) or token.upper() in ROLE_WORDS:
+                return {}
+            tokens.append(token.rstrip(".").title() if token.isupper() else token.rstrip("."))
+
+        # One word is not enough to split a name, and more than three is probably not just a name.
+        if not 2 <= len(tokens) <= 3:
+            return {}
+        return {
+            "firstName": tokens[0],
+            "middleName": " ".join(tokens[1:-1]),
+            "lastName": tokens[-1],
+        }
+
+    def _dob(self) -> dict[str, str]:
+        label = DOB_LABEL_PATTERN.search(self.text)
+        if not label:
+            return {}
+        match = DATE_PATTERN.match(self.text, label.end())
+        if not match:
+            return {}
+        value = match.group(0)
+        try:
+            # Numeric dates on resumes are day-first unless written year-first (ISO).
+            dayfirst = not re.match(r"\d{4}-", value)
+            return {"dob": date_parser.parse(value, dayfirst=dayfirst).strftime("%Y-%m-%d")}
+        except (ValueError, OverflowError):
+            return {}
+
+    def _labelled(self, field: str, pattern: re.Pattern) -> dict[str, str]:
+        match = pattern.search(self.text)
+        return {field: match.group(1).title()} if match else {}
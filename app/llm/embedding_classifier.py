@@ -0,0 +1,128 @@
+import asyncio
+import numpy as np
+from functools import lru_cache
+from app.configs.appconf import env
+from app.llm.tools.classifier_tool import ClassifierInputSchema
+from app.llm.chunk_classifier import ChunkClassifier
+from app.utils.logs import log
+
+SECTIONS = list(ClassifierInputSchema.model_fields)
+
+# Short descriptions of what each section usually looks like in a resume. Every phrase
+# becomes one prototype vector; a chunk's section score is its best prototype match.
+SECTION_PROTOTYPES = {
+    "PersonalInfo": [
+        "Name, email address, phone number and LinkedIn profile of the candidate",
+        "Contact details: mobile number, e-mail, address, city and state",
+        "Personal details: date of birth, gender, marital status, nationality, native place",
+    ],
+    "EducationDetails": [
+        "Education: bachelor's or master's degree from a university or college with year of passing",
+        "Academic qualifications: B.Tech, M.Tech, MBA, BSc, diploma, CGPA, percentage, grade",
+        "Schooling and higher secondary certificate, board, marks obtained",
+    ],
+    "ProjectDetails": [
+        "Projects: project title, client, role, description of the project and technologies used",
+        "Worked on a project to build an application, responsibilities and tech stack in the project",
+        "Academic or personal project with objectives, implementation details and outcome",
+    ],
+    "JobDetails": [
+        "Work experience: company name, designation, employment dates from and to, location",
+        "Employment history: worked as software engineer at a company, reporting to a manager",
+        "Professional experience with job title, employer, duration and responsibilities in the role",
+    ],
+    "ProfessionalInfo": [
+        "Professional summary and career objective with total years of experience",
+        "Technical skills: programming languages, frameworks, tools, databases and cloud platforms",
+        "Key skills, core competencies, certifications and notice period",
+    ],
+}
+
+# Minimum cosine similarity for a chunk to be routed to a section. Chunks are routed to
+# every section that clears its threshold, mirroring the inclusive LLM classifier.
+SECTION_THRESHOLDS = {
+    "PersonalInfo": 0.30,
+    "EducationDetails": 0.35,
+    "ProjectDetails": 0.35,
+    "JobDetails": 0.35,
+    "ProfessionalInfo": 0.30,
+}
+
+
+@lru_cache(maxsize=1)
+def get_embedding_function():
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name=env.EMBEDDING_MODEL)
+
+
+@lru_cache(maxsize=1)
+def get_prototype_matrix() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Embeds every prototype once per process. Returns the row-normalised prototype matrix
+    and, for each section, the column offset where its prototypes start.
+    """
+    phrases, offsets = [], []
+    for section in SECTIONS:
+        offsets.append(len(phrases))
+        phrases.extend(SECTION_PROTOTYPES[section])
+    matrix = _normalise(np.asarray(get_embedding_function().embed_documents(phrases), dtype=np.float32))
+    return matrix, np.asarray(offsets)
+
+
+def _normalise(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.clip(norms, 1e-12, None)
+
+
+class EmbeddingClassifier:
+    def __init__(self, chunk_list: dict[int, str]):
+        self.serialized_chunks = chunk_list
+        self.thresholds = np.asarray([SECTION_THRESHOLDS[section] for section in SECTIONS], dtype=np.float32)
+
+    def scores(self) -> np.ndarray:
+        """
+        Returns a (chunks x sections) matrix of cosine similarities.
+        """
+        chunk_ids = list(self.serialized_chunks)
+        if not chunk_ids:
+            return np.zeros((0, len(SECTIONS)), dtype=np.float32)
+        prototypes, offsets = get_prototype_matrix()
+        texts = [self.serialized_chunks[chunk_id] for chunk_id in chunk_ids]
+        chunks = _normalise(np.asarray(get_embedding_function().embed_documents(texts), dtype=np.float32))
+        similarity = chunks @ prototypes.T
+        return np.maximum.reduceat(similarity, offsets, axis=1)
+
+    def classify_with_confidence(self) -> tuple[dict, bool]:
+        """
+        Returns the classification and whether every chunk was routed with enough confidence.
+        """
+        scores = self.scores()
+        chunk_ids = np.asarray(list(self.serialized_chunks), dtype=int)
+        assigned = scores >= self.thresholds
+        if len(chunk_ids):
+            # Every chunk goes at least to its best section, like the inclusive LLM prompt.
+            assigned[np.arange(len(chunk_ids)), scores.argmax(axis=1)] = True
+        confident = bool(len(chunk_ids) == 0 or scores.max(axis=1).min() >= env.EMBEDDING_MIN_CONFIDENCE)
+
+        result = {
+            section: chunk_ids[assigned[:, col]].tolist()
+            for col, section in enumerate(SECTIONS)
+        }
+        return ClassifierInputSchema(**result).model_dump(), confident
+
+    def classify(self) -> dict:
+        return self.classify_with_confidence()[0]
+
+    async def aclassify(self) -> dict:
+        """
+        Classifies locally and falls back to the LLM classifier only when confidence is low.
+        """
+        try:
+            result, confident = await asyncio.to_thread(self.classify_with_confidence)
+            if confident:
+                return result
+            log.info("Embedding classifier confidence below threshold, falling back to LLM classifier")
+        except Exception as e:
+            log.error(f"Error while classifying chunks with embeddings: {str(e)}")
+        classifier = await asyncio.to_thread(ChunkClassifier, self.serialized_chunks)
+        return await classifier.aclassify()
@@ -0,0 +1,45 @@
+import math
+from dataclasses import dataclass
+from app.configs.appconf import env
+
+SINGLE = "single"
+BROADCAST = "broadcast"
+FANOUT = "fanout"
+STRATEGIES = (SINGLE, BROADCAST, FANOUT)
+
+# Rough English average for Claude tokenizers; only used to compare against the thresholds.
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class ExtractionPlan:
+    strategy: str
+    resume_tokens: int
+    reason: str
+
+
+class ExtractionPlanner:
+    """
+    Picks how a resume is sent to the model from its estimated size:
+
+    - single: one call with the combined schema, for resumes smaller than the per-call prompt overhead.
+    - broadcast: no classification, every section call gets all chunks.
+    - fanout: classify chunks (or use the segmenter's sections), then one call per section with its chunks.
+    """
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+    @staticmethod
+    def plan(chunks: dict[int, str], segmented: bool) -> ExtractionPlan:
+        resume_tokens = sum(ExtractionPlanner.estimate_tokens(chunk) for chunk in chunks.values())
+        if env.EXTRACTION_STRATEGY in STRATEGIES:
+            return ExtractionPlan(env.EXTRACTION_STRATEGY, resume_tokens, "forced by EXTRACTION_STRATEGY")
+        if resume_tokens <= env.PLANNER_SINGLE_MAX_TOKENS:
+            return ExtractionPlan(SINGLE, resume_tokens, f"<= {env.PLANNER_SINGLE_MAX_TOKENS} tokens")
+        if segmented:
+            return ExtractionPlan(FANOUT, resume_tokens, "segmenter already routed the sections")
+        if resume_tokens <= env.PLANNER_BROADCAST_MAX_TOKENS:
+            return ExtractionPlan(BROADCAST, resume_tokens, f"<= {env.PLANNER_BROADCAST_MAX_TOKENS} tokens")
+        return ExtractionPlan(FANOUT, resume_tokens, f"> {env.PLANNER_BROADCAST_MAX_TOKENS} tokens")
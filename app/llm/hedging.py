@@ -0,0 +1,93 @@
+import time
+import asyncio
+from collections import deque
+from threading import Lock
+from typing import Awaitable, Callable, TypeVar
+from app.configs.appconf import env
+from app.llm.limiter import is_throttle_error
+from app.utils.logs import log
+from app.utils.metrics import metrics
+
+T = TypeVar("T")
+
+WINDOW = 200
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent successful call latencies per key (model and section).
+    """
+
+    def __init__(self, window: int = WINDOW):
+        self.window = window
+        self.samples: dict[str, deque] = {}
+        self._lock = Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self.samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, key: str, pct: float) -> float | None:
+        with self._lock:
+            samples = sorted(self.samples.get(key, ()))
+        if len(samples) < env.HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(int(len(samples) * pct / 100), len(samples) - 1)]
+
+
+class HedgedCaller:
+    """
+    Runs a call under a deadline and, when it is slower than the tracked latency percentile,
+    fires one backup request. The first attempt that returns without raising wins and the
+    other is cancelled. Attempts are expected to validate their own output, so a malformed
+    response loses to a slower well-formed one.
+    """
+
+    def __init__(self):
+        self.latencies = LatencyTracker()
+
+    def hedge_delay(self, key: str) -> float:
+        threshold = self.latencies.percentile(key, env.HEDGE_PERCENTILE)
+        return threshold if threshold is not None else env.HEDGE_DEFAULT_DELAY_SECONDS
+
+    async def call(self, key: str, attempt: Callable[[], Awaitable[T]], timeout: float) -> T:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        hedge_at = loop.time() + self.hedge_delay(key) if env.HEDGE_ENABLED else None
+        primary = asyncio.ensure_future(self._timed(key, attempt))
+        pending = {primary}
+        error: BaseException | None = None
+        try:
+            while pending:
+                wake_at = min(deadline, hedge_at) if hedge_at is not None else deadline
+                done, pending = await asyncio.wait(pending, timeout=max(wake_at - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            metrics.events_total.inc(event="hedge", value="won")
+                        return task.result()
+                    error = task.exception()
+                if error is not None and is_throttle_error(error):
+                    # The limiter already retried; a backup would only add load.
+                    raise error
+                if loop.time() >= deadline:
+                    raise TimeoutError(f"{key} exceeded {timeout:.1f}s")
+                if hedge_at is not None and (loop.time() >= hedge_at or not pending):
+                    # Slow past the threshold, or the first attempt already failed: one backup request.
+                    hedge_at = None
+                    metrics.events_total.inc(event="hedge", value="fired")
+                    log.info(f"Hedging {key} with a backup request")
+                    pending.add(asyncio.ensure_future(self._timed(key, attempt)))
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed(self, key: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await attempt()
+        self.latencies.record(key, time.perf_counter() - started)
+        return result
+
+
+hedger = HedgedCaller()
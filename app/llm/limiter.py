@@ -0,0 +1,167 @@
+import os
+import json
+import time
+import fcntl
+import random
+import asyncio
+import tempfile
+from threading import Lock
+from typing import Awaitable, Callable, TypeVar
+from app.configs.appconf import env
+from app.utils.logs import log
+from app.utils.metrics import metrics
+
+T = TypeVar("T")
+
+THROTTLE_MARKERS = ("ThrottlingException", "TooManyRequestsException", "Too many requests", "Rate exceeded")
+
+
+def is_throttle_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    code = response.get("Error", {}).get("Code", "") if isinstance(response, dict) else ""
+    return code in THROTTLE_MARKERS or any(marker in str(error) for marker in THROTTLE_MARKERS)
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose state lives in a small JSON file guarded by `flock`, so every uvicorn
+    worker and consumer on the host draws from the same budget. The refill rate adapts AIMD
+    style: halved on throttling, raised by a fixed step on success, bounded by `max_rate`.
+    """
+
+    def __init__(self, path: str, max_rate: float, burst: int):
+        self.path = path
+        self.max_rate = max_rate
+        self.min_rate = max_rate * env.LIMITER_MIN_RATE_FACTOR
+        self.burst = burst
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def try_acquire(self) -> float:
+        """
+        Takes a token if one is available and returns 0, otherwise returns the seconds to wait.
+        """
+        with self._state() as state:
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0.0
+            return (1 - state["tokens"]) / state["rate"]
+
+    def on_success(self) -> None:
+        with self._state() as state:
+            state["rate"] = min(self.max_rate, state["rate"] + self.max_rate * env.LIMITER_INCREASE_STEP)
+
+    def on_throttle(self) -> None:
+        with self._state() as state:
+            # Concurrent callers see the same throttling burst; only back off once per second.
+            if state["now"] - state.get("decreased_at", 0) >= 1.0:
+                state["rate"] = max(self.min_rate, state["rate"] * env.LIMITER_DECREASE_FACTOR)
+                state["decreased_at"] = state["now"]
+            state["tokens"] = 0.0
+
+    def snapshot(self) -> dict:
+        with self._state() as state:
+            return {"rate": round(state["rate"], 4), "tokens": round(state["tokens"], 4)}
+
+    def _state(self):
+        return _LockedState(self)
+
+
+class _LockedState:
+    def __init__(self, bucket: FileTokenBucket):
+        self.bucket = bucket
+
+    def __enter__(self) -> dict:
+        self.file = open(self.bucket.path, "a+")
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+        self.file.seek(0)
+        try:
+            self.state = json.loads(self.file.read() or "{}")
+        except ValueError:
+            self.state = {}
+        now = time.time()
+        rate = self.state.get("rate", self.bucket.max_rate)
+        tokens = self.state.get("tokens", float(self.bucket.burst))
+        elapsed = max(0.0, now - self.state.get("updated_at", now))
+        self.state.update(rate=rate, tokens=min(float(self.bucket.burst), tokens + elapsed * rate), updated_at=now, now=now)
+        return self.state
+
+    def __exit__(self, *exc) -> None:
+        try:
+            self.state.pop("now", None)
+            self.file.seek(0)
+            self.file.truncate()
+            self.file.write(json.dumps(self.state))
+            self.file.flush()
+        finally:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+            self.file.close()
+
+
+class BedrockLimiter:
+    """
+    Wraps every model invocation: waits for a token from the model's bucket, retries throttled
+    calls with jittered backoff and records how long calls queued.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.buckets: dict[str, FileTokenBucket] = {}
+        self.stats: dict[str, dict] = {}
+        self._lock = Lock()
+
+    def bucket(self, model_id: str) -> FileTokenBucket:
+        with self._lock:
+            if model_id not in self.buckets:
+                name = "".join(ch if ch.isalnum() else "_" for ch in model_id)
+                self.buckets[model_id] = FileTokenBucket(
+                    os.path.join(self.directory, f"{name}.json"), self._max_rate(model_id), env.BEDROCK_BURST
+                )
+                self.stats[model_id] = {"calls": 0, "throttled": 0, "queue_seconds_total": 0.0, "queue_seconds_max": 0.0}
+            return self.buckets[model_id]
+
+    async def run(self, model_id: str, call: Callable[[], Awaitable[T]]) -> T:
+        bucket = self.bucket(model_id)
+        for attempt in range(env.LIMITER_MAX_RETRIES + 1):
+            await self._acquire(model_id, bucket)
+            try:
+                result = await call()
+            except Exception as e:
+                if not is_throttle_error(e):
+                    raise
+                self.stats[model_id]["throttled"] += 1
+                metrics.llm_throttled_total.inc(model=model_id)
+                await asyncio.to_thread(bucket.on_throttle)
+                if attempt == env.LIMITER_MAX_RETRIES:
+                    raise
+                log.warning(f"Bedrock throttled {model_id}, retry {attempt + 1}/{env.LIMITER_MAX_RETRIES}")
+                await asyncio.sleep(random.uniform(0, min(8.0, 0.5 * 2 ** attempt)))
+                continue
+            await asyncio.to_thread(bucket.on_success)
+            return result
+
+    async def _acquire(self, model_id: str, bucket: FileTokenBucket) -> None:
+        started = time.monotonic()
+        while (wait := await asyncio.to_thread(bucket.try_acquire)) > 0:
+            await asyncio.sleep(wait)
+        waited = time.monotonic() - started
+        stats = self.stats[model_id]
+        stats["calls"] += 1
+        stats["queue_seconds_total"] += waited
+        stats["queue_seconds_max"] = max(stats["queue_seconds_max"], waited)
+        metrics.llm_queue_seconds.observe(waited, model=model_id)
+
+    @staticmethod
+    def _max_rate(model_id: str) -> float:
+        if model_id == env.MODEL_SONNET:
+            return env.BEDROCK_RPS_SONNET
+        if model_id == env.MODEL_HAIKU:
+            return env.BEDROCK_RPS_HAIKU
+        return env.BEDROCK_RPS_DEFAULT
+
+
+def _default_state_dir() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "resume_parser_limiter")
+
+
+limiter = BedrockLimiter(env.LIMITER_STATE_DIR or _default_state_dir())
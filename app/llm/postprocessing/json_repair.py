@@ -0,0 +1,113 @@
+import re
+import json
+from dataclasses import dataclass
+from typing import Any
+
+FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+CLOSERS = {"{": "}", "[": "]"}
+
+CLEAN = "clean"
+REPAIRED = "repaired"
+SALVAGED = "salvaged"
+
+
+@dataclass
+class RepairResult:
+    value: Any
+    outcome: str
+    text: str
+
+    @property
+    def truncated(self) -> bool:
+        """
+        True when the output stopped mid-document; `value` then holds only the complete elements
+        and `text` is the cleaned prefix a continuation can resume from.
+        """
+        return self.outcome == SALVAGED
+
+
+def parse_json(raw: str) -> RepairResult:
+    """
+    Parses model output that should be a single JSON document. Strips code fences and
+    surrounding prose, drops trailing commas, and salvages the complete elements of output
+    truncated at `max_tokens`. Raises ValueError when nothing usable is left.
+    """
+    try:
+        return RepairResult(json.loads(raw), CLEAN, raw)
+    except ValueError:
+        pass
+
+    text = _remove_trailing_commas(_strip_wrappers(raw))
+    try:
+        value, end = json.JSONDecoder().raw_decode(text)
+        return RepairResult(value, REPAIRED, text[:end])
+    except ValueError:
+        pass
+
+    value = _salvage(text)
+    if value is None:
+        raise ValueError("Model output is not recoverable JSON")
+    return RepairResult(value, SALVAGED, text)
+
+
+def _strip_wrappers(raw: str) -> str:
+    fenced = FENCE_PATTERN.search(raw)
+    text = fenced.group(1) if fenced else raw
+    starts = [idx for idx in (text.find("{"), text.find("[")) if idx >= 0]
+    return text[min(starts):] if starts else text.strip()
+
+
+def _remove_trailing_commas(text: str) -> str:
+    out, in_string, escape = [], False, False
+    for idx, ch in enumerate(text):
+        if in_string:
+            escape = ch == "\\" and not escape
+            in_string = ch != '"' or escape
+        elif ch == '"':
+            in_string = True
+        elif ch == ",":
+            rest = text[idx + 1:].lstrip()
+            if rest[:1] in ("}", "]"):
+                continue
+        out.append(ch)
+    return "".join(out)
+
+
+def _salvage(text: str) -> Any | None:
+    """
+    Cuts truncated JSON back to the last point where no array element was left half-written
+    (after an opening bracket, a closed value or before a separating comma) and closes what is
+    still open. Returns None when the text is not a truncated document.
+    """
+    stack: list[str] = []
+    # Containers that are themselves array elements; cutting inside one would keep a partial element.
+    elements: list[bool] = []
+    in_string, escape = False, False
+    cut: tuple[int, str] | None = None
+    for idx, ch in enumerate(text):
+        if in_string:
+            escape = ch == "\\" and not escape
+            in_string = ch != '"' or escape
+            continue
+        if ch == '"':
+            in_string = True
+            continue
+        if ch in CLOSERS:
+            elements.append(bool(stack) and stack[-1] == "[")
+            stack.append(ch)
+        elif ch in ("}", "]"):
+            if not stack or CLOSERS[stack.pop()] != ch or not stack:
+                return None
+            elements.pop()
+        elif ch != ",":
+            continue
+        if not any(elements):
+            cut = (idx if ch == "," else idx + 1, "".join(stack))
+
+    if not stack or cut is None:
+        return None
+    end, still_open = cut
+    try:
+        return json.loads(text[:end] + "".join(CLOSERS[ch] for ch in reversed(still_open)))
+    except ValueError:
+        return None
@@ -1,39 +1,65 @@
 import re
-from typing import List, Optional
+import calendar
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Dict, List, Optional
 from dateutil import parser
-from pydantic import BaseModel, Field, EmailStr, model_validator, field_validator
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter, model_validator, field_validator
+
+JUNK_VALUES = frozenset({
+    "NONE", "NULL", "NAN", "UNKNOWN", "<UNKNOWN>",
+    "N/A", "NA", "N.A", "NONE.", "UNDEFINED", "?", "--", "NOT PROVIDED", "NOT SPECIFIED", "NOT AVAILABLE",
+    "NOT MENTIONED", "NOT APPLICABLE", "NOT GIVEN", "NO DATA", "NO INFORMATION", "NO DETAILS", "NO ANSWER",
+})
+ISO_DATE_PATTERN = re.compile(r"\s*(\d{4})-(\d{2})(?:-(\d{2}))?\s*")
+NON_DIGITS = re.compile(r"\D")
+
+
+@lru_cache(maxsize=4096)
+def is_junk(value: str) -> bool:
+    return value.strip().upper() in JUNK_VALUES
+
+
+@lru_cache(maxsize=4096)
+def normalize_date(value: str, today: date) -> str:
+    """
+    Formats a date as YYYY-MM-DD, or "" when it cannot be parsed. Parts missing from the value are
+    taken from `today`, as `dateutil` does, which is why `today` is part of the cache key.
+    `YYYY-MM` and `YYYY-MM-DD` values skip the fuzzy parser.
+    """
+    match = ISO_DATE_PATTERN.fullmatch(value)
+    if match:
+        year, month, day = int(match[1]), int(match[2]), match[3]
+        if year >= 1000 and 1 <= month <= 12:
+            days_in_month = calendar.monthrange(year, month)[1]
+            day = int(day) if day else min(today.day, days_in_month)
+            if 1 <= day <= days_in_month:
+                return f"{year:04d}-{month:02d}-{day:02d}"
+    try:
+        return parser.parse(value, default=datetime.combine(today, time.min)).strftime("%Y-%m-%d")
+    except (ValueError, OverflowError):
+        return ""
 
 
 class CleanBaseModel(BaseModel):
     @model_validator(mode="before")
     def sanitize_values(cls, values):
-        junks = {
-            "NONE", "NULL", "NAN", "UNKNOWN", "<UNKNOWN>",
-            "N/A", "NA", "N.A", "NONE.", "UNDEFINED", "?", "--", "NOT PROVIDED", "NOT SPECIFIED", "NOT AVAILABLE",
-            "NOT MENTIONED", "NOT APPLICABLE", "NOT GIVEN", "NO DATA", "NO INFORMATION", "NO DETAILS", "NO ANSWER",
-        }
-
-        def sanitize(val):
-            if val is None:
-                return ""
-            if isinstance(val, str) and val.strip().upper() in junks:
-                return ""
-            return val
-
         if isinstance(values, dict):
-            return {key: sanitize(value) for key, value in values.items()}
+            return {
+                key: "" if value is None or (isinstance(value, str) and is_junk(value)) else value
+                for key, value in values.items()
+            }
         return values
 
     @field_validator("fromDate", "toDate", "dob", mode="before", check_fields=False)
     def format_date(cls, value):
-        try:
-            return parser.parse(value).strftime("%Y-%m-%d")
-        except Exception:
+        if not isinstance(value, str) or not value.strip():
             return ""
+        return normalize_date(value, date.today())
 
     @field_validator("phoneNumber", mode="before", check_fields=False)
     def extract_digits_only(cls, value):
-        return re.sub(r'\D', '', value or "")
+        return NON_DIGITS.sub("", value or "")
 
 
 class JobDetails(CleanBaseModel):
@@ -91,6 +117,7 @@ class ResumeDetails(CleanBaseModel):
     skills: Optional[List[str]] = []
     noticePeriod: Optional[str] = ""
     summary: Optional[str] = ""
+    sectionStatus: Optional[Dict[str, str]] = {}
 
     @model_validator(mode="before")
     def clean_empty_lists(cls, values):
@@ -99,6 +126,14 @@ class ResumeDetails(CleanBaseModel):
                 values[field] = [item for item in values[field] if item]
         return values
 
+    @model_validator(mode="after")
+    def latest_designation_from_jobs(self):
+        # Set when the personal section was resolved by rules alone, without the model.
+        if not self.latestJobDesignation and self.jobs:
+            latest = max(self.jobs, key=lambda job: (bool(job.isCurrentlyWorking), job.toDate or "", job.fromDate or ""))
+            self.latestJobDesignation = latest.designation or ""
+        return self
+
     @field_validator("email", mode="before", check_fields=False)
     def validate_email(cls, value):
         if not value or not isinstance(value, str) or '@' not in value:
@@ -107,4 +142,34 @@ class ResumeDetails(CleanBaseModel):
             EmailStr.validate(value)
             return value
         except Exception:
-            return ""
\ No newline at end of file
+            return ""
+
+
+SECTION_LIST_MODELS = {
+    "JobDetails": ("jobs", JobDetails),
+    "ProjectDetails": ("projects", ProjectDetails),
+    "EducationDetails": ("education", EducationDetails),
+}
+# Built once: validating a list through an adapter skips the per-item model call overhead.
+SECTION_LIST_ADAPTERS = {section: TypeAdapter(List[model]) for section, (_, model) in SECTION_LIST_MODELS.items()}
+RESUME_LIST_ADAPTER = TypeAdapter(List[ResumeDetails])
+
+
+def validate_section(section: str, payload: dict) -> dict:
+    """
+    Validates a single section's LLM output through the matching model, returning only its own fields.
+    """
+    if section in SECTION_LIST_MODELS:
+        field, _ = SECTION_LIST_MODELS[section]
+        items = SECTION_LIST_ADAPTERS[section].validate_python([item for item in payload.get(field) or [] if item])
+        return {field: [item.model_dump() for item in items]}
+    fields = set(payload) & set(ResumeDetails.model_fields)
+    return ResumeDetails(**{key: payload[key] for key in fields}).model_dump(include=fields)
+
+
+def validate_many(payloads: list[dict]) -> list[dict]:
+    """
+    Validates many merged resume payloads in one pass, for batch imports and re-validation of
+    stored results. Raises `ValidationError` naming the index of any invalid payload.
+    """
+    return RESUME_LIST_ADAPTER.dump_python(RESUME_LIST_ADAPTER.validate_python(payloads))
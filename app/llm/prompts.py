@@ -0,0 +1,17 @@
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+# Anthropic cache checkpoint: everything up to and including the marked block is cached by Bedrock.
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def cached_prompt(static_text: str, human_template: str) -> ChatPromptTemplate:
+    """
+    Puts the static instructions and schema first, as a system block marked for prompt caching,
+    and the per-request part in the human turn. The system text is used verbatim, so schema
+    braces need no escaping; only `human_template` is a template.
+    """
+    return ChatPromptTemplate.from_messages([
+        SystemMessage(content=[{"type": "text", "text": static_text.strip(), "cache_control": CACHE_CONTROL}]),
+        ("human", human_template),
+    ])
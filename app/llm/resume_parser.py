@@ -1,42 +1,118 @@
-import boto3
-import json
+import time
 import asyncio
-import tempfile
+from functools import lru_cache, partial
+from typing import AsyncIterator, Awaitable
 from app.utils.logs import Logger
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_aws import ChatBedrock
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_experimental.text_splitter import SemanticChunker
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_huggingface import HuggingFaceEmbeddings
-from app.llm.postprocessing.pp import ResumeDetails
-from langchain.chains.combine_documents import create_stuff_documents_chain
-from app.llm.tools.resume_parser_tool import EducationInputSchema, ProjectInputSchema, JobInputSchema, ProfessionalInputSchema, PersonalInputSchema
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+from app.llm.postprocessing.pp import ResumeDetails, validate_section
+from app.llm.postprocessing.json_repair import parse_json
+from app.llm.tools.resume_parser_tool import EducationInputSchema, ProjectInputSchema, JobInputSchema, ProfessionalInputSchema, PersonalInputSchema, CombinedInputSchema, SCHEMA_VERSION, build_partial_schema
 from app.configs.appconf import env
+from app.llm.clients import bedrock
+from app.llm.limiter import limiter, is_throttle_error
+from app.llm.hedging import hedger
+from app.llm.prompts import cached_prompt
 from app.services.text_loader import ExtractText
+from app.services.upload import ResumeUpload
+from app.services.section_segmenter import SectionSegmenter, LayoutLine
+from app.services.cache import cache
 from app.endpoints.errors import APIException
-from app.llm.chunk_classifier import ChunkClassifier
-from langchain_core.documents import Document
+from app.llm.chunk_classifier import ChunkClassifier, PROMPT_VERSION as CLASSIFIER_PROMPT_VERSION
+from app.llm.contact_extractor import ContactExtractor
+from app.llm.extraction_planner import ExtractionPlanner, SINGLE, BROADCAST, FANOUT
+from app.utils.metrics import metrics
 
 log = Logger()
 
-embedding_function = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+# Bump whenever the extraction prompt, text extraction or chunking changes so cached results are not reused.
+PROMPT_VERSION = "2"
+EXTRACTION_VERSION = "2"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 50
+SECTION_OK = "ok"
+# Personal fields filled from other sections, so the personal-info call never asks for them.
+PERSONAL_DERIVED_FIELDS = frozenset({"latestJobDesignation"})
+
+EXTRACTION_INSTRUCTIONS = """
+Please extract resume details from the provided context and return ONLY a JSON object.
+Do not include any other text, explanations, or formatting outside the JSON object.
+
+{format_instructions}
+
+Return ONLY the JSON object and nothing else.
+"""
+
+SECTION_SCHEMAS: dict[str, type[BaseModel]] = {
+    "ProjectDetails": ProjectInputSchema,
+    "JobDetails": JobInputSchema,
+    "EducationDetails": EducationInputSchema,
+    "ProfessionalInfo": ProfessionalInputSchema,
+}
+
+
+@lru_cache(maxsize=64)
+def extraction_prompt(schema: type[BaseModel]) -> ChatPromptTemplate:
+    """
+    Instructions plus the schema's format instructions as the cached prefix, the resume context after it.
+    """
+    format_instructions = PydanticOutputParser(pydantic_object=schema).get_format_instructions()
+    return cached_prompt(
+        EXTRACTION_INSTRUCTIONS.replace("{format_instructions}", format_instructions),
+        "<context>\n{context}\n</context>",
+    )
+
+
+# Built at import so requests only look prompts up; partial personal schemas are added on first use.
+for _schema in (*SECTION_SCHEMAS.values(), CombinedInputSchema):
+    extraction_prompt(_schema)
+
+
+class SectionFailure(Exception):
+    """
+    A section that still failed after its retries. `partial` holds whatever was resolved without the LLM.
+    """
+
+    def __init__(self, status: str, partial: dict | None = None):
+        super().__init__(status)
+        self.status = status
+        self.partial = partial or {}
+
 
 class ResumeParser:
-    def __init__(self, resume_path: str):
-        self.resume_path = resume_path
+    def __init__(self, source: ResumeUpload, use_cache: bool = True):
+        """
+        Extracts and chunks the resume synchronously. Use `ResumeParser.create` from async code.
+        """
+        self.source = source
+        self.use_cache = use_cache
+        self.file_hash = source.sha256
         self.haikullm = self._create_llm(env.MODEL_HAIKU)
         self.sonnetllm = self._create_llm(env.MODEL_SONNET)
         # self.deepseekllm = self._create_llm(env.MODEL_DEEPSEEK)
-        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=50)
+        self.splitter = self._create_splitter()
+        self.segmented_classification: dict | None = None
+        # How chunks were routed to sections for this run; stored with the result for near-duplicate reuse.
+        self.routed_chunks: dict[str, list[int]] | None = None
+        self.first_line = ""
         self.serialized_chunks = self._create_serialized_chunks()
 
+    @classmethod
+    async def create(cls, source: ResumeUpload, use_cache: bool = True) -> "ResumeParser":
+        """
+        Builds the parser in a worker thread so OCR, loading and splitting never block the event loop.
+        """
+        return await asyncio.to_thread(cls, source, use_cache)
+
     def _create_llm(self, MODEL_ID: str):
-        return ChatBedrock(
-            client=boto3.client("bedrock-runtime", region_name="us-east-1"),
-            model_id=MODEL_ID,
-            model_kwargs={"temperature": 0.2, "max_tokens": 3000}
-        )
+        return bedrock.llm(MODEL_ID)
+
+    @staticmethod
+    def _create_splitter():
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+        return RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
 
     def _clean_chunks(self, chunk_list: list[str]) -> list[str]:
         """
@@ -52,74 +128,372 @@ class ResumeParser:
     
     def _create_serialized_chunks(self):
         try:
-            resume_text = ExtractText(self.resume_path).text_content
-            chunks = self.splitter.split_text(resume_text)
-            chunks = self._clean_chunks(chunks)
-            serialized_chunks = {i: chunk for i, chunk in enumerate(chunks)}
+            chunked = cache.memoize(
+                "chunks",
+                cache.make_key(
+                    self.file_hash, self._extraction_version(), CHUNK_SIZE, CHUNK_OVERLAP,
+                    env.SEGMENTER_ENABLED, env.SEGMENTER_MIN_CONFIDENCE,
+                ),
+                self._create_chunks,
+                self.use_cache,
+            )
+            self.segmented_classification = chunked["classification"]
+            self.first_line = chunked.get("first_line", "")
+            serialized_chunks = {i: chunk for i, chunk in enumerate(chunked["chunks"])}
             return serialized_chunks
+        except APIException:
+            raise
         except Exception as e:
             log.error(f"Error while creating serialized chunks: {str(e)}")
             raise APIException(500)
-        
-    def _create_prompt(self, parser: PydanticOutputParser):
-        prompt = ChatPromptTemplate.from_template("""
-                                    Please extract resume details from the provided context and return ONLY a JSON object.
-                                    Do not include any other text, explanations, or formatting outside the JSON object.
 
-                                    <context>
-                                    {context}
-                                    </context>
-
-                                    {format_instructions}
+    def _create_chunks(self) -> dict:
+        """
+        Uses section-aligned blocks when the layout segmenter is confident, which also removes the
+        need for classification. Otherwise falls back to fixed-size chunks.
+        """
+        extraction = cache.memoize(
+            "extraction",
+            cache.make_key(self.file_hash, self._extraction_version()),
+            self._extract,
+            self.use_cache,
+        )
+        first_line = next((line[0].strip() for line in extraction["lines"] if line[0].strip()), "")
+        with metrics.span("chunking"):
+            if env.SEGMENTER_ENABLED:
+                segmentation = SectionSegmenter.segment([LayoutLine(*line) for line in extraction["lines"]])
+                log.info(f"Section segmentation confidence={segmentation.confidence}")
+                if segmentation.confidence >= env.SEGMENTER_MIN_CONFIDENCE:
+                    metrics.events_total.inc(event="chunking", value="segmenter")
+                    sections = segmentation.routed_sections()
+                    return {
+                        "chunks": [" ".join(f"{section.heading} {section.text}".split()) for section in sections],
+                        "classification": segmentation.classification(),
+                        "first_line": first_line,
+                    }
+            metrics.events_total.inc(event="chunking", value="splitter")
+            chunks = self.splitter.split_text(extraction["text"])
+            return {"chunks": self._clean_chunks(chunks), "classification": None, "first_line": first_line}
 
-                                    Return ONLY the JSON object and nothing else.
-                                """).partial(format_instructions=parser.get_format_instructions())
-        return prompt
+    def _extract(self) -> dict:
+        extractor = ExtractText(self.source)
+        return {"text": extractor.text_content, "lines": [line.to_list() for line in extractor.lines]}
 
     def _postprocess_results(self, results):
         combined_results = {}
         for result in results:
             combined_results.update(result)
         try:
-            combined_results = ResumeDetails(**combined_results).model_dump()
+            with metrics.span("postprocessing"):
+                combined_results = ResumeDetails(**combined_results).model_dump()
             return combined_results
         except Exception as e:
             log.error(f"Error while postprocessing results: {str(e)}")
             raise APIException(500)
     
-    async def parse_details(self, tool_spec: PydanticOutputParser, chunk_indexes, llm):
-        raw_response = None
+    async def parse_details(self, schema: type[BaseModel], chunk_indexes, llm):
+        """
+        Extracts one section under a per-attempt deadline with hedging. Only this section is retried,
+        optionally on Haiku after a timeout; raises `SectionFailure` once the attempts run out.
+        """
+        section = schema.__name__.removesuffix("InputSchema")
+        # Same layout the stuff-documents chain produced: chunks separated by blank lines.
+        context = "\n\n".join(self.serialized_chunks[idx] for idx in chunk_indexes)
+        prompt = extraction_prompt(schema)
+        status = "failed"
+        with metrics.span(f"section:{section}"):
+            for attempt in range(env.SECTION_MAX_ATTEMPTS):
+                call = partial(self._invoke_section, section, schema, prompt, llm, context)
+                try:
+                    return await hedger.call(f"{llm.model_id}:{section}", call, env.SECTION_TIMEOUT_SECONDS)
+                except TimeoutError:
+                    status = "timeout"
+                    log.warning(f"{section} timed out on {llm.model_id} (attempt {attempt + 1}/{env.SECTION_MAX_ATTEMPTS})")
+                    if env.SECTION_FALLBACK_TO_HAIKU and llm is not self.haikullm:
+                        metrics.events_total.inc(event="section_fallback", value=section)
+                        llm = self.haikullm
+                except Exception as e:
+                    if is_throttle_error(e):
+                        # The limiter has already backed off and retried this call.
+                        status = "throttled"
+                        break
+                    status = "failed"
+                    log.error(f"Error while parsing {section} details (attempt {attempt + 1}/{env.SECTION_MAX_ATTEMPTS}): {str(e)}")
+                metrics.events_total.inc(event="section_attempt_failed", value=section)
+        metrics.events_total.inc(event="section_failed", value=status)
+        raise SectionFailure(status)
+
+    async def _invoke_section(self, section: str, schema: type[BaseModel], prompt: ChatPromptTemplate, llm, context: str) -> dict:
+        """
+        One model call whose output must parse and match the section schema; anything else raises
+        so a hedged or retried attempt can take over. Truncated output is resumed from where it
+        stopped by prefilling the assistant turn, instead of repeating the whole call.
+        """
+        messages = prompt.format_messages(context=context)
+        text = await self._call_llm(section, llm, messages)
         try:
-            documents = [
-                Document(page_content=self.serialized_chunks[idx]) for idx in chunk_indexes
-            ]
-            prompt = self._create_prompt(tool_spec)
-            stuff_chain = create_stuff_documents_chain(llm, prompt, document_variable_name="context")
-            result = await stuff_chain.ainvoke({"context": documents})
-            raw_response = result
-            result = json.loads(result)
-            return result
-        except Exception as e:
-            log.error(f"Error while parsing details: {str(e)}")
-            log.error(f"Raw response: {raw_response}")
-            raise APIException(500)
+            parsed = parse_json(text)
+            for _ in range(env.JSON_MAX_CONTINUATIONS):
+                if not parsed.truncated:
+                    break
+                metrics.events_total.inc(event="json_continuation", value=section)
+                # Bedrock rejects an assistant prefill that ends in whitespace.
+                prefix = parsed.text.rstrip()
+                text = prefix + await self._call_llm(section, llm, [*messages, AIMessage(content=prefix)])
+                try:
+                    parsed = parse_json(text)
+                except ValueError:
+                    log.warning(f"Continuation of {section} did not parse, keeping the salvaged elements")
+                    break
+            metrics.events_total.inc(event="json_parse", value=parsed.outcome)
+            schema.model_validate(parsed.value)
+        except ValueError:
+            metrics.events_total.inc(event="json_parse", value="failed")
+            log.error(f"Raw response: {text}")
+            raise
+        return parsed.value
+
+    async def _call_llm(self, section: str, llm, messages: list) -> str:
+        started = time.perf_counter()
+        response = await limiter.run(llm.model_id, lambda: bedrock.ainvoke(llm, messages))
+        metrics.record_llm_call(llm.model_id, section, time.perf_counter() - started, response)
+        return response.content
+
+    async def parse_personal_details(self, chunk_indexes):
+        """
+        Resolves contact fields with rules first and asks the LLM only for the fields they could
+        not resolve. The call is skipped when the rules resolve every field.
+        """
+        resolved = ContactExtractor(self.serialized_chunks, self.first_line).extract()
+        missing = frozenset(PersonalInputSchema.model_fields.keys() - resolved.keys() - PERSONAL_DERIVED_FIELDS)
+        if not missing:
+            metrics.events_total.inc(event="personal_info", value="rules")
+            return resolved
+        metrics.events_total.inc(event="personal_info", value="llm")
+        try:
+            result = await self.parse_details(build_partial_schema(PersonalInputSchema, missing), chunk_indexes, self.haikullm)
+        except SectionFailure as e:
+            raise SectionFailure(e.status, resolved)
+        return ContactExtractor.merge(resolved, result)
 
     async def run(self):
-        professional_parser = PydanticOutputParser(pydantic_object=ProfessionalInputSchema)
-        personal_parser = PydanticOutputParser(pydantic_object=PersonalInputSchema)
-        education_parser = PydanticOutputParser(pydantic_object=EducationInputSchema)
-        project_parser = PydanticOutputParser(pydantic_object=ProjectInputSchema)
-        job_parser = PydanticOutputParser(pydantic_object=JobInputSchema)
-        
-        classified_chunks = ChunkClassifier(self.serialized_chunks).classify()
-
-        results = await asyncio.gather(
-            self.parse_details(project_parser, classified_chunks["ProjectDetails"], self.sonnetllm),
-            self.parse_details(job_parser, classified_chunks["JobDetails"], self.sonnetllm),
-            self.parse_details(personal_parser, classified_chunks["PersonalInfo"], self.haikullm),
-            self.parse_details(education_parser, classified_chunks["EducationDetails"], self.haikullm),
-            self.parse_details(professional_parser, classified_chunks["ProfessionalInfo"], self.sonnetllm),
+        return await cache.amemoize(
+            "result",
+            self._result_key(),
+            self._run,
+            self.use_cache,
+            cacheable=self._is_complete,
         )
-        
-        combined_results = self._postprocess_results(results)
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """
+        Yields each section as soon as its call finishes, then the merged `ResumeDetails` payload.
+        """
+        if self.use_cache:
+            cached = await asyncio.to_thread(cache.get, "result", self._result_key())
+            if cached is not None:
+                yield {"event": "result", "data": cached}
+                return
+
+        outcomes = []
+        async for section, result, status in self._section_outcomes():
+            outcomes.append((section, result, status))
+            yield {"event": "section", "section": section, "status": status, "data": self._postprocess_section(section, result)}
+
+        combined_results = self._combine(outcomes)
+        if self.use_cache and self._is_complete(combined_results):
+            await asyncio.to_thread(cache.set, "result", self._result_key(), combined_results)
+        await self._remember(combined_results)
+        yield {"event": "result", "data": combined_results}
+
+    def _result_key(self) -> str:
+        return cache.make_key(self.file_hash, self._pipeline_version())
+
+    @staticmethod
+    def _extraction_version() -> str:
+        # The text-layer probe decides which pages are OCR'd, so its thresholds change the text.
+        return cache.make_key(EXTRACTION_VERSION, env.TEXT_LAYER_MIN_SCORE, env.TEXT_LAYER_MIN_CHARS)
+
+    @staticmethod
+    def _pipeline_version() -> str:
+        # Every version and setting that changes the output; cached and near-duplicate results
+        # are only reused by a pipeline that chunks, routes and extracts the same way.
+        return cache.make_key(
+            env.MODEL_SONNET, env.MODEL_HAIKU, PROMPT_VERSION, CLASSIFIER_PROMPT_VERSION, SCHEMA_VERSION,
+            ResumeParser._extraction_version(), CHUNK_SIZE, CHUNK_OVERLAP, env.SEGMENTER_ENABLED, env.SEGMENTER_MIN_CONFIDENCE,
+            env.JSON_MAX_CONTINUATIONS, env.CLASSIFIER_MODE, env.EMBEDDING_MODEL, env.EMBEDDING_MIN_CONFIDENCE,
+            env.EXTRACTION_STRATEGY, env.PLANNER_SINGLE_MAX_TOKENS, env.PLANNER_BROADCAST_MAX_TOKENS,
+        )
+
+    def _near_duplicates_enabled(self) -> bool:
+        return self.use_cache and cache.enabled and env.NEAR_DUP_ENABLED
+
+    async def _remember(self, result: dict) -> None:
+        if not (self._near_duplicates_enabled() and self._is_complete(result) and self.routed_chunks is not None):
+            return
+        from app.services.near_duplicates import index
+
+        await asyncio.to_thread(
+            index.add, self.file_hash, self._pipeline_version(), list(self.serialized_chunks.values()), self.routed_chunks, result,
+        )
+
+    async def _classify(self) -> dict:
+        match env.CLASSIFIER_MODE:
+            case "embedding":
+                from app.llm.embedding_classifier import EmbeddingClassifier
+                classifier = EmbeddingClassifier(self.serialized_chunks)
+            case _:
+                classifier = await asyncio.to_thread(ChunkClassifier, self.serialized_chunks)
+        return await classifier.aclassify()
+
+    async def _classified_chunks(self) -> dict:
+        if self.segmented_classification is not None:
+            return self.segmented_classification
+        with metrics.span("classification"):
+            return await cache.amemoize(
+                "classification",
+                cache.make_key(*self.serialized_chunks.values(), env.CLASSIFIER_MODE, env.MODEL_SONNET, CLASSIFIER_PROMPT_VERSION, SCHEMA_VERSION),
+                self._classify,
+                self.use_cache,
+            )
+
+    async def _section_outcomes(self) -> AsyncIterator[tuple[str, dict, str]]:
+        """
+        Yields (section, result, status) as sections finish. A near duplicate of a stored resume
+        only re-extracts its changed sections; otherwise the planner picks the strategy.
+        """
+        if self._near_duplicates_enabled():
+            reused = await self._near_duplicate_outcomes()
+            if reused is not None:
+                async for outcome in reused:
+                    yield outcome
+                return
+
+        plan = ExtractionPlanner.plan(self.serialized_chunks, self.segmented_classification is not None)
+        log.info(f"Extraction strategy={plan.strategy} resume_tokens={plan.resume_tokens} ({plan.reason})")
+        metrics.events_total.inc(event="extraction_strategy", value=plan.strategy)
+
+        strategy = plan.strategy
+        if strategy == SINGLE:
+            outcomes = await self._single_call_outcomes()
+            if outcomes is not None:
+                self.routed_chunks = self._all_chunks()
+                for outcome in outcomes:
+                    yield outcome
+                return
+            # The resume is small, so skipping classification is still the cheaper fallback.
+            metrics.events_total.inc(event="extraction_strategy", value=f"{SINGLE}_fallback")
+            strategy = BROADCAST
+
+        self.routed_chunks = await self._classified_chunks() if strategy == FANOUT else self._all_chunks()
+        async for outcome in self._run_sections(self.routed_chunks):
+            yield outcome
+
+    async def _run_sections(self, classified_chunks: dict, sections: set[str] | None = None) -> AsyncIterator[tuple[str, dict, str]]:
+        tasks = [
+            asyncio.ensure_future(self._guarded_section(section, coro))
+            for section, coro in self._section_tasks(classified_chunks, sections).items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _all_chunks(self) -> dict[str, list[int]]:
+        return {section: list(self.serialized_chunks) for section in (*SECTION_SCHEMAS, "PersonalInfo")}
+
+    async def _near_duplicate_outcomes(self) -> AsyncIterator[tuple[str, dict, str]] | None:
+        """
+        Looks the chunks up in the near-duplicate index. On a match, returns an iterator that yields
+        the stored sections whose chunks are unchanged and re-extracts only the others.
+        """
+        from app.services.near_duplicates import index, diff_sections
+
+        chunks = list(self.serialized_chunks.values())
+        match = await asyncio.to_thread(index.query, chunks, self._pipeline_version())
+        if match is None:
+            return None
+        self.routed_chunks, changed = diff_sections(match.chunks, match.classification, chunks)
+        sections = {**SECTION_SCHEMAS, "PersonalInfo": PersonalInputSchema}
+        log.info(f"Near duplicate of {match.doc_id[:12]} (similarity={match.similarity:.2f}), re-extracting {sorted(changed)}")
+        metrics.events_total.inc(len(sections) - len(changed), event="near_duplicate_section", value="reused")
+        metrics.events_total.inc(len(changed), event="near_duplicate_section", value="extracted")
+
+        async def outcomes() -> AsyncIterator[tuple[str, dict, str]]:
+            for section, schema in sections.items():
+                if section not in changed:
+                    yield section, {field: match.result[field] for field in schema.model_fields if field in match.result}, SECTION_OK
+            if changed:
+                async for outcome in self._run_sections(self.routed_chunks, changed):
+                    yield outcome
+
+        return outcomes()
+
+    async def _single_call_outcomes(self) -> list[tuple[str, dict, str]] | None:
+        """
+        Extracts every section with one call on the combined schema and splits the answer back
+        into sections. Returns None when the call fails so the caller can fan out instead.
+        """
+        resolved = ContactExtractor(self.serialized_chunks, self.first_line).extract()
+        sections = {**SECTION_SCHEMAS, "PersonalInfo": PersonalInputSchema}
+        try:
+            result, status = await self.parse_details(CombinedInputSchema, list(self.serialized_chunks), self.sonnetllm), SECTION_OK
+        except SectionFailure as e:
+            if e.status != "throttled":
+                return None
+            # Five more calls would only be throttled too.
+            result, status = {}, e.status
+        outcomes = []
+        for section, schema in sections.items():
+            payload = {field: result[field] for field in schema.model_fields if field in result}
+            if section == "PersonalInfo":
+                payload = ContactExtractor.merge(resolved, payload)
+            outcomes.append((section, payload, status))
+        return outcomes
+
+    def _section_tasks(self, classified_chunks: dict, sections: set[str] | None = None) -> dict[str, Awaitable[dict]]:
+        # Factories, so sections that are not requested never create a coroutine.
+        factories = {
+            "ProjectDetails": lambda: self.parse_details(SECTION_SCHEMAS["ProjectDetails"], classified_chunks["ProjectDetails"], self.sonnetllm),
+            "JobDetails": lambda: self.parse_details(SECTION_SCHEMAS["JobDetails"], classified_chunks["JobDetails"], self.sonnetllm),
+            "PersonalInfo": lambda: self.parse_personal_details(classified_chunks["PersonalInfo"]),
+            "EducationDetails": lambda: self.parse_details(SECTION_SCHEMAS["EducationDetails"], classified_chunks["EducationDetails"], self.haikullm),
+            "ProfessionalInfo": lambda: self.parse_details(SECTION_SCHEMAS["ProfessionalInfo"], classified_chunks["ProfessionalInfo"], self.sonnetllm),
+        }
+        return {section: factory() for section, factory in factories.items() if sections is None or section in sections}
+
+    @staticmethod
+    async def _guarded_section(section: str, coro: Awaitable[dict]) -> tuple[str, dict, str]:
+        try:
+            return section, await coro, SECTION_OK
+        except SectionFailure as e:
+            return section, e.partial, e.status
+
+    def _combine(self, outcomes: list[tuple[str, dict, str]]) -> dict:
+        """
+        Merges section results and their statuses. Failed sections stay empty; the request only
+        fails when no section succeeded.
+        """
+        statuses = {section: status for section, _, status in outcomes}
+        if SECTION_OK not in statuses.values():
+            raise APIException(503 if {"throttled", "timeout"} & set(statuses.values()) else 500)
+        return self._postprocess_results([result for _, result, _ in outcomes] + [{"sectionStatus": statuses}])
+
+    @staticmethod
+    def _is_complete(result: dict) -> bool:
+        return all(status == SECTION_OK for status in result.get("sectionStatus", {}).values())
+
+    def _postprocess_section(self, section: str, result: dict) -> dict:
+        try:
+            return validate_section(section, result)
+        except Exception as e:
+            log.error(f"Error while postprocessing {section}: {str(e)}")
+            raise APIException(500)
+
+    async def _run(self):
+        outcomes = [outcome async for outcome in self._section_outcomes()]
+        combined_results = self._combine(outcomes)
+        await self._remember(combined_results)
         return combined_results
\ No newline at end of file
@@ -1,5 +1,10 @@
 from typing import List
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, Field, create_model
+
+# Bump whenever a schema below changes so cached results are not reused.
+SCHEMA_VERSION = "1"
+
 # --- Atomic Detail Models ---
 
 class JobDetails(BaseModel):
@@ -66,4 +71,21 @@ class PersonalInputSchema(BaseModel):
     city: str = Field(default="NA", description="Current city where the candidate resides or works.")
     state: str = Field(default="NA", description="Current state corresponding to the city where the candidate resides.")
     nativeLocation: str = Field(default="NA", description="Candidate's native place or hometown.")
-    marriageStatus: str = Field(default="NA", description="Marital status of the candidate (e.g., Single, Married, Divorced).")
\ No newline at end of file
+    marriageStatus: str = Field(default="NA", description="Marital status of the candidate (e.g., Single, Married, Divorced).")
+
+class CombinedInputSchema(PersonalInputSchema, ProfessionalInputSchema, EducationInputSchema, ProjectInputSchema, JobInputSchema):
+    """
+    Every section in one schema, for resumes small enough to extract in a single call.
+    """
+
+@lru_cache(maxsize=64)
+def build_partial_schema(schema: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """
+    Returns a copy of `schema` restricted to `fields`, keeping their types, defaults and descriptions.
+    """
+    definitions = {
+        name: (field.annotation, field)
+        for name, field in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(schema.__name__, __base__=BaseModel, **definitions)
\ No newline at end of file
@@ -1,16 +1,53 @@
-from fastapi import FastAPI, Depends
-from app.endpoints import routes
+import asyncio
+from contextlib import asynccontextmanager
+import time
+from typing import AsyncIterator
+from fastapi import FastAPI, Depends, Request, Response
+from fastapi.responses import PlainTextResponse
+from app.endpoints import routes, jobs
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
+from app.services.ocr_pool import ocr_pool
+from app.llm.clients import bedrock
+from app.services.doc_converter import doc_converter
+from app.services.cache import cache
+from app.configs.appconf import env
+from app.jobs.worker import create_worker
+from app.services.warmup import warmup
+from app.utils.metrics import metrics, RequestTrace
 
 bearer = HTTPBearer()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if env.QUEUE_BROKER == "memory" and env.JOB_IN_PROCESS_WORKERS < 1:
+        raise RuntimeError("QUEUE_BROKER=memory needs JOB_IN_PROCESS_WORKERS > 0; nothing else can consume its jobs")
+    bedrock.start()
+    # Warm up in the background so /healthcheck answers while models load.
+    warmup_task = asyncio.create_task(warmup.run())
+    if cache.enabled:
+        await asyncio.to_thread(cache.disk.prune)
+        if env.NEAR_DUP_ENABLED:
+            from app.services.near_duplicates import index
+            await asyncio.to_thread(index.prune)
+    # In-process consumers; required for the memory broker, optional otherwise.
+    workers = [create_worker() for _ in range(env.JOB_IN_PROCESS_WORKERS)]
+    tasks = [asyncio.create_task(worker.run_forever()) for worker in workers]
+    yield
+    for task in tasks:
+        task.cancel()
+    warmup_task.cancel()
+    ocr_pool.shutdown()
+    doc_converter.shutdown()
+    bedrock.shutdown()
+
 app = FastAPI(
     title="RESUME PARSER",
     description="This API accepts resume and extract important details from it",
     version="1.0",
     docs_url="/docs",
-    redoc_url=None
+    redoc_url=None,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -21,7 +58,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Streaming routes send their headers before any section runs, so they get no Server-Timing.
+STREAMING_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    trace = RequestTrace()
+    token = metrics.trace.set(trace)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    except Exception:
+        metrics.request_seconds.observe(time.perf_counter() - started, path=_route_path(request), status=500)
+        raise
+    finally:
+        metrics.trace.reset(token)
+    streaming = response.headers.get("content-type", "").startswith(STREAMING_MEDIA_TYPES)
+    if not streaming and trace.spans and (env.TIMING_HEADER_ENABLED or request.headers.get("x-timing", "").lower() in ("1", "true")):
+        response.headers["Server-Timing"] = trace.server_timing()
+    response.body_iterator = _observe_on_completion(response.body_iterator, started, _route_path(request), response.status_code)
+    return response
+
+async def _observe_on_completion(body: AsyncIterator[bytes], started: float, path: str, status: int) -> AsyncIterator[bytes]:
+    # `call_next` returns once the headers are ready; the latency ends when the last chunk is sent.
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        metrics.request_seconds.observe(time.perf_counter() - started, path=path, status=status)
+
+def _route_path(request: Request) -> str:
+    # Use the route template so /jobs/{job_id} does not create one series per job.
+    route = request.scope.get("route")
+    return getattr(route, "path", request.url.path)
+
 app.include_router(routes.router, tags=["RESUME PARSER"])
+app.include_router(jobs.router, tags=["JOBS"])
 
 @app.get("/healthcheck", tags=["Default"])
 async def healthcheck() -> dict:
@@ -31,6 +103,30 @@ async def healthcheck() -> dict:
     """
     return {"status_code": 200, "message": "Service is running"}
 
+@app.get("/readiness", tags=["Default"])
+async def readiness(response: Response) -> dict:
+    """
+    Readiness endpoint.
+    Returns 200 once the worker has finished warming up its models and clients, 503 before that.
+    """
+    if not warmup.ready:
+        response.status_code = 503
+        return {"status_code": 503, "message": "Warming up", "error": warmup.error}
+    return {"status_code": 200, "message": "Service is ready", "warmup_seconds": warmup.timings}
+
+@app.get("/metrics", tags=["Default"], response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    Metrics endpoint.
+    Returns per-stage latency, token and cost metrics of this worker in the Prometheus text format.
+    """
+    if cache.enabled and env.NEAR_DUP_ENABLED:
+        from app.services.near_duplicates import index
+        # Hits and query latency are already recorded per request; the index size is read here.
+        summary = await asyncio.to_thread(index.summary)
+        metrics.near_duplicate_documents.set(summary["documents"])
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/", tags=["Default"])
 async def root() -> dict:
     """
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import hashlib
+from threading import Lock
+from collections import OrderedDict
+from typing import Any, Callable, Awaitable
+from app.configs.appconf import env
+from app.utils.logs import log
+
+
+class MemoryLRU:
+    """
+    In-process LRU with a TTL and both an item-count and a byte-size bound.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int, ttl: int):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._items: OrderedDict[str, tuple[float, int, str]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            created_at, size, payload = item
+            if time.time() - created_at > self.ttl:
+                self._drop(key)
+                return None
+            self._items.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: str, created_at: float | None = None) -> None:
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+            self._items[key] = (created_at or time.time(), size, payload)
+            self.total_bytes += size
+            while self._items and (len(self._items) > self.max_items or self.total_bytes > self.max_bytes):
+                self._drop(next(iter(self._items)))
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._items.pop(key)
+        self.total_bytes -= size
+
+
+class SQLiteStore:
+    """
+    On-disk key/value store shared by all workers on the host.
+    """
+
+    def __init__(self, path: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+        self._lock = Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, created_at REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> tuple[float, str] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT created_at, payload FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[0] > self.ttl:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return row
+
+    def set(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, created_at, payload) VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+            return cursor.rowcount
+
+
+class ResultCache:
+    """
+    Two-level content-addressed cache: a memory LRU in front of a SQLite file.
+    Values must be JSON serialisable. Keys are namespaced per pipeline stage.
+    """
+
+    def __init__(self, enabled: bool, directory: str, ttl: int, max_items: int, max_bytes: int):
+        self.enabled = enabled
+        self.directory = directory
+        self.ttl = ttl
+        self.memory = MemoryLRU(max_items, max_bytes, ttl)
+        self._disk: SQLiteStore | None = None
+        self._disk_lock = Lock()
+
+    @property
+    def disk(self) -> SQLiteStore:
+        with self._disk_lock:
+            if self._disk is None:
+                self._disk = SQLiteStore(os.path.join(self.directory, "results.sqlite3"), self.ttl)
+            return self._disk
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        full_key = f"{namespace}:{key}"
+        try:
+            payload = self.memory.get(full_key)
+            if payload is None:
+                row = self.disk.get(full_key)
+                if row is None:
+                    return None
+                created_at, payload = row
+                self.memory.set(full_key, payload, created_at)
+            return json.loads(payload)
+        except Exception as e:
+            log.warning(f"Cache read failed for {full_key}: {str(e)}")
+            return None
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        full_key = f"{namespace}:{key}"
+        try:
+            payload = json.dumps(value)
+            self.memory.set(full_key, payload)
+            self.disk.set(full_key, payload)
+        except Exception as e:
+            log.warning(f"Cache write failed for {full_key}: {str(e)}")
+
+    def memoize(self, namespace: str, key: str, compute: Callable[[], Any], enabled: bool = True) -> Any:
+        if not (self.enabled and enabled):
+            return compute()
+        value = self.get(namespace, key)
+        if value is None:
+            value = compute()
+            self.set(namespace, key, value)
+        return value
+
+    async def amemoize(
+        self, namespace: str, key: str, compute: Callable[[], Awaitable[Any]], enabled: bool = True,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        `cacheable` can veto storing a computed value, e.g. a result with failed sections.
+        """
+        if not (self.enabled and enabled):
+            return await compute()
+        value = await asyncio.to_thread(self.get, namespace, key)
+        if value is None:
+            value = await compute()
+            if cacheable is None or cacheable(value):
+                await asyncio.to_thread(self.set, namespace, key, value)
+        return value
+
+
+cache = ResultCache(
+    enabled=env.CACHE_ENABLED,
+    directory=env.CACHE_DIR,
+    ttl=env.CACHE_TTL_SECONDS,
+    max_items=env.CACHE_MEMORY_MAX_ITEMS,
+    max_bytes=env.CACHE_MEMORY_MAX_BYTES,
+)
@@ -0,0 +1,152 @@
+import os
+import time
+import queue
+import shlex
+import fcntl
+import shutil
+import socket
+import tempfile
+import subprocess
+from threading import Lock
+from app.configs.appconf import env
+from app.utils.logs import log
+
+HOST = "127.0.0.1"
+
+
+class ConverterUnavailable(RuntimeError):
+    """
+    The converter command is not installed, so `.doc` uploads cannot be processed on this host.
+    """
+
+
+class DocConverter:
+    """
+    Pool of long-lived unoserver (LibreOffice) processes that convert legacy `.doc` uploads to
+    DOCX, so a conversion costs one RPC instead of a LibreOffice start-up. Each slot owns a
+    port; a request borrows a free slot, and a server that fails a conversion is restarted.
+    Ports are shared by every worker on the host: starting a server is serialised with an
+    `flock` per port, and a server another worker already started is reused.
+    """
+
+    def __init__(self, size: int, base_port: int, command: str, timeout: float, lock_dir: str):
+        self.size = size
+        self.base_port = base_port
+        self.command = shlex.split(command)
+        self.timeout = timeout
+        self.lock_dir = lock_dir
+        self._processes: dict[int, subprocess.Popen] = {}
+        self._ports: queue.Queue[int] = queue.Queue()
+        for idx in range(size):
+            self._ports.put(base_port + idx)
+        self._lock = Lock()
+
+    @property
+    def available(self) -> bool:
+        return bool(self.command) and shutil.which(self.command[0]) is not None
+
+    def convert(self, data: bytes) -> bytes:
+        if not self.available:
+            raise ConverterUnavailable(f"{shlex.join(self.command)} is not installed")
+        try:
+            port = self._ports.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("No .doc converter became free in time")
+        try:
+            self._ensure_server(port)
+            from unoserver.client import UnoClient
+
+            return UnoClient(server=HOST, port=str(port)).convert(indata=data, convert_to="docx")
+        except Exception:
+            self._stop(port)
+            raise
+        finally:
+            self._ports.put(port)
+
+    def warm(self) -> None:
+        """
+        Starts every server in the pool ahead of the first `.doc` upload.
+        """
+        if not self.available:
+            log.warning(f".doc converter {shlex.join(self.command)} is not installed; .doc uploads will be rejected")
+            return
+        for idx in range(self.size):
+            self._ensure_server(self.base_port + idx)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            ports = list(self._processes)
+        for port in ports:
+            self._stop(port)
+
+    # --- Internal helpers ---
+
+    def _ensure_server(self, port: int) -> None:
+        with self._port_lock(port):
+            with self._lock:
+                process = self._processes.get(port)
+            if process is not None and process.poll() is None:
+                return
+            if self._listening(port):
+                # Started by another worker on this host.
+                return
+            log.info(f"Starting .doc converter on port {port}")
+            process = subprocess.Popen(
+                [*self.command, "--interface", HOST, "--port", str(port), "--uno-port", str(port + 100)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            with self._lock:
+                self._processes[port] = process
+            deadline = time.monotonic() + self.timeout
+            while not self._listening(port):
+                if process.poll() is not None:
+                    raise RuntimeError(f".doc converter on port {port} exited with {process.returncode}")
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f".doc converter on port {port} did not start in {self.timeout}s")
+                time.sleep(0.2)
+
+    def _port_lock(self, port: int) -> "_PortLock":
+        return _PortLock(os.path.join(self.lock_dir, f"{port}.lock"))
+
+    def _stop(self, port: int) -> None:
+        with self._lock:
+            process = self._processes.pop(port, None)
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    @staticmethod
+    def _listening(port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            return sock.connect_ex((HOST, port)) == 0
+
+
+class _PortLock:
+    def __init__(self, path: str):
+        self.path = path
+
+    def __enter__(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, "a")
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc) -> None:
+        try:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+        finally:
+            self.file.close()
+
+
+doc_converter = DocConverter(
+    size=env.DOC_CONVERTER_POOL_SIZE,
+    base_port=env.DOC_CONVERTER_BASE_PORT,
+    command=env.DOC_CONVERTER_COMMAND,
+    timeout=env.DOC_CONVERTER_TIMEOUT,
+    lock_dir=os.path.join(tempfile.gettempdir(), "resume_parser_doc_converter"),
+)
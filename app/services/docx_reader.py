@@ -0,0 +1,148 @@
+import re
+import zipfile
+from typing import IO, Iterator
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import unescape
+from app.services.section_segmenter import LayoutLine
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+FALSE_VALUES = {"0", "false", "off"}
+TABLE_TAGS = {f"{W}tbl", f"{W}tr", f"{W}tc", f"{W}gridSpan", f"{W}vMerge"}
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+STYLE_NAME_PATTERN = re.compile(rb'<(\w+:|)style\b[^>]*?\bstyleId="([^"]*)"[^>]*>\s*<\1name\s[^>]*?\bval="([^"]*)"')
+# Built-in styles stored under lower-case names that Word (and python-docx) display capitalised
+UI_STYLE_NAMES = {"caption": "Caption", "footer": "Footer", "header": "Header", **{f"heading {n}": f"Heading {n}" for n in range(1, 10)}}
+
+
+class DocxReader:
+    """
+    Reads DOCX body paragraphs and table rows straight from the package XML with `iterparse`,
+    without building a document object model. Paragraphs keep their style name (resolved from
+    styles.xml) and whether all their text runs are bold; table rows become one line with the
+    distinct cell texts joined by " | ", matching what the python-docx walk produced.
+    """
+
+    @staticmethod
+    def open(stream: IO[bytes]) -> zipfile.ZipFile:
+        """
+        Opens and checks the package; raises ValueError when it is not a Word document.
+        """
+        try:
+            package = zipfile.ZipFile(stream)
+        except zipfile.BadZipFile as e:
+            raise ValueError("Not a DOCX package") from e
+        if DOCUMENT_PART not in package.namelist():
+            raise ValueError("DOCX package has no main document part")
+        return package
+
+    @staticmethod
+    def read(package: zipfile.ZipFile) -> list[LayoutLine]:
+        styles = DocxReader._style_names(package)
+        with package.open(DOCUMENT_PART) as document:
+            return [line for line in DocxReader._body_lines(document, styles) if line.text.strip()]
+
+    # --- Internal helpers ---
+
+    @staticmethod
+    def _style_names(package: zipfile.ZipFile) -> dict[str, str]:
+        """
+        Maps style IDs to display names. styles.xml is mostly latent-style boilerplate (hundreds
+        of KB in Word's default template), so it is scanned with a regex for the `w:name` that
+        the schema requires as each style's first child, instead of being parsed.
+        """
+        if STYLES_PART not in package.namelist():
+            return {}
+        names = {}
+        for _, style_id, name in STYLE_NAME_PATTERN.findall(package.read(STYLES_PART)):
+            name = unescape(name.decode("utf-8"))
+            names[unescape(style_id.decode("utf-8"))] = UI_STYLE_NAMES.get(name, name)
+        return names
+
+    @staticmethod
+    def _body_lines(document: IO[bytes], styles: dict[str, str]) -> Iterator[LayoutLine]:
+        depth = 0  # table nesting; paragraphs inside tables belong to their cell
+        fallback = 0  # mc:Fallback repeats the mc:Choice content (e.g. text boxes) for old readers
+        paragraphs: list[_Paragraph] = []  # text box paragraphs nest inside the anchoring paragraph
+        run_bold, run_text = False, False
+        cell: list[str] = []
+        row: list[str] = []
+        column, span, merged = 0, 1, False  # grid position of the current top-level cell
+        above: dict[int, str] = {}  # last text per grid column, for vertically merged cells
+
+        for event, element in iterparse(document, events=("start", "end")):
+            tag = element.tag
+            if tag == FALLBACK:
+                fallback += 1 if event == "start" else -1
+                continue
+            if fallback:
+                continue
+            if event == "start":
+                if tag == f"{W}tbl":
+                    depth += 1
+                    if depth == 1:
+                        above = {}
+                elif tag == f"{W}tr" and depth == 1:
+                    column = 0
+                elif tag == f"{W}p":
+                    paragraphs.append(_Paragraph())
+                elif tag == f"{W}r":
+                    run_bold, run_text = False, False
+                continue
+            if not paragraphs and tag not in TABLE_TAGS:
+                continue
+
+            if tag == f"{W}t":
+                paragraphs[-1].texts.append(element.text or "")
+                run_text = run_text or bool((element.text or "").strip())
+            elif tag == f"{W}tab":
+                paragraphs[-1].texts.append("\t")
+            elif tag in (f"{W}br", f"{W}cr"):
+                paragraphs[-1].texts.append("\n")
+            elif tag == f"{W}b" and element.get(f"{W}val", "true").lower() not in FALSE_VALUES:
+                run_bold = True
+            elif tag == f"{W}pStyle":
+                style_id = element.get(f"{W}val", "")
+                paragraphs[-1].style = styles.get(style_id, style_id)
+            elif tag == f"{W}r":
+                if run_text:
+                    paragraphs[-1].runs_bold.append(run_bold)
+            elif tag == f"{W}p":
+                paragraph = paragraphs.pop()
+                text = "".join(paragraph.texts)
+                if depth:
+                    cell.append(text)
+                else:
+                    yield LayoutLine(text, bold=bool(paragraph.runs_bold) and all(paragraph.runs_bold), style=paragraph.style)
+                    if not paragraphs:
+                        element.clear()
+            elif tag == f"{W}gridSpan" and depth == 1:
+                span = int(element.get(f"{W}val", "1"))
+            elif tag == f"{W}vMerge" and depth == 1:
+                merged = element.get(f"{W}val", "continue") != "restart"
+            elif tag == f"{W}tc" and depth == 1:
+                # A continued vertical merge shows the text of the cell it merges into.
+                text = above.get(column, "") if merged else "\n".join(cell)
+                for offset in range(span):
+                    above[column + offset] = text
+                if text not in row:
+                    row.append(text)
+                column += span
+                cell, span, merged = [], 1, False
+            elif tag == f"{W}tr" and depth == 1:
+                yield LayoutLine(" | ".join(row))
+                row = []
+            elif tag == f"{W}tbl":
+                depth -= 1
+                if not depth:
+                    element.clear()
+
+
+class _Paragraph:
+    __slots__ = ("texts", "style", "runs_bold")
+
+    def __init__(self):
+        self.texts: list[str] = []
+        self.style = "Normal"
+        self.runs_bold: list[bool] = []
@@ -0,0 +1,237 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import difflib
+from threading import Lock
+from dataclasses import dataclass
+import numpy as np
+from app.configs.appconf import env
+from app.utils.metrics import metrics
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+@dataclass
+class NearMatch:
+    doc_id: str
+    similarity: float
+    chunks: list[str]
+    classification: dict[str, list[int]]
+    result: dict
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles, with the permutations drawn once from a fixed seed so
+    signatures stay comparable across processes and restarts.
+    """
+
+    def __init__(self, num_perm: int, shingle_size: int, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> set[str]:
+        words = text.lower().split()
+        size = min(self.shingle_size, len(words)) or 1
+        return {" ".join(words[idx:idx + size]) for idx in range(max(len(words) - size + 1, 1))}
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)
+        hashes = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self.a) + self.b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        return float(np.mean(left == right))
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash/LSH index of extracted resumes in SQLite. Each document keeps its chunks,
+    how they were routed to sections and its `ResumeDetails`, so a near re-upload can reuse the
+    sections whose chunks did not change. Candidates from the LSH bands are verified against
+    the estimated Jaccard similarity before they count as a match.
+    """
+
+    def __init__(self, path: str, threshold: float, num_perm: int, bands: int, shingle_size: int, ttl: int):
+        if num_perm % bands:
+            raise ValueError("NEAR_DUP_NUM_PERM must be a multiple of NEAR_DUP_BANDS")
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.ttl = ttl
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.stats = {"queries": 0, "hits": 0, "query_seconds_total": 0.0, "adds": 0, "add_seconds_total": 0.0}
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id TEXT PRIMARY KEY, version TEXT NOT NULL, created_at REAL NOT NULL,
+                    signature BLOB NOT NULL, chunks TEXT NOT NULL, classification TEXT, result TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS bands (bucket INTEGER NOT NULL, doc_id TEXT NOT NULL);
+                CREATE INDEX IF NOT EXISTS bands_bucket ON bands (bucket);
+                CREATE INDEX IF NOT EXISTS bands_doc ON bands (doc_id);
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def signature(self, chunks: list[str]) -> np.ndarray:
+        return self.hasher.signature(" ".join(chunks))
+
+    def band_buckets(self, signature: np.ndarray) -> list[int]:
+        buckets = []
+        for band, rows in enumerate(np.split(signature, self.bands)):
+            digest = hashlib.blake2b(band.to_bytes(2, "little") + rows.tobytes(), digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    def add(self, doc_id: str, version: str, chunks: list[str], classification: dict[str, list[int]], result: dict) -> None:
+        started = time.perf_counter()
+        signature = self.signature(chunks)
+        with self._lock:
+            self.conn.execute("DELETE FROM bands WHERE doc_id = ?", (doc_id,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents (doc_id, version, created_at, signature, chunks, classification, result) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (doc_id, version, time.time(), signature.tobytes(), json.dumps(chunks), json.dumps(classification), json.dumps(result)),
+            )
+            self.conn.executemany("INSERT INTO bands (bucket, doc_id) VALUES (?, ?)", [(bucket, doc_id) for bucket in self.band_buckets(signature)])
+            self.conn.commit()
+        elapsed = time.perf_counter() - started
+        self.stats["adds"] += 1
+        self.stats["add_seconds_total"] += elapsed
+        metrics.stage_seconds.observe(elapsed, stage="near_duplicate_add")
+
+    def query(self, chunks: list[str], version: str) -> NearMatch | None:
+        """
+        Returns the most similar stored document of the same pipeline version at or above the threshold.
+        """
+        started = time.perf_counter()
+        signature = self.signature(chunks)
+        buckets = self.band_buckets(signature)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT doc_id, signature, chunks, classification, result, created_at FROM documents WHERE version = ? AND doc_id IN "
+                f"(SELECT DISTINCT doc_id FROM bands WHERE bucket IN ({','.join('?' * len(buckets))}))",
+                (version, *buckets),
+            ).fetchall()
+        best: NearMatch | None = None
+        for doc_id, stored, stored_chunks, classification, result, created_at in rows:
+            if time.time() - created_at > self.ttl:
+                continue
+            similarity = MinHasher.similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = NearMatch(doc_id, similarity, json.loads(stored_chunks), json.loads(classification), json.loads(result))
+        elapsed = time.perf_counter() - started
+        self.stats["queries"] += 1
+        self.stats["hits"] += best is not None
+        self.stats["query_seconds_total"] += elapsed
+        metrics.stage_seconds.observe(elapsed, stage="near_duplicate_query")
+        metrics.events_total.inc(event="near_duplicate", value="hit" if best else "miss")
+        return best
+
+    def dedupe(self, documents: dict[str, list[str]]) -> list[list[str]]:
+        """
+        Groups a batch of documents (name -> cleaned chunks) into near-duplicate clusters, largest first.
+        Uses in-memory LSH over the batch only; the persistent index is not modified.
+        """
+        signatures = {name: self.signature(chunks) for name, chunks in documents.items()}
+        parent = {name: name for name in documents}
+
+        def root(name: str) -> str:
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        buckets: dict[int, list[str]] = {}
+        for name, signature in signatures.items():
+            for bucket in self.band_buckets(signature):
+                for other in buckets.setdefault(bucket, []):
+                    if root(other) != root(name) and MinHasher.similarity(signature, signatures[other]) >= self.threshold:
+                        parent[root(name)] = root(other)
+                buckets[bucket].append(name)
+
+        groups: dict[str, list[str]] = {}
+        for name in documents:
+            groups.setdefault(root(name), []).append(name)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def prune(self) -> int:
+        with self._lock:
+            expired = [row[0] for row in self.conn.execute("SELECT doc_id FROM documents WHERE created_at < ?", (time.time() - self.ttl,))]
+            self.conn.executemany("DELETE FROM bands WHERE doc_id = ?", [(doc_id,) for doc_id in expired])
+            self.conn.executemany("DELETE FROM documents WHERE doc_id = ?", [(doc_id,) for doc_id in expired])
+            self.conn.commit()
+        return len(expired)
+
+    def summary(self) -> dict:
+        with self._lock:
+            documents = self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        queries, adds = self.stats["queries"], self.stats["adds"]
+        return {
+            "documents": documents,
+            "queries": queries,
+            "hit_rate": round(self.stats["hits"] / queries, 3) if queries else 0.0,
+            "avg_query_ms": round(self.stats["query_seconds_total"] / queries * 1000, 2) if queries else 0.0,
+            "avg_add_ms": round(self.stats["add_seconds_total"] / adds * 1000, 2) if adds else 0.0,
+        }
+
+
+def diff_sections(old_chunks: list[str], old_classification: dict[str, list[int]], new_chunks: list[str]) -> tuple[dict[str, list[int]], set[str]]:
+    """
+    Aligns the new chunks with the stored ones. Unchanged chunks keep their sections; edited,
+    inserted or removed chunks mark the sections around them as changed, or every section when
+    they were not routed anywhere. Returns the classification for the new chunks and the
+    sections that need re-extraction.
+    """
+    sections = list(old_classification)
+    old_sections: list[set[str]] = [set() for _ in old_chunks]
+    for section, indexes in old_classification.items():
+        for idx in indexes:
+            if idx < len(old_sections):
+                old_sections[idx].add(section)
+
+    new_sections: list[set[str]] = [set() for _ in new_chunks]
+    changed: set[str] = set()
+    matcher = difflib.SequenceMatcher(a=old_chunks, b=new_chunks, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                new_sections[j1 + offset] = set(old_sections[i1 + offset])
+            continue
+        # Chunks around an insertion tell which sections it most likely belongs to.
+        affected = set().union(*old_sections[max(i1 - (tag == "insert"), 0):max(i2 + (tag == "insert"), i1 + 1)])
+        if not affected:
+            affected = set(sections)
+        changed |= affected
+        for idx in range(j1, j2):
+            new_sections[idx] = set(affected)
+
+    classification = {section: [idx for idx, owners in enumerate(new_sections) if section in owners] for section in sections}
+    return classification, changed
+
+
+index = NearDuplicateIndex(
+    path=os.path.join(env.CACHE_DIR, "near_duplicates.sqlite3"),
+    threshold=env.NEAR_DUP_THRESHOLD,
+    num_perm=env.NEAR_DUP_NUM_PERM,
+    bands=env.NEAR_DUP_BANDS,
+    shingle_size=env.NEAR_DUP_SHINGLE_SIZE,
+    ttl=env.CACHE_TTL_SECONDS,
+)
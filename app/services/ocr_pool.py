@@ -0,0 +1,93 @@
+import io
+import os
+import tempfile
+import multiprocessing
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+from pypdf import PdfReader, PdfWriter
+from app.configs.appconf import env
+
+
+def _ocr_single_page(pdf_bytes: bytes, force: bool = False) -> str:
+    """
+    Runs in a pool process: OCRs a one-page PDF and returns the text of the result. `force`
+    rasterises the page and discards its text layer, which `redo_ocr` would keep as it is.
+    """
+    import ocrmypdf
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, "page.pdf")
+        output_path = os.path.join(tmp_dir, "page_ocr.pdf")
+        with open(input_path, "wb") as f:
+            f.write(pdf_bytes)
+        # jobs=1 keeps each page on a single core; parallelism comes from the pool.
+        mode = {"force_ocr": True} if force else {"redo_ocr": True}
+        ocrmypdf.ocr(input_path, output_path, jobs=1, progress_bar=False, **mode)
+        return PdfReader(output_path).pages[0].extract_text() or ""
+
+
+def _import_ocrmypdf() -> None:
+    import ocrmypdf  # noqa: F401
+
+
+class OcrPool:
+    """
+    Process pool shared by every request in a worker. Pages are OCR'd concurrently and
+    returned in their original order.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def ocr_pages(self, reader: PdfReader, pages: list[int], force: set[int] = frozenset()) -> dict[int, str]:
+        """
+        OCRs `pages`; those in `force` have a garbled text layer that must be replaced, not kept.
+        """
+        payloads = [self._page_bytes(reader, page) for page in pages]
+        results = self.executor.map(_ocr_single_page, payloads, [page in force for page in pages])
+        return dict(zip(pages, results))
+
+    def warm(self) -> None:
+        """
+        Starts every pool process and imports ocrmypdf in it ahead of the first scanned resume.
+        """
+        for future in [self.executor.submit(_import_ocrmypdf) for _ in range(self.size)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    # --- Internal helpers ---
+
+    @staticmethod
+    def _page_bytes(reader: PdfReader, page: int) -> bytes:
+        writer = PdfWriter()
+        writer.add_page(reader.pages[page])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def default_size() -> int:
+        # Split the cores between every OCR-running process on the host so pools do not oversubscribe them.
+        processes = env.OCR_HOST_PROCESSES or env.WEB_CONCURRENCY
+        per_worker = max(1, (os.cpu_count() or 1) // max(1, processes))
+        return max(1, min(env.OCR_POOL_SIZE, per_worker))
+
+
+ocr_pool = OcrPool(OcrPool.default_size())
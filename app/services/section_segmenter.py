@@ -0,0 +1,151 @@
+import re
+import statistics
+from dataclasses import dataclass, field, astuple
+
+# Normalised heading text -> classifier bucket. None marks headings of sections that no
+# extraction schema needs; their content is not routed anywhere.
+HEADING_KEYWORDS: dict[str, str | None] = {
+    **dict.fromkeys([
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history", "professional background", "relevant experience", "internships",
+        "internship", "experience summary", "organisational experience", "organizational experience",
+    ], "JobDetails"),
+    **dict.fromkeys([
+        "education", "educational qualifications", "educational qualification", "academic qualifications",
+        "academic qualification", "academics", "academic background", "educational background", "qualifications",
+        "education and training", "scholastic profile",
+    ], "EducationDetails"),
+    **dict.fromkeys([
+        "projects", "project", "project details", "academic projects", "personal projects", "key projects",
+        "project experience", "projects undertaken", "major projects",
+    ], "ProjectDetails"),
+    **dict.fromkeys([
+        "summary", "professional summary", "profile", "profile summary", "career objective", "objective",
+        "about me", "career summary", "skills", "technical skills", "key skills", "core competencies",
+        "skill set", "skillset", "technical expertise", "areas of expertise", "tools and technologies",
+        "certifications", "certification", "notice period",
+    ], "ProfessionalInfo"),
+    **dict.fromkeys([
+        "personal details", "personal information", "personal profile", "personal data", "contact",
+        "contact details", "contact information",
+    ], "PersonalInfo"),
+    **dict.fromkeys([
+        "hobbies", "interests", "hobbies and interests", "languages", "languages known", "declaration",
+        "references", "achievements", "awards", "awards and achievements", "extracurricular activities",
+        "extra curricular activities", "strengths",
+    ], None),
+}
+BUCKETS = ["PersonalInfo", "EducationDetails", "ProjectDetails", "JobDetails", "ProfessionalInfo"]
+CONTACT_PATTERN = re.compile(r"@|\+?\d[\d\s\-]{8,}\d|linkedin\.com", re.IGNORECASE)
+HEADING_STYLE_PATTERN = re.compile(r"^(heading|title)", re.IGNORECASE)
+BOLD_FONT_PATTERN = re.compile(r"bold|black|heavy|semibold", re.IGNORECASE)
+
+
+@dataclass
+class LayoutLine:
+    text: str
+    font_size: float | None = None
+    bold: bool = False
+    style: str = ""
+
+    def to_list(self) -> list:
+        return list(astuple(self))
+
+
+@dataclass
+class Section:
+    bucket: str | None
+    heading: str
+    confidence: float
+    lines: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+@dataclass
+class Segmentation:
+    sections: list[Section]
+    confidence: float
+
+    def routed_sections(self) -> list[Section]:
+        return [section for section in self.sections if section.bucket and section.text.strip()]
+
+    def classification(self) -> dict[str, list[int]]:
+        """
+        Maps each bucket to the indexes of its sections in `routed_sections`, in the classifier's format.
+        """
+        classified = {bucket: [] for bucket in BUCKETS}
+        for idx, section in enumerate(self.routed_sections()):
+            classified[section.bucket].append(idx)
+        return classified
+
+
+class SectionSegmenter:
+    """
+    Splits resume lines into section-aligned blocks using heading keywords plus layout cues
+    (font size, bold runs, DOCX heading styles, all-caps). Each block carries a confidence so
+    callers can fall back to chunking and classification when the layout is ambiguous.
+    """
+
+    @staticmethod
+    def segment(lines: list[LayoutLine]) -> Segmentation:
+        body_size = SectionSegmenter._body_font_size(lines)
+        header = Section("PersonalInfo", "", 0.0)
+        sections = [header]
+        headings = 0
+
+        for line in lines:
+            text = line.text.strip()
+            if not text:
+                continue
+            heading = SectionSegmenter._match_heading(text)
+            if heading is not None:
+                bucket, confidence = heading
+                confidence += 0.3 if SectionSegmenter._has_layout_cue(line, text, body_size) else 0.0
+                sections.append(Section(bucket, text, round(min(confidence, 1.0), 2)))
+                headings += 1
+            else:
+                sections[-1].lines.append(text)
+
+        header.confidence = 0.9 if CONTACT_PATTERN.search(header.text) else 0.5
+        routed = [section for section in sections if section.bucket and section.text.strip()]
+        if headings < 2 or not routed:
+            return Segmentation(sections, 0.0)
+        return Segmentation(sections, min(section.confidence for section in routed))
+
+    # --- Internal helpers ---
+
+    @staticmethod
+    def _match_heading(text: str) -> tuple[str | None, float] | None:
+        normalised = re.sub(r"[^a-z ]", " ", text.lower().replace("&", " and "))
+        normalised = " ".join(normalised.split())
+        if not normalised or len(normalised.split()) > 5 or len(text) > 48:
+            return None
+        if normalised in HEADING_KEYWORDS:
+            return HEADING_KEYWORDS[normalised], 0.7
+        for keyword, bucket in HEADING_KEYWORDS.items():
+            if normalised.startswith(f"{keyword} ") and len(normalised.split()) <= 4:
+                return bucket, 0.5
+        return None
+
+    @staticmethod
+    def _has_layout_cue(line: LayoutLine, text: str, body_size: float | None) -> bool:
+        if HEADING_STYLE_PATTERN.match(line.style or ""):
+            return True
+        if line.bold:
+            return True
+        if body_size and line.font_size and line.font_size >= body_size * 1.15:
+            return True
+        letters = [ch for ch in text if ch.isalpha()]
+        return bool(letters) and all(ch.isupper() for ch in letters)
+
+    @staticmethod
+    def _body_font_size(lines: list[LayoutLine]) -> float | None:
+        sizes = [line.font_size for line in lines if line.font_size and line.text.strip()]
+        return statistics.median(sizes) if sizes else None
+
+    @staticmethod
+    def is_bold_font(font_name: str) -> bool:
+        return bool(BOLD_FONT_PATTERN.search(font_name or ""))
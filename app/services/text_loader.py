@@ -1,28 +1,149 @@
-from langchain_community.document_loaders import PyPDFLoader, UnstructuredWordDocumentLoader
-import os
-import ocrmypdf
+import io
+import zipfile
+from pypdf import PdfReader
+from app.services.text_quality import TextLayerProbe, PageScore
+from app.services.ocr_pool import ocr_pool
+from app.services.doc_converter import doc_converter, ConverterUnavailable
+from app.endpoints.errors import APIException, DOC_UNSUPPORTED
+from app.services.docx_reader import DocxReader
+from app.services.upload import ResumeUpload
+from app.services.section_segmenter import LayoutLine, SectionSegmenter
+from app.utils.logs import log
+from app.utils.metrics import metrics
 
 class ExtractText:
-    def __init__(self, filepath: str):
-        self.file_path = filepath
+    def __init__(self, source: ResumeUpload):
+        self.source = source
+        self.extraction_path = ""
+        self.page_scores: list[PageScore] = []
+        self.lines: list[LayoutLine] = []
         self.text_content = self.extract()
 
     def extract_pdf(self):
-        ocrmypdf.ocr(self.file_path, self.file_path, redo_ocr = True)
-        document = PyPDFLoader(self.file_path)
-        pages = document.load()
-        text = "\n".join([page.page_content for page in pages])
+        reader = self.source.document if isinstance(self.source.document, PdfReader) else PdfReader(self.source.stream())
+        page_texts, page_lines = [], []
+        for page in reader.pages:
+            collector = _PdfLineCollector()
+            page_texts.append(page.extract_text(visitor_text=collector.visit) or "")
+            page_lines.append(collector.finish())
+        self.page_scores = [
+            TextLayerProbe.score(idx, text, self._has_images(page))
+            for idx, (page, text) in enumerate(zip(reader.pages, page_texts))
+        ]
+
+        ocr_pages = [score.page for score in self.page_scores if score.needs_ocr]
+        if ocr_pages:
+            page_texts = self._ocr_pages(reader, ocr_pages, page_texts)
+            for page in ocr_pages:
+                # OCR output carries no font information, only the text lines.
+                page_lines[page] = [LayoutLine(line) for line in page_texts[page].splitlines()]
+        self.lines = [line for lines in page_lines for line in lines]
+
+        if not ocr_pages:
+            self.extraction_path = "text_layer"
+        elif len(ocr_pages) == len(page_texts):
+            self.extraction_path = "ocr"
+        else:
+            self.extraction_path = "mixed"
+        log.info(
+            f"PDF extraction path={self.extraction_path} ocr_pages={ocr_pages} "
+            f"scores={[score.to_dict() for score in self.page_scores]}"
+        )
+
+        text = "\n".join(page_texts)
         return text
 
     def extract_docx(self):
-        doc = UnstructuredWordDocumentLoader(self.file_path).load()
-        text = "\n".join(page.page_content for page in doc)
+        # Reuse the package opened during validation instead of re-reading the file.
+        package = self.source.document if isinstance(self.source.document, zipfile.ZipFile) else DocxReader.open(self.source.stream())
+        self.lines = DocxReader.read(package)
+        text = "\n".join(line.text for line in self.lines)
+        self.extraction_path = "docx"
+        return text
+
+    def extract_doc(self):
+        with metrics.span("doc_conversion"):
+            try:
+                converted = doc_converter.convert(self.source.read_bytes())
+            except ConverterUnavailable as e:
+                log.error(f"Cannot convert .doc upload: {str(e)}")
+                raise APIException(415, DOC_UNSUPPORTED)
+        self.lines = DocxReader.read(DocxReader.open(io.BytesIO(converted)))
+        text = "\n".join(line.text for line in self.lines)
+        self.extraction_path = "doc"
         return text
 
     def extract(self):
-        ext = os.path.splitext(self.file_path)[-1].lower()
-        match ext:
-            case ".pdf": return self.extract_pdf()
-            case ".docx" | ".doc": return self.extract_docx()
-            case "": return ""
-        return ""
\ No newline at end of file
+        with metrics.span("text_extraction"):
+            match self.source.ext:
+                case "pdf": text = self.extract_pdf()
+                case "docx": text = self.extract_docx()
+                case "doc": text = self.extract_doc()
+                case _: text = ""
+        metrics.events_total.inc(event="extraction_path", value=self.extraction_path)
+        return text
+
+    # --- Internal helpers ---
+
+    def _ocr_pages(self, reader: PdfReader, ocr_pages: list[int], page_texts: list[str]) -> list[str]:
+        """
+        OCRs the pages whose text layer failed the probe in the shared pool and swaps their text in.
+        """
+        garbled = {score.page for score in self.page_scores if score.garbled}
+        with metrics.span("ocr"):
+            ocr_texts = ocr_pool.ocr_pages(reader, ocr_pages, force=garbled)
+        page_texts = list(page_texts)
+        for page, text in ocr_texts.items():
+            page_texts[page] = text
+        return page_texts
+
+    @staticmethod
+    def _has_images(page) -> bool:
+        try:
+            xobjects = page["/Resources"].get_object().get("/XObject")
+            if not xobjects:
+                return False
+            return any(
+                xobject.get_object().get("/Subtype") in ("/Image", "/Form")
+                for xobject in xobjects.get_object().values()
+            )
+        except Exception:
+            # If resources cannot be inspected, assume the page may be scanned.
+            return True
+
+
+class _PdfLineCollector:
+    """
+    pypdf text visitor that rebuilds lines with their largest effective font size and whether
+    every fragment on the line was set in a bold face.
+    """
+
+    def __init__(self):
+        self.lines: list[LayoutLine] = []
+        self._parts: list[str] = []
+        self._size = 0.0
+        self._bold = True
+
+    def visit(self, text, cm, tm, font_dict, font_size) -> None:
+        pieces = text.split("\n")
+        for idx, piece in enumerate(pieces):
+            if idx:
+                self._flush()
+            if piece.strip():
+                scale = abs(tm[3] * cm[3]) if tm and cm else 1.0
+                font_name = font_dict.get("/BaseFont", "") if font_dict else ""
+                self._parts.append(piece)
+                self._size = max(self._size, (font_size or 0.0) * (scale or 1.0))
+                self._bold = self._bold and SectionSegmenter.is_bold_font(str(font_name))
+            elif piece:
+                self._parts.append(piece)
+
+    def finish(self) -> list[LayoutLine]:
+        self._flush()
+        return self.lines
+
+    def _flush(self) -> None:
+        text = "".join(self._parts).strip()
+        if text:
+            self.lines.append(LayoutLine(text, round(self._size, 2) or None, self._bold))
+        self._parts, self._size, self._bold = [], 0.0, True
\ No newline at end of file
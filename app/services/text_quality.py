@@ -0,0 +1,91 @@
+import re
+import unicodedata
+from dataclasses import dataclass, asdict
+from app.configs.appconf import env
+
+GARBAGE_PATTERN = re.compile(r"\(cid:\d+\)|�")
+VOWELS = set("aeiouyAEIOUY")
+
+
+@dataclass
+class PageScore:
+    page: int
+    chars: int
+    printable_ratio: float
+    word_ratio: float
+    garbage_ratio: float
+    has_images: bool
+    score: float
+    needs_ocr: bool
+
+    @property
+    def garbled(self) -> bool:
+        # Enough text to score, but it failed: OCR has to replace the layer rather than keep it.
+        return self.needs_ocr and self.chars >= env.TEXT_LAYER_MIN_CHARS
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class TextLayerProbe:
+    """
+    Scores the embedded text layer of a PDF page so that only pages with a missing
+    or garbled layer are sent to OCR.
+    """
+
+    @staticmethod
+    def score(page: int, text: str, has_images: bool = True) -> PageScore:
+        stripped = "".join(text.split())
+        chars = len(stripped)
+        if chars == 0:
+            return PageScore(page, 0, 0.0, 0.0, 0.0, has_images, 0.0, has_images)
+
+        printable_ratio = sum(1 for ch in stripped if ch.isprintable()) / chars
+        garbage_chars = sum(len(m) for m in GARBAGE_PATTERN.findall(text))
+        garbage_chars += sum(1 for ch in stripped if unicodedata.category(ch) == "Co")
+        garbage_ratio = min(garbage_chars / chars, 1.0)
+        word_ratio = TextLayerProbe._word_ratio(GARBAGE_PATTERN.sub(" ", text))
+
+        score = round(printable_ratio * word_ratio * (1 - garbage_ratio), 4)
+        if chars < env.TEXT_LAYER_MIN_CHARS:
+            # Sparse pages only need OCR when there is an image that may hold the text.
+            needs_ocr = has_images
+        else:
+            needs_ocr = score < env.TEXT_LAYER_MIN_SCORE
+
+        return PageScore(
+            page=page,
+            chars=chars,
+            printable_ratio=round(printable_ratio, 4),
+            word_ratio=round(word_ratio, 4),
+            garbage_ratio=round(garbage_ratio, 4),
+            has_images=has_images,
+            score=score,
+            needs_ocr=needs_ocr,
+        )
+
+    # --- Internal helpers ---
+
+    @staticmethod
+    def _word_ratio(text: str) -> float:
+        tokens = text.split()
+        if not tokens:
+            return 0.0
+        return sum(1 for token in tokens if TextLayerProbe._is_word_like(token)) / len(tokens)
+
+    @staticmethod
+    def _is_word_like(token: str) -> bool:
+        if "@" in token or token.lower().startswith(("http", "www.")):
+            return True
+        core = token.strip("()[]{}<>.,;:!?\"'`*•·-–—|/\\")
+        if not core:
+            # Bullets and separators are normal resume punctuation, not garbage.
+            return len(token) <= 2
+        if any(ch.isdigit() for ch in core):
+            return sum(1 for ch in core if ch.isalnum()) >= len(core) / 2
+        letters = core.replace("-", "").replace("'", "").replace("’", "").replace(".", "").replace("&", "")
+        if not letters.isalpha():
+            return False
+        if not letters.isascii():
+            return True
+        return len(letters) <= 4 or any(ch in VOWELS for ch in letters)
@@ -0,0 +1,128 @@
+import io
+import os
+import shutil
+import hashlib
+import tempfile
+from functools import cached_property
+from typing import Any, BinaryIO
+from app.configs.appconf import env
+
+COPY_BLOCK_BYTES = 1024 * 1024
+
+
+class UploadTooLarge(ValueError):
+    """
+    The upload is larger than the limit it was read with.
+    """
+
+
+class ResumeUpload:
+    """
+    A resume held once for the whole request: in memory, or in a uniquely named temp file when
+    larger than `UPLOAD_SPOOL_BYTES`. Large uploads are streamed to the file rather than read
+    into memory first, so only one copy of the content is ever kept. The document parsed during
+    validation is kept on `document` so extraction can reuse it. Temp files are removed on `close`.
+    """
+
+    def __init__(self, filename: str, ext: str, data: bytes | None = None, path: str | None = None, owns_path: bool = False):
+        self.filename = filename
+        self.ext = ext
+        self.document: Any = None
+        self._data = data
+        self._path = path
+        self._owns_path = owns_path
+        self._handles: list[BinaryIO] = []
+
+    @classmethod
+    def from_bytes(cls, filename: str, ext: str, data: bytes) -> "ResumeUpload":
+        if len(data) <= env.UPLOAD_SPOOL_BYTES:
+            return cls(filename, ext, data=data)
+        fd, path = tempfile.mkstemp(prefix="resume_", suffix=f".{ext}")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return cls(filename, ext, path=path, owns_path=True)
+
+    @classmethod
+    def from_stream(cls, filename: str, ext: str, stream: BinaryIO, limit: int) -> "ResumeUpload":
+        """
+        Copies `stream` in blocks, in memory up to `UPLOAD_SPOOL_BYTES` and into a temp file past
+        that. Raises `UploadTooLarge` once more than `limit` bytes were read.
+        """
+        buffer, file, path, size = io.BytesIO(), None, None, 0
+        try:
+            for block in iter(lambda: stream.read(COPY_BLOCK_BYTES), b""):
+                size += len(block)
+                if size > limit:
+                    raise UploadTooLarge(f"Upload is larger than {limit} bytes")
+                if file is None and size > env.UPLOAD_SPOOL_BYTES:
+                    fd, path = tempfile.mkstemp(prefix="resume_", suffix=f".{ext}")
+                    file = os.fdopen(fd, "wb")
+                    file.write(buffer.getbuffer())
+                    buffer = None
+                (file or buffer).write(block)
+        except BaseException:
+            if file is not None:
+                file.close()
+                os.remove(path)
+            raise
+        if file is None:
+            return cls(filename, ext, data=buffer.getvalue())
+        file.close()
+        return cls(filename, ext, path=path, owns_path=True)
+
+    @classmethod
+    def from_path(cls, path: str, filename: str | None = None) -> "ResumeUpload":
+        ext = os.path.splitext(path)[-1].lower().lstrip(".")
+        return cls(filename or os.path.basename(path), ext, path=path)
+
+    @property
+    def size(self) -> int:
+        return len(self._data) if self._data is not None else os.path.getsize(self._path)
+
+    def stream(self) -> BinaryIO:
+        """
+        Returns a fresh binary stream over the content. Streams are closed with the upload.
+        """
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        handle = open(self._path, "rb")
+        self._handles.append(handle)
+        return handle
+
+    def save(self, path: str) -> None:
+        if self._data is not None:
+            with open(path, "wb") as f:
+                f.write(self._data)
+            return
+        shutil.copyfile(self._path, path)
+
+    def read_bytes(self) -> bytes:
+        if self._data is not None:
+            return self._data
+        with open(self._path, "rb") as f:
+            return f.read()
+
+    @cached_property
+    def sha256(self) -> str:
+        if self._data is not None:
+            return hashlib.sha256(self._data).hexdigest()
+        digest = hashlib.sha256()
+        with open(self._path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        for handle in self._handles:
+            handle.close()
+        self._handles.clear()
+        self.document = None
+        if self._owns_path and self._path and os.path.exists(self._path):
+            os.remove(self._path)
+            self._path = None
+
+    def __enter__(self) -> "ResumeUpload":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,70 @@
+import time
+import asyncio
+from app.configs.appconf import env
+from app.utils.logs import log
+
+
+class Warmup:
+    """
+    Loads the heavy dependencies and models that the enabled features need, once per worker.
+    `/readiness` reports ready only after this has finished.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.error: str | None = None
+        self.timings: dict[str, float] = {}
+
+    async def run(self) -> None:
+        steps = [("bedrock", self._warm_bedrock), ("langchain", self._warm_langchain)]
+        if env.CLASSIFIER_MODE == "embedding":
+            steps.append(("embedding_model", self._warm_embeddings))
+        if env.WARMUP_OCR:
+            steps.append(("ocr_pool", self._warm_ocr))
+        if env.WARMUP_DOC_CONVERTER:
+            steps.append(("doc_converter", self._warm_doc_converter))
+
+        try:
+            for name, step in steps:
+                started = time.perf_counter()
+                await asyncio.to_thread(step)
+                self.timings[name] = round(time.perf_counter() - started, 3)
+            self.ready = True
+            log.info(f"Warm-up finished: {self.timings}")
+        except Exception as e:
+            self.error = str(e)
+            log.error(f"Warm-up failed: {str(e)}")
+
+    # --- Internal helpers ---
+
+    @staticmethod
+    def _warm_bedrock() -> None:
+        from app.llm.clients import bedrock
+
+        bedrock.llm(env.MODEL_SONNET)
+        bedrock.llm(env.MODEL_HAIKU)
+
+    @staticmethod
+    def _warm_langchain() -> None:
+        from langchain_text_splitters import RecursiveCharacterTextSplitter  # noqa: F401
+
+    @staticmethod
+    def _warm_embeddings() -> None:
+        from app.llm.embedding_classifier import get_prototype_matrix
+
+        get_prototype_matrix()
+
+    @staticmethod
+    def _warm_ocr() -> None:
+        from app.services.ocr_pool import ocr_pool
+
+        ocr_pool.warm()
+
+    @staticmethod
+    def _warm_doc_converter() -> None:
+        from app.services.doc_converter import doc_converter
+
+        doc_converter.warm()
+
+
+warmup = Warmup()
@@ -0,0 +1,186 @@
+import time
+import bisect
+from threading import Lock
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from app.configs.appconf import env
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+# Bedrock bills prompt-cache reads and writes relative to the model's input price.
+CACHE_READ_PRICE_FACTOR = 0.1
+CACHE_WRITE_PRICE_FACTOR = 1.25
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_labels(self.labels, key)} {value}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def set(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        with self._lock:
+            self.values[key] = value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_labels(self.labels, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self.series: dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels.get(label, "")) for label in self.labels)
+        with self._lock:
+            counts, total = self.series.setdefault(key, [[0] * (len(self.buckets) + 1), 0.0])
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.series[key][1] = total + value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self.series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), key + (str(bound),))} {cumulative}")
+                cumulative += counts[-1]
+                lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), key + ('+Inf',))} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(self.labels, key)} {total}")
+                lines.append(f"{self.name}_count{_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{str(value).replace(chr(34), chr(39))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class RequestTrace:
+    """
+    Per-request list of (stage, seconds) spans, shared by every task and thread the request spawns.
+    """
+
+    def __init__(self):
+        self.spans: list[tuple[str, float]] = []
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{stage.replace(':', '_')};dur={seconds * 1000:.1f}" for stage, seconds in self.spans)
+
+
+class Metrics:
+    """
+    In-process metrics registry rendered in the Prometheus text format on `/metrics`.
+    Values are per worker process; no external collector is needed.
+    """
+
+    def __init__(self):
+        self.trace: ContextVar[RequestTrace | None] = ContextVar("resume_parser_trace", default=None)
+        self.request_seconds = Histogram("resume_parser_request_seconds", "End-to-end request latency.", ("path", "status"))
+        self.stage_seconds = Histogram("resume_parser_stage_seconds", "Latency of each pipeline stage.", ("stage",))
+        self.llm_call_seconds = Histogram("resume_parser_llm_call_seconds", "Latency of each model call.", ("model", "section"))
+        self.llm_queue_seconds = Histogram("resume_parser_llm_queue_seconds", "Time model calls waited in the rate limiter.", ("model",))
+        self.llm_input_tokens = Histogram("resume_parser_llm_input_tokens", "Input tokens per model call.", ("model", "section"), TOKEN_BUCKETS)
+        self.llm_output_tokens = Histogram("resume_parser_llm_output_tokens", "Output tokens per model call.", ("model", "section"), TOKEN_BUCKETS)
+        self.llm_tokens_total = Counter("resume_parser_llm_tokens_total", "Tokens consumed by model and direction.", ("model", "direction"))
+        self.llm_cost_usd_total = Counter("resume_parser_llm_cost_usd_total", "Estimated model spend in USD.", ("model",))
+        self.llm_throttled_total = Counter("resume_parser_llm_throttled_total", "Throttled model calls.", ("model",))
+        self.events_total = Counter("resume_parser_events_total", "Pipeline events such as cache hits or chosen paths.", ("event", "value"))
+        self.near_duplicate_documents = Gauge("resume_parser_near_duplicate_documents", "Resumes stored in the near-duplicate index.")
+        self.collectors = [
+            self.request_seconds, self.stage_seconds, self.llm_call_seconds, self.llm_queue_seconds,
+            self.llm_input_tokens, self.llm_output_tokens, self.llm_tokens_total, self.llm_cost_usd_total,
+            self.llm_throttled_total, self.events_total, self.near_duplicate_documents,
+        ]
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stage_seconds.observe(elapsed, stage=stage)
+            trace = self.trace.get()
+            if trace is not None:
+                trace.spans.append((stage, elapsed))
+
+    def record_llm_call(self, model_id: str, section: str, elapsed: float, response) -> None:
+        self.llm_call_seconds.observe(elapsed, model=model_id, section=section)
+        usage = getattr(response, "usage_metadata", None) or {}
+        if not usage:
+            # Raw Anthropic usage reports cached prompt tokens separately from input_tokens.
+            raw = (getattr(response, "response_metadata", None) or {}).get("usage", {})
+            cache_read, cache_write = raw.get("cache_read_input_tokens", 0) or 0, raw.get("cache_creation_input_tokens", 0) or 0
+            usage = {"input_tokens": (raw.get("prompt_tokens", raw.get("input_tokens", 0)) or 0) + cache_read + cache_write,
+                     "output_tokens": raw.get("completion_tokens", raw.get("output_tokens", 0)),
+                     "input_token_details": {"cache_read": cache_read, "cache_creation": cache_write}}
+        input_tokens, output_tokens = usage.get("input_tokens", 0) or 0, usage.get("output_tokens", 0) or 0
+        details = usage.get("input_token_details") or {}
+        cache_read, cache_write = details.get("cache_read", 0) or 0, details.get("cache_creation", 0) or 0
+        self.llm_input_tokens.observe(input_tokens, model=model_id, section=section)
+        self.llm_output_tokens.observe(output_tokens, model=model_id, section=section)
+        self.llm_tokens_total.inc(input_tokens, model=model_id, direction="input")
+        self.llm_tokens_total.inc(output_tokens, model=model_id, direction="output")
+        self.llm_tokens_total.inc(cache_read, model=model_id, direction="cache_read")
+        self.llm_tokens_total.inc(cache_write, model=model_id, direction="cache_write")
+        cost = self.estimate_cost(model_id, input_tokens, output_tokens, cache_read, cache_write)
+        self.llm_cost_usd_total.inc(cost, model=model_id)
+
+    @staticmethod
+    def estimate_cost(model_id: str, input_tokens: int, output_tokens: int, cache_read: int = 0, cache_write: int = 0) -> float:
+        """
+        `input_tokens` includes the cached prompt tokens; those are billed at the cache read/write rates.
+        """
+        for family, (input_price, output_price) in env.MODEL_PRICES_PER_MTOK.items():
+            if family in model_id.lower():
+                uncached = max(input_tokens - cache_read - cache_write, 0)
+                input_cost = input_price * (uncached + cache_read * CACHE_READ_PRICE_FACTOR + cache_write * CACHE_WRITE_PRICE_FACTOR)
+                return (input_cost + output_tokens * output_price) / 1_000_000
+        return 0.0
+
+    def render(self) -> str:
+        lines = []
+        for collector in self.collectors:
+            lines.extend(collector.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
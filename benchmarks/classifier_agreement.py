@@ -0,0 +1,87 @@
+"""
+Offline agreement benchmark between the embedding and the LLM chunk classifiers.
+
+Record LLM labels once (needs Bedrock access):
+    python -m benchmarks.classifier_agreement record resumes/*.pdf --labels labels.jsonl
+
+Compare the embedding classifier against the recorded labels (fully offline):
+    python -m benchmarks.classifier_agreement compare --labels labels.jsonl
+"""
+import sys
+import json
+import time
+import argparse
+from app.llm.tools.classifier_tool import ClassifierInputSchema
+from app.llm.embedding_classifier import EmbeddingClassifier, get_prototype_matrix
+
+SECTIONS = list(ClassifierInputSchema.model_fields)
+
+
+def record(paths: list[str], labels_path: str) -> None:
+    from app.llm.resume_parser import ResumeParser
+    from app.llm.chunk_classifier import ChunkClassifier
+    from app.services.upload import ResumeUpload
+
+    with open(labels_path, "a", encoding="utf-8") as f:
+        for path in paths:
+            with ResumeUpload.from_path(path) as upload:
+                chunks = ResumeParser(upload, use_cache=False).serialized_chunks
+            labels = ChunkClassifier(chunks).classify()
+            f.write(json.dumps({"file": path, "chunks": list(chunks.values()), "labels": labels}) + "\n")
+            print(f"recorded {path}: {len(chunks)} chunks")
+
+
+def compare(labels_path: str) -> dict:
+    with open(labels_path, encoding="utf-8") as f:
+        samples = [json.loads(line) for line in f if line.strip()]
+
+    get_prototype_matrix()
+    counts = {section: {"tp": 0, "fp": 0, "fn": 0} for section in SECTIONS}
+    exact, fallbacks, elapsed = 0, 0, []
+
+    for sample in samples:
+        chunks = dict(enumerate(sample["chunks"]))
+        start = time.perf_counter()
+        predicted, confident = EmbeddingClassifier(chunks).classify_with_confidence()
+        elapsed.append(time.perf_counter() - start)
+        fallbacks += not confident
+
+        matches = True
+        for section in SECTIONS:
+            expected, got = set(sample["labels"].get(section, [])), set(predicted[section])
+            counts[section]["tp"] += len(expected & got)
+            counts[section]["fp"] += len(got - expected)
+            counts[section]["fn"] += len(expected - got)
+            matches &= expected == got
+        exact += matches
+
+    report = {"samples": len(samples), "sections": {}}
+    for section, c in counts.items():
+        precision = c["tp"] / max(c["tp"] + c["fp"], 1)
+        recall = c["tp"] / max(c["tp"] + c["fn"], 1)
+        f1 = 2 * precision * recall / max(precision + recall, 1e-12)
+        report["sections"][section] = {"precision": round(precision, 3), "recall": round(recall, 3), "f1": round(f1, 3)}
+    if samples:
+        elapsed.sort()
+        report["exact_match_rate"] = round(exact / len(samples), 3)
+        report["llm_fallback_rate"] = round(fallbacks / len(samples), 3)
+        report["p50_ms"] = round(elapsed[len(elapsed) // 2] * 1000, 2)
+        report["max_ms"] = round(elapsed[-1] * 1000, 2)
+    return report
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["record", "compare"])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--labels", default="benchmarks/classifier_labels.jsonl")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.files, args.labels)
+    else:
+        print(json.dumps(compare(args.labels), indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,180 @@
+"""
+Synthetic resume corpus for the offline benchmarks: born-digital PDFs, scanned (image-only)
+PDFs, DOCX files and long multi-page PDFs, generated deterministically from a seed.
+"""
+import io
+import random
+from dataclasses import dataclass
+
+FIRST_NAMES = ["Aarav", "Priya", "Rahul", "Sneha", "Vikram", "Ananya", "Karthik", "Meera", "Arjun", "Divya"]
+LAST_NAMES = ["Sharma", "Iyer", "Reddy", "Nair", "Gupta", "Menon", "Kumar", "Das", "Rao", "Pillai"]
+COMPANIES = ["Acme Systems", "Globex Technologies", "Initech Labs", "Umbrella Analytics", "Stark Digital", "Wayne Software"]
+ROLES = ["Software Engineer", "Senior Developer", "Data Analyst", "Backend Engineer", "QA Engineer", "DevOps Engineer"]
+SKILLS = ["Python", "Java", "SQL", "AWS", "Docker", "Kubernetes", "FastAPI", "React", "Spark", "Terraform", "Git", "Linux"]
+DUTIES = [
+    "Owned the design reviews, on-call rotation and capacity planning for the team's customer-facing APIs.",
+    "Cut p95 latency of the order pipeline by profiling hot paths and moving batch work to async queues.",
+    "Mentored new engineers, wrote the onboarding runbooks and led the migration to infrastructure as code.",
+    "Worked with product and support to triage incidents, write postmortems and ship the follow-up fixes.",
+    "Introduced contract tests and canary releases, which halved the number of rollbacks per quarter.",
+    "Built dashboards and alerts for throughput, error rates and cost so regressions were caught before release.",
+]
+DEGREES = [("B.Tech", "Computer Science"), ("M.Tech", "Software Systems"), ("BSc", "Mathematics"), ("MBA", "Finance")]
+COLLEGES = ["National Institute of Technology", "State Engineering College", "City University", "Institute of Management"]
+
+
+@dataclass
+class SyntheticResume:
+    name: str
+    kind: str
+    filename: str
+    content: bytes
+    sections: dict[str, list[str]]
+
+
+def resume_sections(rng: random.Random, jobs: int = 3, projects: int = 3, duties: int = 0) -> dict[str, list[str]]:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    sections = {
+        "": [
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}@example.com | +91 9{rng.randint(100000000, 999999999)}",
+            f"linkedin.com/in/{first.lower()}-{last.lower()}",
+        ],
+        "PROFESSIONAL SUMMARY": [
+            f"{rng.choice(ROLES)} with {rng.randint(2, 12)} years of experience building reliable services.",
+        ],
+        "SKILLS": [", ".join(rng.sample(SKILLS, 6))],
+        "WORK EXPERIENCE": [],
+        "PROJECTS": [],
+        "EDUCATION": [],
+    }
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 4)
+        sections["WORK EXPERIENCE"] += [
+            f"{rng.choice(ROLES)} - {rng.choice(COMPANIES)}, Bengaluru",
+            f"{start}-0{rng.randint(1, 9)} to {year}-0{rng.randint(1, 9)}",
+            f"Built and operated services using {', '.join(rng.sample(SKILLS, 3))}.",
+            *rng.sample(DUTIES, duties),
+        ]
+        year = start
+    for idx in range(projects):
+        sections["PROJECTS"] += [
+            f"Project {idx + 1}: {rng.choice(['Billing', 'Search', 'Analytics', 'Onboarding'])} Platform",
+            f"Role: {rng.choice(ROLES)}. Delivered features with {', '.join(rng.sample(SKILLS, 3))}.",
+        ]
+    degree, specialization = rng.choice(DEGREES)
+    sections["EDUCATION"] += [f"{degree} in {specialization}, {rng.choice(COLLEGES)}, {year - 1}, CGPA 8.{rng.randint(0, 9)}"]
+    return sections
+
+
+def _lines(sections: dict[str, list[str]]) -> list[tuple[str, bool]]:
+    lines = []
+    for heading, body in sections.items():
+        if heading:
+            lines.append((heading, True))
+        lines.extend((line, False) for line in body)
+    return lines
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(sections: dict[str, list[str]]) -> bytes:
+    """
+    Writes a minimal born-digital PDF with a real text layer (Helvetica / Helvetica-Bold),
+    starting a new A4 page whenever the current one is full.
+    """
+    pages, ops, y = [], ["BT"], 800
+    for text, heading in _lines(sections):
+        if y < 60:
+            pages.append(ops + ["ET"])
+            ops, y = ["BT"], 800
+        ops.append(f"/{'F2 13' if heading else 'F1 10'} Tf 1 0 0 1 50 {y} Tm ({_escape(text)}) Tj")
+        y -= 20 if heading else 14
+    pages.append(ops + ["ET"])
+
+    # 1 catalog, 2 page tree, 3-4 fonts, then a page and its content stream per page.
+    kids = " ".join(f"{5 + 2 * idx} 0 R" for idx in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>",
+    ]
+    for idx, page_ops in enumerate(pages):
+        stream = "\n".join(page_ops).encode("latin-1", "replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {6 + 2 * idx} 0 R "
+            f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream")
+    buffer = io.BytesIO()
+    buffer.write(b"%PDF-1.4\n")
+    offsets = []
+    for idx, body in enumerate(objects, start=1):
+        offsets.append(buffer.tell())
+        buffer.write(f"{idx} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref = buffer.tell()
+    buffer.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        buffer.write(f"{offset:010d} 00000 n \n".encode())
+    buffer.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return buffer.getvalue()
+
+
+def build_scanned_pdf(sections: dict[str, list[str]]) -> bytes:
+    """
+    Renders the resume to an image and wraps it in a PDF with no text layer, like a scan.
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    image = Image.new("L", (1240, 1754), 255)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+    y = 80
+    for text, heading in _lines(sections):
+        draw.text((100, y), text, fill=0, font=font)
+        y += 44 if heading else 32
+    buffer = io.BytesIO()
+    image.save(buffer, format="PDF", resolution=150)
+    return buffer.getvalue()
+
+
+def build_docx(sections: dict[str, list[str]]) -> bytes:
+    from docx import Document
+
+    document = Document()
+    for heading, body in sections.items():
+        if heading:
+            document.add_heading(heading.title(), level=1)
+        for line in body:
+            document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+BUILDERS = {
+    "digital": ("pdf", build_pdf),
+    "scanned": ("pdf", build_scanned_pdf),
+    "docx": ("docx", build_docx),
+    "long": ("pdf", build_pdf),
+}
+
+
+def generate(kinds: list[str], per_kind: int, seed: int = 7) -> list[SyntheticResume]:
+    rng = random.Random(seed)
+    corpus = []
+    for kind in kinds:
+        ext, builder = BUILDERS[kind]
+        for idx in range(per_kind):
+            if kind == "long":
+                # Past PLANNER_SINGLE_MAX_TOKENS, so these go through broadcast or fan-out.
+                sections = resume_sections(rng, jobs=rng.randint(10, 14), projects=rng.randint(6, 10), duties=4)
+            else:
+                sections = resume_sections(rng, jobs=rng.randint(1, 4), projects=rng.randint(1, 4))
+            name = f"{kind}-{idx}"
+            corpus.append(SyntheticResume(name, kind, f"{name}.{ext}", builder(sections), sections))
+    return corpus
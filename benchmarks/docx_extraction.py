@@ -0,0 +1,100 @@
+"""
+DOCX text extraction benchmark on the synthetic corpus: the streaming `DocxReader` against the
+python-docx walk it replaced and, when installed, LangChain's `UnstructuredWordDocumentLoader`.
+Reports p50/p95 per document, the speedup over each alternative and whether `DocxReader`
+produced the same lines as the python-docx walk.
+
+    python -m benchmarks.docx_extraction --documents 200
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+
+def python_docx_lines(content: bytes) -> list[tuple[str, bool, str]]:
+    from docx import Document
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    document = Document(io.BytesIO(content))
+    lines = []
+    for element in document.element.body.iterchildren():
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag == "p":
+            paragraph = Paragraph(element, document)
+            runs = [run for run in paragraph.runs if run.text.strip()]
+            lines.append((paragraph.text, bool(runs) and all(run.bold for run in runs), paragraph.style.name if paragraph.style is not None else ""))
+        elif tag == "tbl":
+            for row in Table(element, document).rows:
+                cells = []
+                for cell in row.cells:
+                    if cell.text not in cells:
+                        cells.append(cell.text)
+                lines.append((" | ".join(cells), False, ""))
+    return [line for line in lines if line[0].strip()]
+
+
+def docx_reader_lines(content: bytes) -> list[tuple[str, bool, str]]:
+    from app.services.docx_reader import DocxReader
+
+    return [(line.text, line.bold, line.style) for line in DocxReader.read(DocxReader.open(io.BytesIO(content)))]
+
+
+def unstructured_text(content: bytes) -> str:
+    from langchain_community.document_loaders import UnstructuredWordDocumentLoader
+
+    with tempfile.NamedTemporaryFile(suffix=".docx") as f:
+        f.write(content)
+        f.flush()
+        return "\n".join(document.page_content for document in UnstructuredWordDocumentLoader(f.name).load())
+
+
+def timed(extractor, documents: list[bytes], repeat: int) -> list[float]:
+    latencies = []
+    for _ in range(repeat):
+        for content in documents:
+            started = time.perf_counter()
+            extractor(content)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    from benchmarks.pipeline import BENCHMARK_ENV, percentile
+    for key, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(key, value)
+
+    from benchmarks.corpus import generate
+
+    documents = [resume.content for resume in generate(["docx"], args.documents, args.seed)]
+    extractors = {"docx_reader": docx_reader_lines, "python_docx": python_docx_lines}
+    try:
+        unstructured_text(documents[0])
+        extractors["unstructured"] = unstructured_text
+    except ImportError:
+        print("unstructured is not installed; skipping UnstructuredWordDocumentLoader", file=sys.stderr)
+
+    report = {"documents": args.documents, "repeat": args.repeat, "ms": {}, "speedup_p50": {}}
+    for name, extractor in extractors.items():
+        latencies = timed(extractor, documents, args.repeat)
+        report["ms"][name] = {f"p{pct}": round(percentile(latencies, pct) * 1000, 3) for pct in (50, 95)}
+    for name in extractors:
+        if name != "docx_reader":
+            report["speedup_p50"][name] = round(report["ms"][name]["p50"] / max(report["ms"]["docx_reader"]["p50"], 1e-6), 1)
+    report["same_lines_as_python_docx"] = all(docx_reader_lines(content) == python_docx_lines(content) for content in documents)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
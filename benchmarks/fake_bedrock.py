@@ -0,0 +1,141 @@
+"""
+Local stand-in for `ChatBedrock` used by the offline benchmarks. It answers with canned JSON
+shaped by the schema in the prompt, sleeps for a sampled latency and can inject throttling
+and malformed responses, so the whole pipeline runs without AWS. Like `ChatBedrock`, it only
+implements the blocking `_generate`, so each call holds a thread for its whole latency.
+"""
+import re
+import json
+import time
+import random
+from dataclasses import dataclass
+from typing import Any
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+SCHEMA_PATTERN = re.compile(r"```\s*(\{.*\})\s*```", re.DOTALL)
+CHUNK_ID_PATTERN = re.compile(r"(?:^|[{,]\s*)(\d+):\s*['\"]")
+CLASSIFIER_BUCKETS = ["PersonalInfo", "EducationDetails", "ProjectDetails", "JobDetails", "ProfessionalInfo"]
+
+CANNED_FIELDS: dict[str, Any] = {
+    "skills": ["Python", "SQL", "AWS", "Docker"],
+    "experienceYears": "6",
+    "noticePeriod": "30 days",
+    "summary": "Backend engineer focused on reliable data services.",
+    "education": [{
+        "specialization": "Computer Science", "degree": "B.Tech", "qualification": "Bachelors",
+        "percentageMarksOrGrade": "8.4 CGPA", "modeOfEducation": "Full-time", "yearOfPassing": "2016",
+        "college": "State Engineering College", "university": "State University",
+    }],
+    "projects": [{
+        "companyName": "Acme Systems", "projectTitle": "Billing Platform", "fromDate": "2021-04", "toDate": "2022-09",
+        "role": "Backend Engineer", "projectDescription": "Rebuilt invoicing on event-driven services.",
+        "client": "Acme Systems", "skills": ["Python", "Kafka"],
+    }],
+    "jobs": [{
+        "companyName": "Acme Systems", "designation": "Software Engineer", "fromDate": "2019-07", "toDate": "Present",
+        "isCurrentlyWorking": True, "reportingTo": "NA", "location": "Bengaluru", "skills": ["Python", "AWS"],
+    }],
+    "firstName": "Priya", "middleName": "NA", "lastName": "Sharma", "primaryEmail": "priya.sharma@example.com",
+    "linkedinUrl": "linkedin.com/in/priya-sharma", "countryCode": "+91", "phoneNumber": "9876543210",
+    "dob": "NA", "latestJobDesignation": "Software Engineer", "gender": "NA", "city": "Bengaluru",
+    "state": "Karnataka", "nativeLocation": "NA", "marriageStatus": "NA",
+}
+
+
+class FakeThrottlingException(Exception):
+    def __init__(self):
+        super().__init__("ThrottlingException: Rate exceeded (injected)")
+
+
+@dataclass
+class FakeProfile:
+    """
+    Latency is log-normal around `median_ms` with shape `sigma`; haiku-class models run at
+    `fast_factor` of that. Rates are per call.
+    """
+    median_ms: float = 800.0
+    sigma: float = 0.35
+    fast_factor: float = 0.4
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    seed: int | None = None
+
+
+def canned_response(prompt: str) -> dict:
+    """
+    Builds the JSON a well-behaved model would return for the classifier or extraction prompt.
+    """
+    match = SCHEMA_PATTERN.search(prompt)
+    schema = json.loads(match.group(1)) if match else {}
+    properties = list(schema.get("properties", {}))
+    if set(properties) & set(CLASSIFIER_BUCKETS):
+        chunk_ids = sorted({int(idx) for idx in CHUNK_ID_PATTERN.findall(prompt)})
+        return {bucket: chunk_ids for bucket in CLASSIFIER_BUCKETS}
+    return {name: CANNED_FIELDS[name] for name in properties if name in CANNED_FIELDS}
+
+
+def _text(message: BaseMessage) -> str:
+    # System prompts arrive as content blocks carrying cache_control markers.
+    if isinstance(message.content, str):
+        return message.content
+    return "\n".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in message.content)
+
+
+class FakeChatBedrock(BaseChatModel):
+    model_id: str
+    profile: FakeProfile
+    rng: Any = None
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-bedrock"
+
+    def _latency(self) -> float:
+        rng = self.rng or random
+        scale = self.profile.fast_factor if "haiku" in self.model_id.lower() else 1.0
+        return rng.lognormvariate(0, self.profile.sigma) * self.profile.median_ms * scale / 1000
+
+    def _respond(self, messages: list[BaseMessage]) -> ChatResult:
+        rng = self.rng or random
+        self.calls += 1
+        if rng.random() < self.profile.throttle_rate:
+            raise FakeThrottlingException()
+        prefill = _text(messages[-1]) if isinstance(messages[-1], AIMessage) else ""
+        prompt = "\n".join(_text(message) for message in messages)
+        content = json.dumps(canned_response(prompt))
+        if prefill and content.startswith(prefill):
+            # Assistant prefill: continue the document from where the previous response stopped.
+            content = content[len(prefill):]
+        elif rng.random() < self.profile.error_rate:
+            content = "Here is the JSON you asked for: " + content[: len(content) // 2]
+        message = AIMessage(content=content, usage_metadata={
+            "input_tokens": len(prompt) // 4,
+            "output_tokens": len(content) // 4,
+            "total_tokens": (len(prompt) + len(content)) // 4,
+        })
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: list[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self._latency())
+        return self._respond(messages)
+
+
+def install(profile: FakeProfile) -> dict[str, FakeChatBedrock]:
+    """
+    Routes every `bedrock.llm(...)` lookup to a fake model. Returns the created fakes by model id.
+    """
+    from app.llm.clients import bedrock
+
+    rng = random.Random(profile.seed) if profile.seed is not None else None
+    fakes: dict[str, FakeChatBedrock] = {}
+
+    def llm(model_id: str, temperature: float = 0.2, max_tokens: int = 3000) -> FakeChatBedrock:
+        if model_id not in fakes:
+            fakes[model_id] = FakeChatBedrock(model_id=model_id, profile=profile, rng=rng)
+        return fakes[model_id]
+
+    bedrock.llm = llm
+    return fakes
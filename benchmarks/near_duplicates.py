@@ -0,0 +1,88 @@
+"""
+Near-duplicate index benchmark on synthetic resumes: index build time, query latency, hit rate
+on edited copies (new phone number, reordered skills, a re-export with identical text), false
+positives on unrelated resumes, and batch deduplication.
+
+    python -m benchmarks.near_duplicates --documents 2000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+
+def chunks_of(sections: dict[str, list[str]]) -> list[str]:
+    return [" ".join(f"{heading} {' '.join(lines)}".split()) for heading, lines in sections.items()]
+
+
+def variants(sections: dict[str, list[str]], rng: random.Random) -> dict[str, dict[str, list[str]]]:
+    phone = {**sections, "": [sections[""][0], f"new.mail@example.com | +91 8{rng.randint(100000000, 999999999)}", *sections[""][2:]]}
+    skills = sections["SKILLS"][0].split(", ")
+    rng.shuffle(skills)
+    return {"reexport": dict(sections), "phone": phone, "skills": {**sections, "SKILLS": [", ".join(skills)]}}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    from benchmarks.pipeline import BENCHMARK_ENV
+    for key, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(key, value)
+
+    from app.configs.appconf import env
+    from app.services.near_duplicates import NearDuplicateIndex
+    from benchmarks.corpus import resume_sections
+
+    rng = random.Random(args.seed)
+    documents = [resume_sections(rng, jobs=rng.randint(1, 5), projects=rng.randint(1, 5)) for _ in range(args.documents)]
+    path = os.path.join(tempfile.mkdtemp(prefix="resume_parser_near_dup_"), "index.sqlite3")
+    index = NearDuplicateIndex(path, env.NEAR_DUP_THRESHOLD, env.NEAR_DUP_NUM_PERM, env.NEAR_DUP_BANDS, env.NEAR_DUP_SHINGLE_SIZE, env.CACHE_TTL_SECONDS)
+
+    started = time.perf_counter()
+    for idx, sections in enumerate(documents):
+        index.add(f"doc-{idx}", "bench", chunks_of(sections), {}, {"firstName": sections[""][0]})
+    build_seconds = time.perf_counter() - started
+
+    report = {"documents": args.documents, "build_seconds": round(build_seconds, 3), "hit_rate": {}, "query_ms": {}}
+    sample = rng.sample(range(args.documents), min(args.queries, args.documents))
+    latencies = []
+    for kind in ("reexport", "phone", "skills"):
+        hits = 0
+        for idx in sample:
+            query_started = time.perf_counter()
+            match = index.query(chunks_of(variants(documents[idx], rng)[kind]), "bench")
+            latencies.append(time.perf_counter() - query_started)
+            hits += match is not None and match.doc_id == f"doc-{idx}"
+        report["hit_rate"][kind] = round(hits / len(sample), 3)
+
+    unrelated = [resume_sections(rng) for _ in range(len(sample))]
+    false_positives = sum(index.query(chunks_of(sections), "bench") is not None for sections in unrelated)
+    report["false_positive_rate"] = round(false_positives / len(unrelated), 3)
+
+    latencies.sort()
+    report["query_ms"] = {f"p{pct}": round(latencies[min(int(len(latencies) * pct / 100), len(latencies) - 1)] * 1000, 3) for pct in (50, 95, 99)}
+
+    batch = {f"doc-{idx}": chunks_of(documents[idx]) for idx in sample}
+    batch.update({f"doc-{idx}-phone": chunks_of(variants(documents[idx], rng)["phone"]) for idx in sample})
+    started = time.perf_counter()
+    groups = index.dedupe(batch)
+    report["batch_dedupe"] = {
+        "documents": len(batch),
+        "groups": len(groups),
+        "duplicate_groups": sum(len(group) > 1 for group in groups),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    report["index"] = index.summary()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,205 @@
+"""
+End-to-end pipeline benchmark through the FastAPI app with a fake Bedrock, fully offline.
+Sends a synthetic corpus (born-digital PDFs, scanned PDFs, DOCX, long multi-page PDFs) to
+`/parse_resume` at several concurrency levels and reports throughput plus p50/p95/p99 latency
+end to end and per stage (stage timings come from the `Server-Timing` header). Every level runs
+once per `--strategies` entry; `fanout` forces classification and per-section calls even on
+short resumes.
+
+    python -m benchmarks.pipeline --concurrency 1 4 16 --requests 48
+    python -m benchmarks.pipeline --strategies auto single broadcast fanout
+    python -m benchmarks.pipeline --kinds digital docx --throttle-rate 0.05 --error-rate 0.02
+    python -m benchmarks.pipeline --save benchmarks/baselines/pipeline.json
+    python -m benchmarks.pipeline --compare benchmarks/baselines/pipeline.json
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from collections import Counter, defaultdict
+
+# The app reads its settings at import time; the fake never talks to AWS and the limiter
+# must not be what the benchmark measures unless asked to.
+BENCHMARK_ENV = {
+    "AWS_ACCESS_KEY_ID": "benchmark",
+    "AWS_SECRET_ACCESS_KEY": "benchmark",
+    "AWS_REGION_NAME": "us-east-1",
+    "MODEL_SONNET": "anthropic.claude-sonnet-fake",
+    "MODEL_HAIKU": "anthropic.claude-haiku-fake",
+    "MODEL_DEEPSEEK": "deepseek-fake",
+    "CACHE_ENABLED": "false",
+    "WARMUP_OCR": "false",
+    "LIMITER_STATE_DIR": tempfile.mkdtemp(prefix="resume_parser_bench_limiter_"),
+    "JOB_DIR": tempfile.mkdtemp(prefix="resume_parser_bench_jobs_"),
+}
+UNLIMITED_RPS = {"BEDROCK_RPS_SONNET": "1000", "BEDROCK_RPS_HAIKU": "1000", "BEDROCK_RPS_DEFAULT": "1000", "BEDROCK_BURST": "1000"}
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> dict:
+    return {f"p{pct}_ms": round(percentile(values, pct) * 1000, 1) for pct in PERCENTILES}
+
+
+def parse_server_timing(header: str) -> dict[str, float]:
+    stages: dict[str, float] = defaultdict(float)
+    for entry in filter(None, (part.strip() for part in header.split(","))):
+        name, _, duration = entry.partition(";dur=")
+        if duration:
+            stages[name] += float(duration) / 1000
+    return stages
+
+
+async def send(client, resume) -> tuple[int, float, dict[str, float]]:
+    started = time.perf_counter()
+    response = await client.post(
+        "/parse_resume",
+        files={"resume": (resume.filename, resume.content)},
+        headers={"Cache-Control": "no-store", "X-Timing": "true"},
+    )
+    elapsed = time.perf_counter() - started
+    return response.status_code, elapsed, parse_server_timing(response.headers.get("server-timing", ""))
+
+
+async def run_level(client, corpus: list, requests: int, concurrency: int, strategy: str) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = []
+
+    async def one(resume):
+        async with semaphore:
+            samples.append((resume.kind, *await send(client, resume)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(corpus[idx % len(corpus)]) for idx in range(requests)))
+    wall = time.perf_counter() - started
+
+    ok = [sample for sample in samples if sample[1] == 200]
+    stages: dict[str, list[float]] = defaultdict(list)
+    by_kind: dict[str, list[float]] = defaultdict(list)
+    for kind, _, elapsed, timings in ok:
+        by_kind[kind].append(elapsed)
+        for stage, seconds in timings.items():
+            stages[stage].append(seconds)
+    return {
+        "strategy": strategy,
+        "concurrency": concurrency,
+        "requests": requests,
+        "throughput_rps": round(len(ok) / wall, 2),
+        "status_codes": dict(Counter(str(sample[1]) for sample in samples)),
+        "end_to_end": summarize([sample[2] for sample in ok]),
+        "by_kind": {kind: summarize(values) for kind, values in sorted(by_kind.items())},
+        "stages": {stage: summarize(values) for stage, values in sorted(stages.items())},
+    }
+
+
+async def benchmark(args) -> dict:
+    import httpx
+    from benchmarks.corpus import generate
+    from benchmarks.fake_bedrock import FakeProfile, install
+    from app.main import app
+    from app.configs.appconf import env
+    from app.services.ocr_pool import ocr_pool
+
+    profile = FakeProfile(args.latency_ms, args.sigma, throttle_rate=args.throttle_rate, error_rate=args.error_rate, seed=args.seed)
+    fakes = install(profile)
+    corpus = generate(args.kinds, args.per_kind, seed=args.seed)
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            # One untimed pass per document kind so lazy imports and the OCR pool are warm.
+            for kind in args.kinds:
+                await send(client, next(resume for resume in corpus if resume.kind == kind))
+            levels = []
+            for strategy in args.strategies:
+                env.EXTRACTION_STRATEGY = strategy
+                levels += [await run_level(client, corpus, args.requests, level, strategy) for level in args.concurrency]
+    finally:
+        ocr_pool.shutdown()
+
+    return {
+        "config": {
+            "kinds": args.kinds, "per_kind": args.per_kind, "latency_ms": args.latency_ms, "sigma": args.sigma,
+            "throttle_rate": args.throttle_rate, "error_rate": args.error_rate, "rate_limited": args.rate_limited,
+            "strategies": args.strategies,
+        },
+        "llm_calls": {model_id: fake.calls for model_id, fake in fakes.items()},
+        "levels": levels,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    baseline_levels = {(level.get("strategy", "auto"), level["concurrency"]): level for level in baseline.get("levels", [])}
+    for level in report["levels"]:
+        reference = baseline_levels.get((level["strategy"], level["concurrency"]))
+        if reference is None:
+            continue
+        tag = f"{level['strategy']} c={level['concurrency']}"
+        if level["throughput_rps"] < reference["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{tag} throughput_rps: {level['throughput_rps']} vs baseline {reference['throughput_rps']}")
+        checks = [("end_to_end", level["end_to_end"], reference["end_to_end"])]
+        checks += [(stage, values, reference["stages"][stage]) for stage, values in level["stages"].items() if stage in reference["stages"]]
+        for name, current, previous in checks:
+            if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance) + 5:
+                regressions.append(f"{tag} {name} p95_ms: {current['p95_ms']} vs baseline {previous['p95_ms']}")
+        failures = sum(count for code, count in level["status_codes"].items() if code != "200")
+        previous_failures = sum(count for code, count in reference["status_codes"].items() if code != "200")
+        if failures > previous_failures:
+            regressions.append(f"{tag} failed requests: {failures} vs baseline {previous_failures}")
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", nargs="+", default=["digital", "scanned", "docx", "long"], choices=["digital", "scanned", "docx", "long"])
+    parser.add_argument("--strategies", nargs="+", default=["auto", "fanout"], choices=["auto", "single", "broadcast", "fanout"])
+    parser.add_argument("--per-kind", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=24, help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="median fake model latency")
+    parser.add_argument("--sigma", type=float, default=0.35, help="log-normal latency spread")
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limited", action="store_true", help="keep the configured Bedrock RPS limits")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save")
+    parser.add_argument("--compare")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    for key, value in {**BENCHMARK_ENV, **({} if args.rate_limited else UNLIMITED_RPS)}.items():
+        os.environ.setdefault(key, value)
+
+    report = asyncio.run(benchmark(args))
+    print(json.dumps(report, indent=2))
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
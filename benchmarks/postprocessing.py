@@ -0,0 +1,124 @@
+"""
+Post-processing microbenchmarks on synthetic LLM payloads: junk-value sanitizing per model dict,
+date normalization (ISO fast path, cold and warm cache, against a plain `dateutil` parse) and
+`ResumeDetails` validation one model at a time against `validate_many`.
+
+    python -m benchmarks.postprocessing --payloads 500
+"""
+import sys
+import json
+import random
+import timeit
+import argparse
+from datetime import date
+
+JUNKS = {
+    "NONE", "NULL", "NAN", "UNKNOWN", "<UNKNOWN>",
+    "N/A", "NA", "N.A", "NONE.", "UNDEFINED", "?", "--", "NOT PROVIDED", "NOT SPECIFIED", "NOT AVAILABLE",
+    "NOT MENTIONED", "NOT APPLICABLE", "NOT GIVEN", "NO DATA", "NO INFORMATION", "NO DETAILS", "NO ANSWER",
+}
+DATE_FORMATS = ["{y}-{m:02d}", "{y}-{m:02d}-{d:02d}", "{mon} {y}", "{m:02d}/{y}", "", "Present"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def payload(rng: random.Random) -> dict:
+    def when() -> str:
+        month = rng.randint(1, 12)
+        return rng.choice(DATE_FORMATS).format(y=rng.randint(2005, 2024), m=month, d=rng.randint(1, 28), mon=MONTHS[month - 1])
+
+    return {
+        "firstName": rng.choice(["Aarav", "Priya", "N/A"]),
+        "lastName": rng.choice(["Sharma", "Iyer", None]),
+        "phoneNumber": f"+91 9{rng.randint(100000000, 999999999)}",
+        "dob": rng.choice([when(), "Not Provided"]),
+        "city": rng.choice(["Bengaluru", "unknown", ""]),
+        "jobs": [
+            {"companyName": "Acme Systems", "designation": "Engineer", "fromDate": when(), "toDate": when(), "location": rng.choice(["Pune", "NA"])}
+            for _ in range(rng.randint(1, 4))
+        ],
+        "projects": [{"projectTitle": "Search Platform", "fromDate": when(), "toDate": when()} for _ in range(rng.randint(0, 3))],
+        "education": [{"degree": "B.Tech", "yearOfPassing": str(rng.randint(2000, 2020))}],
+        "skills": ["Python", "SQL", ""],
+    }
+
+
+def models_of(payloads: list[dict]) -> list[dict]:
+    """
+    Every dict that `sanitize_values` runs on: the resume and each nested entry.
+    """
+    return payloads + [entry for item in payloads for key in ("jobs", "projects", "education") for entry in item[key]]
+
+
+def dates_of(payloads: list[dict]) -> list[str]:
+    dates = [item["dob"] for item in payloads]
+    for item in payloads:
+        for entry in item["jobs"] + item["projects"]:
+            dates += [entry["fromDate"], entry["toDate"]]
+    return dates
+
+
+def per_call_us(statement, items: int, number: int) -> float:
+    return round(min(timeit.repeat(statement, number=number, repeat=5)) / (number * items) * 1e6, 3)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", type=int, default=500)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    from dateutil import parser as date_parser
+    from app.llm.postprocessing import pp
+
+    rng = random.Random(args.seed)
+    payloads = [payload(rng) for _ in range(args.payloads)]
+    models, dates = models_of(payloads), dates_of(payloads)
+    today = date.today()
+
+    def sanitize_before():
+        for values in models:
+            junks = set(JUNKS)
+            {key: "" if value is None or (isinstance(value, str) and value.strip().upper() in junks) else value for key, value in values.items()}
+
+    def sanitize_after():
+        for values in models:
+            {key: "" if value is None or (isinstance(value, str) and pp.is_junk(value)) else value for key, value in values.items()}
+
+    def dates_before():
+        for value in dates:
+            try:
+                date_parser.parse(value).strftime("%Y-%m-%d")
+            except Exception:
+                pass
+
+    def dates_after():
+        for value in dates:
+            if value.strip():
+                pp.normalize_date(value, today)
+
+    def dates_cold():
+        pp.normalize_date.cache_clear()
+        dates_after()
+
+    report = {"payloads": args.payloads, "us_per_item": {}}
+    report["us_per_item"]["sanitize"] = {
+        "before": per_call_us(sanitize_before, len(models), args.number),
+        "after": per_call_us(sanitize_after, len(models), args.number),
+    }
+    report["us_per_item"]["dates"] = {
+        "before": per_call_us(dates_before, len(dates), 1),
+        "after_cold_cache": per_call_us(dates_cold, len(dates), 1),
+        "after_warm_cache": per_call_us(dates_after, len(dates), args.number),
+    }
+    report["us_per_item"]["validation"] = {
+        "one_by_one": per_call_us(lambda: [pp.ResumeDetails(**item).model_dump() for item in payloads], len(payloads), args.number),
+        "validate_many": per_call_us(lambda: pp.validate_many(payloads), len(payloads), args.number),
+    }
+    report["caches"] = {"is_junk": pp.is_junk.cache_info()._asdict(), "normalize_date": pp.normalize_date.cache_info()._asdict()}
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
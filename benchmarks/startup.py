@@ -0,0 +1,73 @@
+"""
+Measures worker cold start: time to import the FastAPI app, time until warm-up finishes,
+and peak RSS, each in a fresh interpreter.
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --runs 5 --save benchmarks/baselines/startup.json
+    python -m benchmarks.startup --runs 5 --compare benchmarks/baselines/startup.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+PROBE = """
+import sys, json, time, asyncio, resource
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter() - started
+from app.services.warmup import warmup
+asyncio.run(warmup.run())
+ready = time.perf_counter() - started
+from app.services.ocr_pool import ocr_pool
+ocr_pool.shutdown()
+print(json.dumps({
+    "import_seconds": imported,
+    "ready_seconds": ready,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules_loaded": len(sys.modules),
+}))
+"""
+
+
+def measure(runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: round(statistics.median(sample[key] for sample in samples), 3) for key in samples[0]}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--save")
+    parser.add_argument("--compare")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args(argv)
+
+    report = measure(args.runs)
+    print(json.dumps(report, indent=2))
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = [
+            f"{key}: {report[key]} vs baseline {baseline[key]}"
+            for key in ("import_seconds", "ready_seconds", "max_rss_mb")
+            if key in baseline and report[key] > baseline[key] * (1 + args.tolerance)
+        ]
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
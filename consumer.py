@@ -0,0 +1,28 @@
+import signal
+import asyncio
+from app.configs.appconf import env
+from app.jobs.worker import create_worker
+from app.services.ocr_pool import ocr_pool
+from app.llm.clients import bedrock
+from app.utils.logs import log
+
+
+async def main() -> None:
+    if env.QUEUE_BROKER == "memory":
+        raise RuntimeError("QUEUE_BROKER=memory is only consumed inside the API process; set JOB_IN_PROCESS_WORKERS instead")
+    bedrock.start()
+    workers = [create_worker() for _ in range(max(1, env.JOB_CONSUMER_CONCURRENCY))]
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: [worker.stop() for worker in workers])
+
+    log.info(f"Job consumer started with broker={env.QUEUE_BROKER} concurrency={len(workers)}")
+    try:
+        await asyncio.gather(*(worker.run_forever() for worker in workers))
+    finally:
+        ocr_pool.shutdown()
+        bedrock.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
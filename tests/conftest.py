@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+# The app reads its settings at import time; tests never talk to AWS or share state with a real run.
+TEST_ENV = {
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_REGION_NAME": "us-east-1",
+    "MODEL_SONNET": "anthropic.claude-sonnet-test",
+    "MODEL_HAIKU": "anthropic.claude-haiku-test",
+    "MODEL_DEEPSEEK": "deepseek-test",
+    "CACHE_ENABLED": "false",
+    "CACHE_DIR": tempfile.mkdtemp(prefix="resume_parser_test_cache_"),
+    "WARMUP_OCR": "false",
+    "LIMITER_STATE_DIR": tempfile.mkdtemp(prefix="resume_parser_test_limiter_"),
+    "JOB_DIR": tempfile.mkdtemp(prefix="resume_parser_test_jobs_"),
+}
+for key, value in TEST_ENV.items():
+    os.environ.setdefault(key, value)
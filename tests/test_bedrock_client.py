@@ -0,0 +1,57 @@
+import asyncio
+import threading
+from contextvars import ContextVar
+from app.llm.clients import BedrockRegistry
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+class BlockingLLM:
+    """
+    Like ChatBedrock: only a blocking `invoke`.
+    """
+
+    def __init__(self):
+        self.seen = []
+
+    def invoke(self, messages):
+        self.seen.append((threading.current_thread().name, request_id.get()))
+        return messages
+
+
+def test_model_calls_run_on_their_own_pool_with_the_callers_context():
+    registry, llm = BedrockRegistry(), BlockingLLM()
+
+    async def call():
+        request_id.set("req-1")
+        return await registry.ainvoke(llm, ["hello"])
+
+    try:
+        assert asyncio.run(call()) == ["hello"]
+    finally:
+        registry.shutdown()
+    (thread, seen_request_id), = llm.seen
+    assert thread.startswith("bedrock")
+    assert seen_request_id == "req-1"
+
+
+def test_pool_is_sized_for_concurrent_calls(monkeypatch):
+    from app.configs.appconf import env
+
+    monkeypatch.setattr(env, "BEDROCK_POOL_SIZE", 16)
+    registry = BedrockRegistry()
+    barrier = threading.Barrier(16, timeout=5)
+
+    class WaitingLLM:
+        def invoke(self, messages):
+            # Only returns once all 16 calls run at the same time.
+            barrier.wait()
+            return messages
+
+    async def calls():
+        return await asyncio.gather(*(registry.ainvoke(WaitingLLM(), [idx]) for idx in range(16)))
+
+    try:
+        assert asyncio.run(calls()) == [[idx] for idx in range(16)]
+    finally:
+        registry.shutdown()
@@ -0,0 +1,104 @@
+import asyncio
+import sqlite3
+import time
+import pytest
+from app.configs.appconf import env
+from app.jobs.broker import Broker, Delivery, SQLiteBroker
+from app.jobs.worker import JobWorker
+
+
+def test_expired_lease_is_delivered_again(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.sqlite3"), visibility_timeout=0.3, poll_interval=0.01)
+    broker.publish("job-1")
+    delivery = broker.consume(timeout=0)
+    assert broker.consume(timeout=0) is None
+    time.sleep(0.35)
+    assert broker.consume(timeout=0).job_id == delivery.job_id
+
+
+def test_extended_lease_stays_hidden(tmp_path):
+    broker = SQLiteBroker(str(tmp_path / "queue.sqlite3"), visibility_timeout=0.3, poll_interval=0.01)
+    broker.publish("job-1")
+    delivery = broker.consume(timeout=0)
+    time.sleep(0.2)
+    broker.extend(delivery)
+    time.sleep(0.2)
+    assert broker.consume(timeout=0) is None
+    broker.ack(delivery)
+    time.sleep(0.35)
+    assert broker.consume(timeout=0) is None
+
+
+def test_worker_renews_the_lease_while_a_job_runs():
+    class RecordingBroker(Broker):
+        renew_interval = 0.01
+
+        def __init__(self):
+            self.deliveries = [Delivery("job-1", 1)]
+            self.extended = 0
+            self.acked = []
+
+        def consume(self, timeout: float = 1.0) -> Delivery | None:
+            return self.deliveries.pop() if self.deliveries else None
+
+        def extend(self, delivery: Delivery) -> None:
+            self.extended += 1
+
+        def ack(self, delivery: Delivery) -> None:
+            self.acked.append(delivery.job_id)
+            worker.stop()
+
+    class SlowWorker(JobWorker):
+        async def process(self, job_id: str) -> None:
+            await asyncio.sleep(0.1)
+
+    broker = RecordingBroker()
+    worker = SlowWorker(broker, store=None)
+    asyncio.run(worker.run_forever())
+    assert broker.acked == ["job-1"]
+    assert broker.extended >= 3
+
+
+def test_memory_broker_without_in_process_workers_fails_at_startup(monkeypatch):
+    from app.main import app, lifespan
+
+    monkeypatch.setattr(env, "QUEUE_BROKER", "memory")
+    monkeypatch.setattr(env, "JOB_IN_PROCESS_WORKERS", 0)
+
+    async def start():
+        async with lifespan(app):
+            pass
+
+    with pytest.raises(RuntimeError, match="JOB_IN_PROCESS_WORKERS"):
+        asyncio.run(start())
+
+
+def test_worker_survives_store_errors_and_nacks_the_delivery():
+    class RecordingBroker(Broker):
+        def __init__(self):
+            self.deliveries = [Delivery("job-2", 2), Delivery("job-1", 1)]
+            self.acked, self.nacked = [], []
+
+        def consume(self, timeout: float = 1.0) -> Delivery | None:
+            if not self.deliveries:
+                worker.stop()
+                return None
+            return self.deliveries.pop()
+
+        def ack(self, delivery: Delivery) -> None:
+            self.acked.append(delivery.job_id)
+
+        def nack(self, delivery: Delivery) -> None:
+            self.nacked.append(delivery.job_id)
+
+    class FlakyStore:
+        def get(self, job_id: str) -> dict | None:
+            if job_id == "job-1":
+                raise sqlite3.OperationalError("database is locked")
+            return None
+
+    broker = RecordingBroker()
+    worker = JobWorker(broker, store=FlakyStore())
+    asyncio.run(worker.run_forever())
+    assert broker.nacked == ["job-1"]
+    assert broker.acked == ["job-2"]
@@ -0,0 +1,37 @@
+import pytest
+from app.configs.appconf import env
+from app.endpoints.errors import APIException
+from app.endpoints.route_validator import RouteValidator
+from app.jobs.callbacks import check_callback_url
+
+
+@pytest.mark.parametrize("url", [
+    "file:///etc/passwd",
+    "ftp://93.184.216.34/upload",
+    "http://127.0.0.1:8080/admin",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://10.0.0.5/hook",
+    "http://[::1]/hook",
+    "https:///no-host",
+])
+def test_unsafe_callback_urls_are_rejected(url):
+    with pytest.raises(ValueError):
+        check_callback_url(url)
+
+
+def test_public_address_is_accepted():
+    check_callback_url("https://93.184.216.34/hooks/resume")
+
+
+def test_allow_list_overrides_resolution(monkeypatch):
+    monkeypatch.setattr(env, "JOB_CALLBACK_ALLOWED_HOSTS", "hooks.internal, ats.example.com")
+    check_callback_url("http://hooks.internal/resume")
+    with pytest.raises(ValueError):
+        check_callback_url("https://93.184.216.34/hooks/resume")
+
+
+def test_submit_time_validation_returns_422():
+    assert RouteValidator.validate_callback_url(None) is None
+    with pytest.raises(APIException) as error:
+        RouteValidator.validate_callback_url("http://169.254.169.254/")
+    assert error.value.status_code == 422
@@ -0,0 +1,47 @@
+from app.llm.contact_extractor import ContactExtractor
+
+
+def extract(*chunks: str) -> dict[str, str]:
+    return ContactExtractor(dict(enumerate(chunks))).extract()
+
+
+def test_pattern_fields_are_extracted():
+    fields = extract("Jane Doe jane.doe@example.com +91 98765 43210 linkedin.com/in/jane-doe")
+    assert fields["primaryEmail"] == "jane.doe@example.com"
+    assert fields["countryCode"] == "+91"
+    assert fields["phoneNumber"] == "9876543210"
+    assert fields["linkedinUrl"] == "https://linkedin.com/in/jane-doe"
+
+
+def test_year_ranges_and_short_numbers_are_not_phones():
+    assert "phoneNumber" not in extract("Acme Systems 2019 - 2023 Employee ID 123456")
+
+
+def test_labelled_personal_fields():
+    fields = extract("Personal Details Date of Birth: 05/03/1995 Gender: Female Marital Status: Single")
+    assert fields["dob"] == "1995-03-05"
+    assert fields["gender"] == "Female"
+    assert fields["marriageStatus"] == "Single"
+
+
+def test_missing_fields_are_left_out():
+    assert extract("Experience Engineer at Acme") == {}
+
+
+def test_name_is_taken_from_a_first_line_holding_only_the_name():
+    fields = ContactExtractor({0: "Jane Doe jane@example.com"}, first_line="Name: JANE MARIE DOE").extract()
+    assert (fields["firstName"], fields["middleName"], fields["lastName"]) == ("Jane", "Marie", "Doe")
+
+
+def test_name_is_not_guessed_from_a_mixed_first_line():
+    extractor = ContactExtractor({0: "Jane Doe Bangalore jane@x.com"}, first_line="Jane Doe Bangalore jane@x.com")
+    assert "firstName" not in extractor.extract()
+    assert "lastName" not in extractor.extract()
+
+
+def test_merge_prefers_the_model_for_heuristic_fields():
+    resolved = {"firstName": "Jane", "lastName": "Bangalore", "primaryEmail": "jane@x.com", "gender": "Female"}
+    result = {"firstName": "Jane", "lastName": "Doe", "primaryEmail": "jane.doe@x", "gender": "NA"}
+    assert ContactExtractor.merge(resolved, result) == {
+        "firstName": "Jane", "lastName": "Doe", "primaryEmail": "jane@x.com", "gender": "Female",
+    }
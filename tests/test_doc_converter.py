@@ -0,0 +1,70 @@
+import io
+import sys
+import socket
+import threading
+import pytest
+from fastapi import UploadFile
+from app.endpoints.errors import APIException
+from app.endpoints.route_validator import RouteValidator
+from app.services import doc_converter as converter_module
+from app.services.doc_converter import DocConverter, ConverterUnavailable
+
+# Stands in for unoserver: listens on --port until killed, and fails like it does when the port is taken.
+FAKE_SERVER = """
+import sys, time, socket
+port = int(sys.argv[sys.argv.index("--port") + 1])
+sock = socket.socket()
+try:
+    sock.bind(("127.0.0.1", port))
+except OSError:
+    sys.exit(1)
+sock.listen()
+time.sleep(60)
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_concurrent_workers_start_one_server_per_port(tmp_path):
+    script = tmp_path / "fake_unoserver.py"
+    script.write_text(FAKE_SERVER)
+    port = free_port()
+    workers = [DocConverter(1, port, f"{sys.executable} {script}", 10, str(tmp_path / "locks")) for _ in range(4)]
+    errors = []
+
+    def start(worker: DocConverter) -> None:
+        try:
+            worker._ensure_server(port)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=start, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert errors == []
+        assert sum(port in worker._processes for worker in workers) == 1
+    finally:
+        for worker in workers:
+            worker.shutdown()
+
+
+def test_missing_converter_is_reported_not_crashed(tmp_path):
+    converter = DocConverter(1, free_port(), "definitely-not-unoserver", 1, str(tmp_path))
+    assert not converter.available
+    with pytest.raises(ConverterUnavailable):
+        converter.convert(b"\xd0\xcf\x11\xe0")
+
+
+def test_doc_upload_without_converter_is_415(monkeypatch, tmp_path):
+    monkeypatch.setattr(converter_module.doc_converter, "command", ["definitely-not-unoserver"])
+    upload = UploadFile(io.BytesIO(bytes.fromhex("D0CF11E0A1B11AE1") + b"\0" * 512), filename="resume.doc")
+    with pytest.raises(APIException) as error:
+        RouteValidator.validate_parse_resume(upload)
+    assert error.value.status_code == 415
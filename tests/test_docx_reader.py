@@ -0,0 +1,74 @@
+import io
+import zipfile
+import pytest
+from app.services.docx_reader import DocxReader
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+STYLES = f"""<w:styles {NAMESPACES}>
+<w:latentStyles><w:lsdException w:name="heading 1"/></w:latentStyles>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>
+<w:style w:type="paragraph" w:styleId="ListBullet"><w:name w:val="List Bullet"/></w:style>
+</w:styles>"""
+
+
+def package(body: str, styles: str | None = STYLES) -> zipfile.ZipFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", f"<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>")
+        if styles is not None:
+            archive.writestr("word/styles.xml", styles)
+    return DocxReader.open(io.BytesIO(buffer.getvalue()))
+
+
+def paragraph(text: str, style: str = "", bold: bool = False) -> str:
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    bold_xml = "<w:rPr><w:b/></w:rPr>" if bold else ""
+    return f"<w:p>{style_xml}<w:r>{bold_xml}<w:t>{text}</w:t></w:r></w:p>"
+
+
+def cell(text: str, merge: str | None = None) -> str:
+    merge_xml = f'<w:tcPr><w:vMerge w:val="{merge}"/></w:tcPr>' if merge == "restart" else "<w:tcPr><w:vMerge/></w:tcPr>" if merge else ""
+    return f"<w:tc>{merge_xml}{paragraph(text)}</w:tc>"
+
+
+def test_paragraphs_keep_style_names_and_bold():
+    lines = DocxReader.read(package(paragraph("Experience", "Heading1") + paragraph("Jane Doe", bold=True) + paragraph("Python", "ListBullet")))
+    assert [(line.text, line.bold, line.style) for line in lines] == [
+        ("Experience", False, "Heading 1"),
+        ("Jane Doe", True, "Normal"),
+        ("Python", False, "List Bullet"),
+    ]
+
+
+def test_tabs_breaks_and_empty_paragraphs():
+    body = "<w:p><w:r><w:t>Acme</w:t><w:tab/><w:t>2020</w:t><w:br/><w:t>Pune</w:t></w:r></w:p><w:p/>"
+    assert [line.text for line in DocxReader.read(package(body, styles=None))] == ["Acme\t2020\nPune"]
+
+
+def test_table_rows_join_distinct_cells_and_repeat_merged_cells():
+    body = (
+        "<w:tbl>"
+        f"<w:tr>{cell('2020')}{cell('Acme')}{cell('Remote', 'restart')}</w:tr>"
+        f"<w:tr>{cell('2021')}{cell('Acme')}{cell('', 'continue')}</w:tr>"
+        "</w:tbl>"
+    )
+    assert [line.text for line in DocxReader.read(package(body))] == ["2020 | Acme | Remote", "2021 | Acme | Remote"]
+
+
+def test_text_box_fallback_content_is_not_duplicated():
+    box = f"<w:txbxContent>{paragraph('Skills')}</w:txbxContent>"
+    body = f"<w:p><w:r><mc:AlternateContent><mc:Choice>{box}</mc:Choice><mc:Fallback>{box}</mc:Fallback></mc:AlternateContent></w:r></w:p>"
+    assert [line.text for line in DocxReader.read(package(body))] == ["Skills"]
+
+
+def test_non_docx_uploads_are_rejected():
+    with pytest.raises(ValueError):
+        DocxReader.open(io.BytesIO(b"%PDF-1.4"))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("content.xml", "<x/>")
+    with pytest.raises(ValueError):
+        DocxReader.open(buffer)
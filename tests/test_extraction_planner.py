@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from app.configs.appconf import env
+from app.llm.extraction_planner import ExtractionPlanner, SINGLE, BROADCAST, FANOUT
+from app.llm.resume_parser import SectionFailure, SECTION_OK
+from app.llm.tools.resume_parser_tool import CombinedInputSchema
+from tests.test_personal_details import RecordingParser
+
+
+def chunks(tokens: int) -> dict[int, str]:
+    return {0: "x" * (tokens * 4)}
+
+
+@pytest.fixture
+def thresholds(monkeypatch):
+    monkeypatch.setattr(env, "EXTRACTION_STRATEGY", "auto")
+    monkeypatch.setattr(env, "PLANNER_SINGLE_MAX_TOKENS", 1200)
+    monkeypatch.setattr(env, "PLANNER_BROADCAST_MAX_TOKENS", 3000)
+
+
+@pytest.mark.parametrize("tokens, segmented, strategy", [
+    (1200, False, SINGLE),
+    (1200, True, SINGLE),
+    (1201, False, BROADCAST),
+    (3000, False, BROADCAST),
+    (3001, False, FANOUT),
+    (1201, True, FANOUT),
+])
+def test_strategy_follows_the_token_thresholds(thresholds, tokens, segmented, strategy):
+    plan = ExtractionPlanner.plan(chunks(tokens), segmented)
+    assert (plan.strategy, plan.resume_tokens) == (strategy, tokens)
+
+
+@pytest.mark.parametrize("forced", [SINGLE, BROADCAST, FANOUT])
+def test_forced_strategy_ignores_the_size(thresholds, monkeypatch, forced):
+    monkeypatch.setattr(env, "EXTRACTION_STRATEGY", forced)
+    for tokens in (10, 2000, 10000):
+        assert ExtractionPlanner.plan(chunks(tokens), segmented=False).strategy == forced
+
+
+class CombinedFailsParser(RecordingParser):
+    def __init__(self, status: str):
+        super().__init__(["Jane Doe jane.doe@example.com", "Engineer at Acme 2019-2024"], "Jane Doe")
+        self.use_cache = False
+        self.segmented_classification = None
+        self.routed_chunks = None
+        self.status = status
+
+    async def parse_details(self, schema, chunk_indexes, llm):
+        if schema is CombinedInputSchema:
+            self.calls.append("combined")
+            raise SectionFailure(self.status)
+        return await super().parse_details(schema, chunk_indexes, llm)
+
+
+async def outcomes(parser) -> list:
+    return [outcome async for outcome in parser._section_outcomes()]
+
+
+def test_failed_combined_call_falls_back_to_broadcast(thresholds):
+    parser = CombinedFailsParser("failed")
+    results = asyncio.run(outcomes(parser))
+    assert parser.calls[0] == "combined"
+    assert len(parser.calls) == 6
+    assert {section for section, _, status in results if status == SECTION_OK} == {"ProjectDetails", "JobDetails", "PersonalInfo", "EducationDetails", "ProfessionalInfo"}
+    assert parser.routed_chunks == {section: [0, 1] for section in parser.routed_chunks}
+
+
+def test_throttled_combined_call_does_not_fan_out(thresholds):
+    parser = CombinedFailsParser("throttled")
+    results = asyncio.run(outcomes(parser))
+    assert parser.calls == ["combined"]
+    assert {status for _, _, status in results} == {"throttled"}
@@ -0,0 +1,128 @@
+import time
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.configs.appconf import env
+from app.endpoints.errors import APIException
+from app.llm.hedging import HedgedCaller
+from app.llm.resume_parser import ResumeParser, SectionFailure, SECTION_SCHEMAS, SECTION_OK
+
+THROTTLED = "ThrottlingException: Rate exceeded"
+
+
+class Attempts:
+    """
+    Stub attempts: each call takes the next (delay, outcome) and records how it ended.
+    """
+
+    def __init__(self, *plan: tuple[float, object]):
+        self.plan = list(plan)
+        self.started: list[float] = []
+        self.ended: list[str] = []
+
+    async def __call__(self):
+        delay, outcome = self.plan[len(self.started)]
+        self.started.append(time.perf_counter())
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.ended.append("cancelled")
+            raise
+        self.ended.append("done")
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def hedging(monkeypatch):
+    monkeypatch.setattr(env, "HEDGE_ENABLED", True)
+    monkeypatch.setattr(env, "HEDGE_MIN_SAMPLES", 1)
+    monkeypatch.setattr(env, "HEDGE_PERCENTILE", 95.0)
+    monkeypatch.setattr(env, "HEDGE_DEFAULT_DELAY_SECONDS", 30.0)
+    caller = HedgedCaller()
+    caller.latencies.record("sonnet:Job", 0.05)
+    return caller
+
+
+def test_backup_fires_after_the_percentile_delay(hedging):
+    attempts = Attempts((1.0, "slow"), (0.0, "backup"))
+    started = time.perf_counter()
+    assert asyncio.run(hedging.call("sonnet:Job", attempts, timeout=5)) == "backup"
+    assert 0.05 <= attempts.started[1] - started < 0.5
+
+
+def test_first_success_wins_and_the_other_attempt_is_cancelled(hedging):
+    attempts = Attempts((0.3, "primary"), (0.0, "backup"))
+    assert asyncio.run(hedging.call("sonnet:Job", attempts, timeout=5)) == "backup"
+    assert sorted(attempts.ended) == ["cancelled", "done"]
+
+
+def test_throttle_error_short_circuits_without_a_backup(hedging):
+    attempts = Attempts((0.0, RuntimeError(THROTTLED)), (0.0, "backup"))
+    with pytest.raises(RuntimeError, match="ThrottlingException"):
+        asyncio.run(hedging.call("sonnet:Job", attempts, timeout=5))
+    assert len(attempts.started) == 1
+
+
+def test_no_backup_before_enough_samples(monkeypatch, hedging):
+    monkeypatch.setattr(env, "HEDGE_MIN_SAMPLES", 20)
+    attempts = Attempts((0.2, "primary"), (0.0, "backup"))
+    assert asyncio.run(hedging.call("sonnet:Job", attempts, timeout=5)) == "primary"
+    assert len(attempts.started) == 1
+
+
+def parser(invoke) -> ResumeParser:
+    parser = ResumeParser.__new__(ResumeParser)
+    parser.serialized_chunks = {0: "B.Tech Computer Science, 2018"}
+    parser.sonnetllm = SimpleNamespace(model_id="sonnet")
+    parser.haikullm = SimpleNamespace(model_id="haiku")
+    parser._invoke_section = invoke
+    return parser
+
+
+def test_timeout_swaps_to_haiku_when_fallback_is_enabled(monkeypatch):
+    monkeypatch.setattr(env, "HEDGE_ENABLED", False)
+    monkeypatch.setattr(env, "SECTION_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(env, "SECTION_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(env, "SECTION_FALLBACK_TO_HAIKU", True)
+    models = []
+
+    async def invoke(section, schema, prompt, llm, context):
+        models.append(llm.model_id)
+        if llm.model_id == "sonnet":
+            await asyncio.sleep(1)
+        return {"education": []}
+
+    resume_parser = parser(invoke)
+    assert asyncio.run(resume_parser.parse_details(SECTION_SCHEMAS["EducationDetails"], [0], resume_parser.sonnetllm)) == {"education": []}
+    assert models == ["sonnet", "haiku"]
+
+
+def test_throttled_section_is_not_retried(monkeypatch):
+    monkeypatch.setattr(env, "HEDGE_ENABLED", False)
+    monkeypatch.setattr(env, "SECTION_MAX_ATTEMPTS", 3)
+    calls = []
+
+    async def invoke(section, schema, prompt, llm, context):
+        calls.append(llm.model_id)
+        raise RuntimeError(THROTTLED)
+
+    resume_parser = parser(invoke)
+    with pytest.raises(SectionFailure) as failure:
+        asyncio.run(resume_parser.parse_details(SECTION_SCHEMAS["EducationDetails"], [0], resume_parser.sonnetllm))
+    assert failure.value.status == "throttled"
+    assert calls == ["sonnet"]
+
+
+@pytest.mark.parametrize("statuses, status_code", [(["throttled", "failed"], 503), (["timeout", "failed"], 503), (["failed", "failed"], 500)])
+def test_all_sections_failing_is_an_error(statuses, status_code):
+    outcomes = [(section, {}, status) for section, status in zip(["JobDetails", "EducationDetails"], statuses)]
+    with pytest.raises(APIException) as error:
+        parser(None)._combine(outcomes)
+    assert error.value.status_code == status_code
+
+
+def test_partial_failure_reports_section_status():
+    result = parser(None)._combine([("EducationDetails", {"education": []}, SECTION_OK), ("JobDetails", {}, "timeout")])
+    assert result["sectionStatus"] == {"EducationDetails": SECTION_OK, "JobDetails": "timeout"}
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.endpoints import jobs
+from app.jobs.store import job_store
+from app.llm.resume_parser import ResumeParser
+from benchmarks.corpus import build_pdf
+
+TEMPLATE = [f"Responsibilities line {idx} designed built and operated the {idx} platform for enterprise clients" for idx in range(40)]
+CHUNKS = {
+    "jane.pdf": ["Jane Doe jane.doe@example.com", *TEMPLATE],
+    "jane-v2.pdf": ["Jane Doe jane.doe@example.com +91 9876543210", *TEMPLATE],
+    "other.pdf": [f"Unrelated candidate {idx} with a different history in retail banking operations" for idx in range(40)],
+}
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, job_id: str) -> None:
+        self.published.append(job_id)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def create(upload, use_cache=True):
+        return SimpleNamespace(serialized_chunks=dict(enumerate(CHUNKS[upload.filename])))
+
+    broker = RecordingBroker()
+    monkeypatch.setattr(ResumeParser, "create", create)
+    monkeypatch.setattr(jobs, "get_broker", lambda: broker)
+    app = FastAPI()
+    app.include_router(jobs.router)
+    return TestClient(app), broker
+
+
+def submit(client, **form) -> list[dict]:
+    files = [("resumes", (name, build_pdf({"": [name]}))) for name in CHUNKS]
+    return client.post("/jobs", files=files, data=form).json()["jobs"]
+
+
+def test_near_duplicates_wait_for_the_first_of_their_group(client):
+    client, broker = client
+    first, duplicate, other = submit(client, dedupe="true")
+    assert duplicate["waits_for"] == first["job_id"]
+    assert "waits_for" not in other
+    assert broker.published == [first["job_id"], other["job_id"]]
+    assert job_store.release(first["job_id"]) == [duplicate["job_id"]]
+    assert job_store.get(duplicate["job_id"])["waits_for"] is None
+
+
+def test_batches_are_not_grouped_unless_asked(client):
+    client, broker = client
+    submitted = submit(client)
+    assert all("waits_for" not in job for job in submitted)
+    assert broker.published == [job["job_id"] for job in submitted]
@@ -0,0 +1,31 @@
+import pytest
+from app.llm.postprocessing.json_repair import parse_json, CLEAN, REPAIRED, SALVAGED
+
+
+def test_clean_json_is_parsed_as_is():
+    result = parse_json('{"firstName": "Jane"}')
+    assert result.value == {"firstName": "Jane"}
+    assert result.outcome == CLEAN
+
+
+def test_fences_prose_and_trailing_commas_are_repaired():
+    result = parse_json('Here is the JSON:\n```json\n{"skills": ["Python", "SQL",],}\n```')
+    assert result.value == {"skills": ["Python", "SQL"]}
+    assert result.outcome == REPAIRED
+
+
+def test_commas_inside_strings_are_kept():
+    result = parse_json('{"summary": "Python, SQL,]",}')
+    assert result.value == {"summary": "Python, SQL,]"}
+
+
+def test_truncated_output_keeps_only_complete_elements():
+    result = parse_json('{"jobs": [{"companyName": "Acme"}, {"companyName": "Glo')
+    assert result.value == {"jobs": [{"companyName": "Acme"}]}
+    assert result.outcome == SALVAGED
+    assert result.truncated
+
+
+def test_unrecoverable_output_raises():
+    with pytest.raises(ValueError):
+        parse_json("I could not find any details.")
@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from botocore.exceptions import ClientError
+from app.configs.appconf import env
+from app.llm import limiter as limiter_module
+from app.llm.clients import BedrockRegistry
+from app.llm.limiter import BedrockLimiter
+
+
+def throttling_error() -> ClientError:
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "InvokeModel")
+
+
+def test_bedrock_client_does_not_retry_on_its_own():
+    assert BedrockRegistry().client.meta.config.retries == {"total_max_attempts": 1, "mode": "standard"}
+
+
+def test_limiter_sees_every_throttle_and_bounds_attempts(tmp_path, monkeypatch):
+    monkeypatch.setattr(limiter_module.random, "uniform", lambda low, high: 0.0)
+    monkeypatch.setattr(env, "BEDROCK_RPS_DEFAULT", 1000.0)
+    limiter = BedrockLimiter(str(tmp_path))
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        raise throttling_error()
+
+    with pytest.raises(ClientError):
+        asyncio.run(limiter.run("test-model", call))
+    assert len(attempts) == env.LIMITER_MAX_RETRIES + 1
+    assert limiter.stats["test-model"]["throttled"] == len(attempts)
+    assert limiter.bucket("test-model").snapshot()["rate"] < 1000.0
+
+
+def test_non_throttle_errors_are_not_retried(tmp_path):
+    limiter = BedrockLimiter(str(tmp_path))
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(limiter.run("test-model", call))
+    assert len(attempts) == 1
+
+
+def test_sync_classification_goes_through_the_limiter(monkeypatch):
+    from types import SimpleNamespace
+    from app.llm import chunk_classifier
+
+    models = []
+
+    async def run(model_id, call):
+        models.append(model_id)
+        return SimpleNamespace(content='{"PersonalInfo": [0]}', usage_metadata=None)
+
+    monkeypatch.setattr(chunk_classifier.limiter, "run", run)
+    labels = chunk_classifier.ChunkClassifier({0: "Jane Doe"}).classify()
+    assert models == [env.MODEL_SONNET]
+    assert labels["PersonalInfo"] == [0]
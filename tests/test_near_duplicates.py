@@ -0,0 +1,58 @@
+import asyncio
+from app.services.near_duplicates import MinHasher, diff_sections
+
+OLD_CHUNKS = ["Jane Doe jane@example.com", "Experience Engineer at Acme", "Education B.Tech 2018"]
+OLD_CLASSIFICATION = {"PersonalInfo": [0], "JobDetails": [1], "EducationDetails": [2]}
+
+
+def test_unchanged_resume_needs_no_sections():
+    classification, changed = diff_sections(OLD_CHUNKS, OLD_CLASSIFICATION, list(OLD_CHUNKS))
+    assert classification == OLD_CLASSIFICATION
+    assert changed == set()
+
+
+def test_edited_chunk_marks_only_its_section():
+    new_chunks = ["Jane Doe jane.doe@newmail.com", *OLD_CHUNKS[1:]]
+    classification, changed = diff_sections(OLD_CHUNKS, OLD_CLASSIFICATION, new_chunks)
+    assert changed == {"PersonalInfo"}
+    assert classification == OLD_CLASSIFICATION
+
+
+def test_inserted_chunk_joins_neighbouring_sections():
+    new_chunks = [*OLD_CHUNKS[:2], "Engineer at Globex", OLD_CHUNKS[2]]
+    classification, changed = diff_sections(OLD_CHUNKS, OLD_CLASSIFICATION, new_chunks)
+    assert changed == {"JobDetails", "EducationDetails"}
+    assert classification["JobDetails"] == [1, 2]
+    assert classification["EducationDetails"] == [2, 3]
+
+
+def test_minhash_similarity_tracks_overlap():
+    hasher = MinHasher(num_perm=128, shingle_size=3)
+    text = " ".join(f"word{idx}" for idx in range(200))
+    edited = text.replace("word100", "changed")
+    assert MinHasher.similarity(hasher.signature(text), hasher.signature(text)) == 1.0
+    assert MinHasher.similarity(hasher.signature(text), hasher.signature(edited)) > 0.9
+    assert MinHasher.similarity(hasher.signature(text), hasher.signature("something else entirely here")) < 0.2
+
+
+def test_other_candidate_on_same_template_gets_personal_info_extracted(tmp_path, monkeypatch):
+    from app.services import near_duplicates
+    from app.services.near_duplicates import NearDuplicateIndex
+    from tests.test_personal_details import RecordingParser
+
+    index = NearDuplicateIndex(str(tmp_path / "index.sqlite3"), threshold=0.85, num_perm=128, bands=16, shingle_size=3, ttl=3600)
+    monkeypatch.setattr(near_duplicates, "index", index)
+    template = [f"Responsibilities line {idx} designed built and operated the {idx} platform for enterprise clients" for idx in range(40)]
+    stored = ["Jane Doe jane.doe@example.com | +91 9876543210", *template]
+    classification = {"PersonalInfo": [0], "JobDetails": list(range(1, len(stored)))}
+    stored_result = {"firstName": "Jane", "lastName": "Doe", "primaryEmail": "jane.doe@example.com", "phoneNumber": "9876543210", "jobs": []}
+    index.add("jane", RecordingParser._pipeline_version(), stored, classification, stored_result)
+
+    parser = RecordingParser(["John Smith john.smith@example.com | +91 9123456780", *template], "John Smith")
+
+    async def outcomes():
+        return [outcome async for outcome in await parser._near_duplicate_outcomes()]
+
+    results = {section: result for section, result, _ in asyncio.run(outcomes())}
+    assert (results["PersonalInfo"]["firstName"], results["PersonalInfo"]["primaryEmail"]) == ("John", "john.smith@example.com")
+    assert results["JobDetails"] == {"jobs": []}
@@ -0,0 +1,21 @@
+from app.configs.appconf import env
+from app.services import ocr_pool as ocr_pool_module
+from app.services.ocr_pool import OcrPool
+
+
+def test_pool_size_splits_cores_between_all_ocr_processes(monkeypatch):
+    monkeypatch.setattr(ocr_pool_module.os, "cpu_count", lambda: 16)
+    monkeypatch.setattr(env, "OCR_POOL_SIZE", 16)
+    monkeypatch.setattr(env, "WEB_CONCURRENCY", 1)
+    monkeypatch.setattr(env, "OCR_HOST_PROCESSES", 7)
+    assert OcrPool.default_size() == 2
+
+
+def test_pool_size_defaults_to_web_workers_and_never_drops_to_zero(monkeypatch):
+    monkeypatch.setattr(ocr_pool_module.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(env, "OCR_POOL_SIZE", 4)
+    monkeypatch.setattr(env, "OCR_HOST_PROCESSES", 0)
+    monkeypatch.setattr(env, "WEB_CONCURRENCY", 2)
+    assert OcrPool.default_size() == 2
+    monkeypatch.setattr(env, "OCR_HOST_PROCESSES", 9)
+    assert OcrPool.default_size() == 1
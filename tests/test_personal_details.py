@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from app.llm import resume_parser
+from app.llm.resume_parser import ResumeParser, SectionFailure
+
+
+class RecordingParser(ResumeParser):
+    """
+    A parser over fixed chunks whose LLM calls are recorded instead of sent.
+    """
+
+    def __init__(self, chunks: list[str], first_line: str, answer: dict | None = None):
+        self.serialized_chunks = dict(enumerate(chunks))
+        self.first_line = first_line
+        self.haikullm = self.sonnetllm = None
+        self.answer = answer or {}
+        self.calls = []
+
+    async def parse_details(self, schema, chunk_indexes, llm):
+        self.calls.append(set(schema.model_fields))
+        return {field: self.answer.get(field, "NA") for field in schema.model_fields}
+
+
+def test_clean_contact_header_asks_only_for_unresolved_fields():
+    parser = RecordingParser(["Jane Doe jane.doe@example.com | +91 9876543210", "Experience Engineer at Acme"], "Jane Doe", {"city": "Bengaluru", "state": "Karnataka"})
+    result = asyncio.run(parser.parse_personal_details([0]))
+    assert len(parser.calls) == 1
+    assert {"city", "state", "nativeLocation", "gender", "dob", "marriageStatus"} <= parser.calls[0]
+    assert not {"firstName", "lastName", "primaryEmail", "phoneNumber", "latestJobDesignation"} & parser.calls[0]
+    assert (result["firstName"], result["lastName"], result["phoneNumber"]) == ("Jane", "Doe", "9876543210")
+    assert (result["city"], result["state"]) == ("Bengaluru", "Karnataka")
+
+
+def test_fully_resolved_personal_info_makes_no_call(monkeypatch):
+    resolved = {field: "x" for field in resume_parser.PersonalInputSchema.model_fields if field not in resume_parser.PERSONAL_DERIVED_FIELDS}
+    monkeypatch.setattr(resume_parser.ContactExtractor, "extract", lambda self: resolved)
+    parser = RecordingParser(["Jane Doe"], "Jane Doe")
+    assert asyncio.run(parser.parse_personal_details([0])) == resolved
+    assert parser.calls == []
+
+
+def test_unclear_name_is_asked_with_the_other_unresolved_fields():
+    parser = RecordingParser(["Jane Doe Bangalore jane.doe@example.com +91 9876543210"], "Jane Doe Bangalore jane.doe@example.com", {"firstName": "Jane", "lastName": "Doe", "primaryEmail": "wrong@example"})
+    result = asyncio.run(parser.parse_personal_details([0]))
+    assert len(parser.calls) == 1
+    assert "firstName" in parser.calls[0]
+    assert "primaryEmail" not in parser.calls[0]
+    assert (result["firstName"], result["lastName"], result["primaryEmail"]) == ("Jane", "Doe", "jane.doe@example.com")
+
+
+def test_failed_call_keeps_rule_values():
+    class FailingParser(RecordingParser):
+        async def parse_details(self, schema, chunk_indexes, llm):
+            raise SectionFailure("timeout")
+
+    parser = FailingParser(["jane.doe@example.com"], "")
+    with pytest.raises(SectionFailure) as failure:
+        asyncio.run(parser.parse_personal_details([0]))
+    assert failure.value.partial == {"primaryEmail": "jane.doe@example.com"}
+
+
+def test_derived_fields_are_personal_schema_fields():
+    assert resume_parser.PERSONAL_DERIVED_FIELDS <= set(resume_parser.PersonalInputSchema.model_fields)
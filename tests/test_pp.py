@@ -0,0 +1,49 @@
+from datetime import date
+from app.llm.postprocessing.pp import ResumeDetails, normalize_date, validate_many, validate_section
+
+TODAY = date(2024, 1, 31)
+
+
+def test_iso_dates_take_missing_day_from_today():
+    assert normalize_date("2020-05-14", TODAY) == "2020-05-14"
+    assert normalize_date("2021-04", TODAY) == "2021-04-30"
+    assert normalize_date("2020-02", TODAY) == "2020-02-29"
+
+
+def test_fuzzy_dates_fall_back_to_dateutil():
+    assert normalize_date("March 3, 2019", TODAY) == "2019-03-03"
+    assert normalize_date("Jan 2020", TODAY) == "2020-01-31"
+
+
+def test_unparseable_dates_are_empty():
+    assert normalize_date("Present", TODAY) == ""
+    assert normalize_date("2020-13", TODAY) == ""
+
+
+def test_junk_values_are_blanked():
+    details = ResumeDetails(firstName="N/A", city=" unknown ", phoneNumber="+91 98765-43210", dob=None).model_dump()
+    assert details["firstName"] == ""
+    assert details["city"] == ""
+    assert details["phoneNumber"] == "919876543210"
+    assert details["dob"] == ""
+
+
+def test_validate_many_matches_single_validation():
+    payloads = [{"firstName": "Jane", "jobs": [{"companyName": "Acme", "fromDate": "2020-05-01"}, {}]}, {"lastName": "NULL"}]
+    assert validate_many(payloads) == [ResumeDetails(**payload).model_dump() for payload in payloads]
+
+
+def test_validate_section_keeps_only_its_fields():
+    result = validate_section("JobDetails", {"jobs": [{"companyName": "Acme", "location": "NA"}, {}]})
+    assert list(result) == ["jobs"]
+    assert len(result["jobs"]) == 1
+    assert result["jobs"][0]["location"] == ""
+
+
+def test_latest_designation_falls_back_to_the_latest_job():
+    jobs = [
+        {"designation": "Engineer", "fromDate": "2016-01-01", "toDate": "2019-01-01"},
+        {"designation": "Senior Engineer", "fromDate": "2019-02-01", "toDate": "2023-06-01"},
+    ]
+    assert ResumeDetails(jobs=jobs).latestJobDesignation == "Senior Engineer"
+    assert ResumeDetails(jobs=jobs, latestJobDesignation="Lead").latestJobDesignation == "Lead"
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.configs.appconf import env
+from app.main import trace_requests
+from app.utils.metrics import metrics
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(trace_requests)
+
+    @app.get("/sections")
+    async def sections() -> dict:
+        metrics.trace.get().spans.append(("classify", 0.01))
+        return {"ok": True}
+
+    @app.get("/sections/stream")
+    async def sections_stream() -> StreamingResponse:
+        async def events():
+            for idx in range(3):
+                await asyncio.sleep(0.05)
+                metrics.trace.get().spans.append((f"section_{idx}", 0.05))
+                yield f"{idx}\n"
+        return StreamingResponse(events(), media_type="application/x-ndjson")
+
+    return app
+
+
+def _seconds(path: str) -> float:
+    return metrics.request_seconds.series[(path, "200")][1]
+
+
+def test_streaming_latency_covers_the_whole_body(monkeypatch):
+    monkeypatch.setattr(env, "TIMING_HEADER_ENABLED", True)
+    client = TestClient(_app())
+    started = time.perf_counter()
+    response = client.get("/sections/stream")
+    elapsed = time.perf_counter() - started
+    assert response.text == "0\n1\n2\n"
+    assert "server-timing" not in response.headers
+    assert 0.15 <= _seconds("/sections/stream") <= elapsed
+
+
+def test_server_timing_on_regular_routes(monkeypatch):
+    monkeypatch.setattr(env, "TIMING_HEADER_ENABLED", False)
+    client = TestClient(_app())
+    assert "server-timing" not in client.get("/sections").headers
+    assert client.get("/sections", headers={"X-Timing": "1"}).headers["server-timing"] == "classify;dur=10.0"
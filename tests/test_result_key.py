@@ -0,0 +1,44 @@
+import pytest
+from app.configs.appconf import env
+from app.llm import resume_parser
+from app.llm.resume_parser import ResumeParser
+
+
+def result_key(file_hash: str = "abc") -> str:
+    parser = ResumeParser.__new__(ResumeParser)
+    parser.file_hash = file_hash
+    return parser._result_key()
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("CLASSIFIER_MODE", "embedding"),
+    ("EXTRACTION_STRATEGY", "fanout"),
+    ("SEGMENTER_ENABLED", False),
+    ("SEGMENTER_MIN_CONFIDENCE", 0.1),
+    ("PLANNER_SINGLE_MAX_TOKENS", 1),
+    ("TEXT_LAYER_MIN_SCORE", 0.9),
+    ("TEXT_LAYER_MIN_CHARS", 500),
+    ("JSON_MAX_CONTINUATIONS", 0),
+])
+def test_behaviour_settings_change_the_result_key(monkeypatch, setting, value):
+    before = result_key()
+    monkeypatch.setattr(env, setting, value)
+    assert result_key() != before
+
+
+def test_version_bumps_change_the_result_key(monkeypatch):
+    before = result_key()
+    monkeypatch.setattr(resume_parser, "EXTRACTION_VERSION", "next")
+    assert result_key() != before
+
+
+def test_result_key_depends_on_the_file():
+    assert result_key("abc") == result_key("abc")
+    assert result_key("abc") != result_key("def")
+
+
+@pytest.mark.parametrize("setting, value", [("TEXT_LAYER_MIN_SCORE", 0.9), ("TEXT_LAYER_MIN_CHARS", 500)])
+def test_ocr_thresholds_change_the_extraction_key(monkeypatch, setting, value):
+    before = ResumeParser._extraction_version()
+    monkeypatch.setattr(env, setting, value)
+    assert ResumeParser._extraction_version() != before
@@ -0,0 +1,60 @@
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.endpoints import routes
+from app.endpoints.errors import APIException
+from benchmarks.corpus import build_pdf
+
+RESUME = {"resume": ("resume.pdf", build_pdf({"": ["Jane Doe", "jane.doe@example.com"]}))}
+EVENTS = [
+    {"event": "section", "section": "JobDetails", "status": "ok", "data": {"jobs": []}},
+    {"event": "result", "data": {"firstName": "Jane"}},
+]
+
+
+class StubParser:
+    def __init__(self, events: list[dict], error: APIException | None = None):
+        self.events = events
+        self.error = error
+
+    async def stream(self):
+        for event in self.events:
+            yield event
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def install(parser: StubParser) -> TestClient:
+        async def create(upload, use_cache=True):
+            return parser
+
+        monkeypatch.setattr(routes.ResumeParser, "create", create)
+        app = FastAPI()
+        app.include_router(routes.router)
+        return TestClient(app)
+    return install
+
+
+def test_ndjson_is_the_default(client):
+    response = client(StubParser(EVENTS)).post("/parse_resume/stream", files=RESUME)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == EVENTS
+
+
+def test_sse_when_the_client_accepts_event_streams(client):
+    response = client(StubParser(EVENTS)).post("/parse_resume/stream", files=RESUME, headers={"Accept": "text/event-stream"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")[:-1]
+    assert frames[0] == 'event: section\ndata: {"section": "JobDetails", "status": "ok", "data": {"jobs": []}}'
+    assert frames[1] == 'event: result\ndata: {"data": {"firstName": "Jane"}}'
+
+
+def test_failure_mid_stream_ends_with_an_error_event(client):
+    response = client(StubParser(EVENTS[:1], APIException(503))).post("/parse_resume/stream", files=RESUME)
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert events[0] == EVENTS[0]
+    assert events[-1] == {"event": "error", "data": APIException(503).detail}
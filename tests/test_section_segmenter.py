@@ -0,0 +1,45 @@
+from app.services.section_segmenter import LayoutLine, SectionSegmenter
+
+
+def resume_lines() -> list[LayoutLine]:
+    return [
+        LayoutLine("Jane Doe", 16.0, True),
+        LayoutLine("jane.doe@example.com | +91 9876543210", 10.0),
+        LayoutLine("WORK EXPERIENCE", 12.0, True),
+        LayoutLine("Software Engineer - Acme Systems", 10.0),
+        LayoutLine("2019-01 to 2023-06", 10.0),
+        LayoutLine("Education", 12.0, True),
+        LayoutLine("B.Tech in Computer Science, City University, 2018", 10.0),
+        LayoutLine("Hobbies", 12.0, True),
+        LayoutLine("Chess", 10.0),
+    ]
+
+
+def test_headings_route_sections_to_buckets():
+    segmentation = SectionSegmenter.segment(resume_lines())
+    routed = segmentation.routed_sections()
+    assert [section.bucket for section in routed] == ["PersonalInfo", "JobDetails", "EducationDetails"]
+    assert "Acme Systems" in routed[1].text
+    assert segmentation.classification()["JobDetails"] == [1]
+    assert segmentation.confidence >= 0.9
+
+
+def test_unrouted_sections_are_dropped():
+    texts = [section.text for section in SectionSegmenter.segment(resume_lines()).routed_sections()]
+    assert not any("Chess" in text for text in texts)
+
+
+def test_docx_heading_style_counts_as_layout_cue():
+    lines = [
+        LayoutLine("jane.doe@example.com"),
+        LayoutLine("Experience", style="Heading 1"),
+        LayoutLine("Engineer at Acme"),
+        LayoutLine("Projects", style="Heading 1"),
+        LayoutLine("Search Platform"),
+    ]
+    assert SectionSegmenter.segment(lines).confidence >= 0.9
+
+
+def test_fewer_than_two_headings_has_no_confidence():
+    lines = [LayoutLine("Jane Doe"), LayoutLine("Experience"), LayoutLine("Engineer at Acme")]
+    assert SectionSegmenter.segment(lines).confidence == 0.0
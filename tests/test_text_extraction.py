@@ -0,0 +1,40 @@
+from app.services import text_loader
+from app.services.text_loader import ExtractText
+from app.services.text_quality import TextLayerProbe
+from app.services.upload import ResumeUpload
+from benchmarks.corpus import build_pdf
+
+GARBLED_LINES = ["(cid:36)(cid:68)(cid:81)(cid:72) (cid:39)(cid:82)(cid:72)"] * 12
+CLEAN_LINES = ["Jane Doe", "jane.doe@example.com | +91 9876543210", "Software Engineer at Acme Systems, Bengaluru"] * 3
+
+
+def extract(monkeypatch, lines: list[str]) -> tuple[ExtractText, list]:
+    calls = []
+
+    def fake_ocr_pages(reader, pages, force=frozenset()):
+        calls.append((list(pages), set(force)))
+        return {page: "Jane Doe\njane.doe@example.com" for page in pages}
+
+    monkeypatch.setattr(text_loader.ocr_pool, "ocr_pages", fake_ocr_pages)
+    with ResumeUpload.from_bytes("resume.pdf", "pdf", build_pdf({"": lines})) as upload:
+        return ExtractText(upload), calls
+
+
+def test_probe_flags_cid_text_as_garbled():
+    score = TextLayerProbe.score(0, " ".join(GARBLED_LINES), has_images=False)
+    assert score.needs_ocr
+    assert score.garbled
+
+
+def test_garbled_page_is_force_ocred(monkeypatch):
+    extractor, calls = extract(monkeypatch, GARBLED_LINES)
+    assert calls == [([0], {0})]
+    assert extractor.extraction_path == "ocr"
+    assert "(cid:" not in extractor.text_content
+
+
+def test_clean_text_layer_skips_ocr(monkeypatch):
+    extractor, calls = extract(monkeypatch, CLEAN_LINES)
+    assert calls == []
+    assert extractor.extraction_path == "text_layer"
+    assert "Acme Systems" in extractor.text_content
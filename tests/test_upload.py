@@ -0,0 +1,30 @@
+import io
+import os
+import pytest
+from app.configs.appconf import env
+from app.services.upload import ResumeUpload, UploadTooLarge
+
+
+def test_small_upload_stays_in_memory():
+    with ResumeUpload.from_stream("resume.pdf", "pdf", io.BytesIO(b"%PDF-1.4 small"), limit=1024) as upload:
+        assert upload.read_bytes() == b"%PDF-1.4 small"
+        assert upload._path is None
+
+
+def test_large_upload_is_streamed_to_one_temp_file(monkeypatch):
+    monkeypatch.setattr(env, "UPLOAD_SPOOL_BYTES", 1024)
+    content = os.urandom(3 * 1024 * 1024 + 7)
+    upload = ResumeUpload.from_stream("resume.pdf", "pdf", io.BytesIO(content), limit=len(content))
+    path = upload._path
+    assert upload._data is None
+    assert upload.read_bytes() == content
+    upload.close()
+    assert not os.path.exists(path)
+
+
+def test_oversized_upload_is_rejected_and_cleaned_up(monkeypatch, tmp_path):
+    monkeypatch.setattr(env, "UPLOAD_SPOOL_BYTES", 1024)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    with pytest.raises(UploadTooLarge):
+        ResumeUpload.from_stream("resume.pdf", "pdf", io.BytesIO(b"x" * (2 * 1024 * 1024 + 1)), limit=2 * 1024 * 1024)
+    assert list(tmp_path.iterdir()) == []